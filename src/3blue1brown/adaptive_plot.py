@@ -0,0 +1,122 @@
+"""Graphs made of as few cubic Béziers as a distance tolerance allows.
+
+``Axes.plot`` samples every 1/10 tick and smooths through all samples, so a
+straight stretch costs as many curves as a steep exponential, and a kink gets
+rounded off.  ``plot_adaptive`` fits one Hermite cubic per interval (end
+points and end tangents of the function) and halves the interval where the
+cubic strays more than ``tolerance`` scene units from the function at any of
+five evenly spaced interior parameters.  That is a sampled check, not a
+bound: a feature narrower than a sixth of an interval can fall between the
+samples, and ``max_depth`` stops the halving regardless.
+Kinks and discontinuities become interval ends: a kink keeps both one-sided
+tangents, a discontinuity starts a new subpath.
+
+    graph = plot_adaptive(axes, a_of_t, x_range=[0, 6], kinks=[2.0])
+
+Functions carrying a ``kinks`` attribute (the ``cosmology`` tables) are split
+there automatically.
+
+``Create`` and the other partial-drawing animations pace by curve count, and
+the fit packs its curves where the function bends, so each curve keeps the
+parameter span it covers and ``pointwise_become_partial`` maps proportions
+through it: the pen moves uniformly in t, as it does along ``axes.plot``.
+"""
+from __future__ import annotations
+
+import numpy as np
+from manim import ParametricFunction
+
+# about a quarter pixel at 1080p (14.2 units over 1920 px)
+DEFAULT_TOLERANCE = 0.002
+CHECK_AT = np.linspace(0, 1, 7)[1:-1, None]
+
+
+class AdaptiveFunction(ParametricFunction):
+    """``ParametricFunction`` whose points come from adaptive Hermite fitting."""
+
+    def __init__(self, function, t_range, tolerance: float = DEFAULT_TOLERANCE,
+                 kinks=(), max_depth: int = 12, **kwargs):
+        self.tolerance = tolerance
+        self.kinks = tuple(kinks)
+        self.max_depth = max_depth
+        kwargs.pop("use_smoothing", None)
+        super().__init__(function, t_range=t_range[:2], use_smoothing=False, **kwargs)
+
+    def point(self, t: float) -> np.ndarray:
+        return np.asarray(self.function(self.scaling.function(t)), dtype=float)
+
+    def velocity(self, t: float, side: int, h: float) -> np.ndarray:
+        """One-sided derivative (side=+1 forward, -1 backward), 0 for central."""
+        if side == 0:
+            return (self.point(t + h) - self.point(t - h)) / (2 * h)
+        return side * (self.point(t + side * h) - self.point(t)) / h
+
+    def generate_points(self):
+        jumps = {t for t in (self.discontinuities or ()) if self.t_min < t < self.t_max}
+        cuts = sorted(jumps | {t for t in self.kinks if self.t_min < t < self.t_max})
+        breaks = [self.t_min, *cuts, self.t_max]
+        self.h = (self.t_max - self.t_min) * 1e-7
+        self.curve_spans = []
+
+        for t0, t1 in zip(breaks[:-1], breaks[1:]):
+            a = t0 + self.dt if t0 in jumps else t0
+            b = t1 - self.dt if t1 in jumps else t1
+            p0, p1 = self.point(a), self.point(b)
+            if t0 == self.t_min or t0 in jumps:
+                self.start_new_path(p0)
+            self.fit(a, b, p0, p1, self.velocity(a, 1, self.h), self.velocity(b, -1, self.h), 0)
+        self.curve_spans = np.array(self.curve_spans, dtype=float).reshape(-1, 2)
+        return self
+
+    init_points = generate_points
+
+    def fit(self, t0, t1, p0, p1, v0, v1, depth) -> None:
+        span = t1 - t0
+        h1, h2 = p0 + v0 * span / 3, p1 - v1 * span / 3
+        u = CHECK_AT
+        bezier = (1 - u) ** 3 * p0 + 3 * (1 - u) ** 2 * u * h1 + 3 * (1 - u) * u**2 * h2 + u**3 * p1
+        exact = np.array([self.point(t0 + s * span) for s in u[:, 0]])
+        # distance at equal parameter over-estimates each sample's distance to
+        # the curve, but only these samples are checked (see the module docstring)
+        if depth >= self.max_depth or np.max(np.linalg.norm(exact - bezier, axis=1)) <= self.tolerance:
+            self.add_cubic_bezier_curve_to(h1, h2, p1)
+            self.curve_spans.append((t0, t1))
+            return
+        tm = (t0 + t1) / 2
+        pm, vm = self.point(tm), self.velocity(tm, 0, self.h)
+        self.fit(t0, tm, p0, pm, v0, vm, depth + 1)
+        self.fit(tm, t1, pm, p1, vm, v1, depth + 1)
+
+    def proportion_at(self, alpha: float) -> float:
+        """Curve-count proportion where the graph reaches ``alpha`` of its t range."""
+        spans = self.curve_spans
+        t = spans[0, 0] + alpha * (spans[-1, 1] - spans[0, 0])
+        counts = (np.arange(len(spans))[:, None] + (0, 1)).ravel()
+        return float(np.interp(t, spans.ravel(), counts)) / len(spans)
+
+    def pointwise_become_partial(self, vmobject, a: float, b: float):
+        spans = getattr(vmobject, "curve_spans", None)
+        # spans only describe the fitted points, not whatever replaced them
+        if spans is not None and len(spans) and len(spans) == vmobject.get_num_curves():
+            a, b = vmobject.proportion_at(a), vmobject.proportion_at(b)
+        return super().pointwise_become_partial(vmobject, a, b)
+
+
+def plot_adaptive(axes, function, x_range=None, tolerance: float = DEFAULT_TOLERANCE,
+                  kinks=None, discontinuities=None, **kwargs) -> AdaptiveFunction:
+    """Drop-in for ``axes.plot(function, x_range, ...)`` with adaptive sampling."""
+    if x_range is None:
+        x_range = axes.x_range
+    if kinks is None:
+        kinks = getattr(function, "kinks", ())
+    graph = AdaptiveFunction(
+        lambda t: axes.coords_to_point(t, function(t)),
+        t_range=tuple(x_range),
+        tolerance=tolerance,
+        kinks=kinks,
+        discontinuities=discontinuities,
+        scaling=axes.x_axis.scaling,
+        **kwargs,
+    )
+    graph.underlying_function = function
+    return graph
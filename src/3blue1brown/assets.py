@@ -0,0 +1,30 @@
+"""Parameter-independent mobjects, built once per process and copied into scenes.
+
+The builders are cached, so every render in a process (sweep.py variants, the
+render daemon's forked jobs) copies the same prototype instead of rebuilding
+hundreds of dots or re-laying-out text.  Scenes must take ``.copy()``.
+"""
+from __future__ import annotations
+
+from functools import cache
+
+import numpy as np
+from manim import GRAY_E, WHITE, Dot, Text, VGroup
+
+from compact import compact_points
+
+
+@cache
+def starfield(count: int = 300, seed: int = 42, extent: float = 7.0, z: float = -2.0,
+              radius: float = 0.015, color=GRAY_E, opacity: float = 0.6) -> VGroup:
+    """Seeded random background stars in the square ``[-extent, extent]^2``."""
+    rng = np.random.default_rng(seed)
+    stars_xy = rng.uniform(-extent, extent, size=(count, 2))
+    return compact_points(VGroup(*[Dot(point=[x, y, z], radius=radius, color=color, fill_opacity=opacity)
+                                   for x, y in stars_xy]))
+
+
+@cache
+def caption(text: str, font_size: float = 28, color=WHITE) -> Text:
+    """A fixed label; ``always_redraw`` callbacks copy it instead of re-shaping the text."""
+    return Text(text, font_size=font_size, color=color)
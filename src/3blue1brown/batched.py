@@ -0,0 +1,212 @@
+"""Animate many similar submobjects with one NumPy operation per frame.
+
+Manim interpolates an animation submobject by submobject: for a ``FadeIn`` of
+169 lattice dots that is 169 ``Mobject.interpolate`` calls per frame, each
+doing a dozen small array operations.  Here the family is flattened once when
+the animation starts: every member's points and colour arrays become views
+into one buffer, the start and end states into two more, and each frame is a
+single ``start + (end - start) * a`` with the per-member ``a`` (lag and rate
+function included) expanded by index.
+
+    self.play(BatchedFadeIn(dots), LaggedCreate(*ticks, lag_ratio=0.02))
+
+Only members with points are batched; anything the fast path cannot express
+(curved ``path_arc``, mismatched array shapes, updating not suspended,
+``compact.py`` flat storage) falls back to manim's own per-submobject code.
+"""
+from __future__ import annotations
+
+import numpy as np
+from manim import Animation, FadeIn, FadeOut, Transform, VGroup, VMobject
+
+from layout_cache import mark_dirty
+
+ARRAY_ATTRS = ("points", "fill_rgbas", "stroke_rgbas", "background_stroke_rgbas", "sheen_direction")
+SCALAR_ATTRS = ("stroke_width", "background_stroke_width", "sheen_factor")
+
+
+def sub_alphas(animation: Animation, alpha: float, count: int, clip: bool = False) -> np.ndarray:
+    """``animation.get_sub_alpha(alpha, i, count)`` for every ``i`` at once.
+
+    With ``clip`` each member's own progress stays in [0, 1] before the rate
+    function, as ``AnimationGroup`` keeps it for the animations it lags.
+    """
+    if animation.lag_ratio == 0 or count == 1:
+        return np.full(count, animation.get_sub_alpha(alpha, 0, count))
+    lag = animation.lag_ratio
+    local = alpha * ((count - 1) * lag + 1) - np.arange(count) * lag
+    if clip:
+        local = np.clip(local, 0, 1)
+    if animation.reverse_rate_function:
+        local = 1 - local
+    rate = animation.rate_func
+    return np.array([rate(value) for value in local.tolist()])
+
+
+class FlatBatch:
+    """Start/end state of several members in flat buffers; members hold views."""
+
+    def __init__(self, triples, dtype=np.float64):
+        starts, ends, owners, self.views = [], [], [], []
+        self.members = [mob for mob, _, _ in triples]
+        self.scalars = []  # (mob, attr, start, end) that actually change
+        for row, (mob, start, end) in enumerate(triples):
+            for attr in ARRAY_ATTRS:
+                s, e = getattr(start, attr), getattr(end, attr)
+                starts.append(np.ravel(s))
+                ends.append(np.ravel(e))
+                owners.append(np.full(np.size(s), row))
+                self.views.append((mob, attr, np.shape(s)))
+            for attr in SCALAR_ATTRS:
+                s, e = getattr(start, attr), getattr(end, attr)
+                if s != e:
+                    self.scalars.append((row, mob, attr, s, e))
+        # float32 buffers for compact.py members, so their points stay views
+        self.start = np.concatenate(starts, dtype=dtype)
+        self.end = np.concatenate(ends, dtype=dtype)
+        self.delta = self.end - self.start
+        self.owner = np.concatenate(owners)
+        self.out = self.start.copy()
+
+        offset = 0
+        for mob, attr, shape in self.views:
+            size = int(np.prod(shape))
+            setattr(mob, attr, self.out[offset:offset + size].reshape(shape))
+            offset += size
+
+    def interpolate(self, alphas: np.ndarray) -> None:
+        a = alphas.astype(self.out.dtype)[self.owner]
+        np.multiply(self.delta, a, out=self.out)
+        self.out += self.start
+        for row, mob, attr, s, e in self.scalars:
+            setattr(mob, attr, s + (e - s) * alphas[row])
+        mark_dirty(*self.members)  # the buffer was written in place
+
+    def release(self) -> None:
+        """Give every member its own arrays again."""
+        for mob, attr, _ in self.views:
+            setattr(mob, attr, getattr(mob, attr).copy())
+
+
+# ---------- Transform family ----------
+class BatchedTransformMixin:
+    """Straight-path ``Transform`` subclasses interpolate their family in one go."""
+
+    batch = None
+
+    def interpolate_mobject(self, alpha: float) -> None:
+        if self.batch is None:
+            # the family structure is fixed once the animation has begun
+            self.families = list(self.get_all_families_zipped())
+            self.batch = self.build_batch(self.families)
+        if not self.batch:
+            return super().interpolate_mobject(alpha)
+
+        alphas = sub_alphas(self, alpha, len(self.families))
+        for i in self.loose:
+            self.interpolate_submobject(*self.families[i], alphas[i])
+        self.batch.interpolate(alphas[self.batched])
+
+    def build_batch(self, families):
+        if self.path_arc != 0 or not self.suspend_mobject_updating:
+            return False
+        batched, self.loose = [], []
+        dtype = None
+        for i, (mob, start, end) in enumerate(families):
+            ok = (
+                isinstance(mob, VMobject)
+                and len(mob.points)
+                and not getattr(mob, "flat_points", False)
+                and dtype in (None, mob.points.dtype)
+                and all(np.shape(getattr(start, a)) == np.shape(getattr(end, a)) for a in ARRAY_ATTRS)
+            )
+            (batched if ok else self.loose).append(i)
+            if ok and dtype is None:
+                dtype = mob.points.dtype
+        if len(batched) < 2:
+            return False
+        self.batched = np.array(batched)
+        return FlatBatch([families[i] for i in batched], dtype)
+
+    def finish(self) -> None:
+        super().finish()
+        if self.batch:
+            self.batch.release()
+        self.batch = None
+
+
+class BatchedTransform(BatchedTransformMixin, Transform):
+    pass
+
+
+class BatchedFadeIn(BatchedTransformMixin, FadeIn):
+    pass
+
+
+class BatchedFadeOut(BatchedTransformMixin, FadeOut):
+    pass
+
+
+# ---------- Create ----------
+class LaggedCreate(Animation):
+    """``LaggedStart(*[Create(m) for m in mobjects], lag_ratio=...)`` as one array op.
+
+    Members with the same number of curves are drawn with a vectorized
+    partial-Bézier split; the unfinished tail collapses onto the pen position
+    instead of being dropped, so every member keeps a fixed-size view.
+    ``run_time`` is that of the whole group.
+    """
+
+    def __init__(self, *mobjects, lag_ratio: float = 0.05, introducer: bool = True, **kwargs):
+        super().__init__(VGroup(*mobjects), lag_ratio=lag_ratio, introducer=introducer, **kwargs)
+        self.batch = None
+
+    def begin(self) -> None:
+        self.batch = None
+        super().begin()
+
+    def build_batch(self):
+        self.members = self.mobject.family_members_with_points()
+        self.starts = self.starting_mobject.family_members_with_points()
+        sizes = {len(m.points) for m in self.starts}
+        dtypes = {m.points.dtype for m in self.members}
+        if len(sizes) != 1 or sizes.pop() % 4 or len(dtypes) != 1:
+            return False
+        if any(getattr(m, "flat_points", False) for m in self.members):
+            return False
+        self.source = np.stack([m.points for m in self.starts]).reshape(len(self.starts), -1, 4, 3)
+        self.out = self.source.copy()
+        for i, mob in enumerate(self.members):
+            mob.points = self.out[i].reshape(-1, 3)
+        return True
+
+    def interpolate_mobject(self, alpha: float) -> None:
+        if self.batch is None:
+            self.batch = self.build_batch()
+        alphas = sub_alphas(self, alpha, len(self.members), clip=True)
+        if not self.batch:
+            for mob, start, b in zip(self.members, self.starts, alphas):
+                mob.pointwise_become_partial(start, 0, b)
+            return
+
+        n, curves = self.source.shape[:2]
+        pos = alphas * curves
+        index = np.clip(pos.astype(int), 0, curves - 1)
+        r = (pos - index)[:, None]
+        p0, p1, p2, p3 = np.moveaxis(self.source[np.arange(n), index], 1, 0)
+        # de Casteljau: the [0, r] piece of the curve the pen is on
+        q1 = p0 + r * (p1 - p0)
+        q2 = (1 - r) ** 2 * p0 + 2 * r * (1 - r) * p1 + r**2 * p2
+        q3 = (1 - r) ** 3 * p0 + 3 * (1 - r) ** 2 * r * p1 + 3 * (1 - r) * r**2 * p2 + r**3 * p3
+        after = np.arange(curves)[None, :] > index[:, None]
+        np.copyto(self.out, self.source)
+        np.copyto(self.out, q3[:, None, None, :], where=after[:, :, None, None])
+        self.out[np.arange(n), index] = np.stack([p0, q1, q2, q3], axis=1)
+        mark_dirty(*self.members)
+
+    def finish(self) -> None:
+        super().finish()
+        if self.batch:
+            for mob in self.members:
+                mob.points = mob.points.copy()
+        self.batch = None
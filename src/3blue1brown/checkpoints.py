@@ -0,0 +1,163 @@
+"""Resumable renders and random-access frames.
+
+A checkpoint is written at every ``self.play`` boundary: play index, start and
+end time and the partial movie file holding its frames.  Mobjects themselves
+are not pickled -- updaters close over ``construct()``'s locals and the body
+of ``construct()`` cannot be entered halfway -- so a checkpoint is restored by
+replaying ``construct()`` with the earlier plays skipped.  A skipped play
+jumps straight to its end state (manim's ``-n`` mechanism), which costs a
+fraction of a second against minutes of rasterizing and encoding at 2160p.
+
+    python render.py inflation_timeline.py TimelineZoomInflation -q k --resume
+    python render.py math.py HeavyMathShowcase --frame 12.3
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+from pathlib import Path
+
+import av
+from manim import CairoRenderer, config, logger
+from manim.utils.exceptions import EndSceneEarlyException
+from manim.utils.file_ops import write_to_movie
+
+
+def is_readable_movie(path) -> bool:
+    """True if a partial movie was closed properly (an mp4 cut short has no index)."""
+    try:
+        with av.open(str(path)) as container:
+            return bool(container.streams.video)
+    except (OSError, av.FFmpegError):
+        return False
+
+
+class CheckpointStore:
+    """JSON list of finished plays, stored next to the partial movie files.
+
+    The store is tied to the scene file contents and the output format; any
+    change starts a fresh list.
+    """
+
+    def __init__(self, path: Path, key: str):
+        self.path = Path(path)
+        self.key = key
+        self.plays: list[dict] = []
+        if self.path.exists():
+            saved = json.loads(self.path.read_text())
+            if saved.get("key") == key:
+                self.plays = saved["plays"]
+
+    @staticmethod
+    def key_for(scene_name: str) -> str:
+        source = Path(config["input_file"]).read_bytes() if config["input_file"] else b""
+        fmt = f"{scene_name}|{config.pixel_width}x{config.pixel_height}@{config.frame_rate}"
+        return hashlib.blake2b(source + fmt.encode(), digest_size=16).hexdigest()
+
+    def completed(self) -> list[dict]:
+        """The leading plays whose movie files survived intact."""
+        done = []
+        for index, play in enumerate(self.plays):
+            if play["play"] != index or not (play["file"] is None or is_readable_movie(play["file"])):
+                break
+            done.append(play)
+        return done
+
+    def record(self, play: int, start: float, end: float, file: str | None) -> None:
+        del self.plays[play:]
+        self.plays.append({"play": play, "start": start, "end": end, "file": file})
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(json.dumps({"key": self.key, "plays": self.plays}, indent=1))
+        tmp.replace(self.path)
+
+
+# ---------- Resumable renders ----------
+class ResumableRenderer(CairoRenderer):
+    """Checkpoint every play and skip the ones a previous run already wrote.
+
+    Needs ``disable_caching``: uncached partial files are named by play index,
+    so the files of a crashed run can be spliced back into the final movie.
+    (With caching on, manim's own hash cache already reuses finished plays.)
+    """
+
+    def init_scene(self, scene):
+        super().init_scene(scene)
+        if not (config.disable_caching and write_to_movie()):
+            raise ValueError("resumable renders write a movie with disable_caching")
+        # splicing needs one partial file per play, not a single direct stream
+        if getattr(self.file_writer, "stream_direct", False):
+            self.file_writer.stream_direct = False
+        name = scene.__class__.__name__
+        self.store = CheckpointStore(
+            Path(self.file_writer.partial_movie_directory) / "checkpoints.json",
+            CheckpointStore.key_for(name),
+        )
+        self.resumed = self.store.completed()
+        if self.resumed:
+            logger.info(
+                "Resuming %(name)s after play %(n)s", {"name": name, "n": len(self.resumed) - 1}
+            )
+
+    def update_skipping_status(self):
+        super().update_skipping_status()
+        if self.num_plays < len(self.resumed):
+            self.skip_animations = True
+
+    def play(self, scene, *args, **kwargs):
+        index, start = self.num_plays, self.time
+        super().play(scene, *args, **kwargs)
+        writer = self.file_writer
+        if index < len(self.resumed):
+            writer.partial_movie_files[index] = self.resumed[index]["file"]
+            writer.sections[-1].partial_movie_files[-1] = self.resumed[index]["file"]
+        else:
+            self.store.record(index, start, self.time, writer.partial_movie_files[index])
+
+
+# ---------- Random access ----------
+class FrameRenderer(CairoRenderer):
+    """Skip every play, grabbing the frames shown at ``frame_times`` on the way.
+
+    The scene stops once the last requested frame is taken, so together with
+    ``save_last_frame`` manim writes that frame just like the ``-s`` PNG.
+    Times past the end get the final frame.
+    """
+
+    frame_times: tuple[float, ...] = ()
+
+    @classmethod
+    def at(cls, *times: float) -> type[FrameRenderer]:
+        return type(cls.__name__, (cls,), {"frame_times": tuple(sorted(times))})
+
+    def init_scene(self, scene):
+        super().init_scene(scene)
+        self.frames: dict = {}
+
+    def update_skipping_status(self):
+        super().update_skipping_status()
+        self.skip_animations = True
+
+    def grab(self, scene, key) -> None:
+        self.static_image = None
+        self.update_frame(scene)
+        self.frames[key] = self.get_frame()
+
+    def grab_frames(self, scene, start: float) -> None:
+        """Advance the current play to each wanted time and keep the frame."""
+        for t in self.frame_times:
+            if start <= t < self.time:
+                scene.update_to_time(t - start)
+                self.grab(scene, t)
+        if self.frame_times and len(self.frames) == len(self.frame_times):
+            raise EndSceneEarlyException()
+
+    def save_static_frame_data(self, scene, static_mobjects):
+        # Called after begin_animations; in skip mode self.time is already the end.
+        self.grab_frames(scene, self.time - scene.duration)
+        return super().save_static_frame_data(scene, static_mobjects)
+
+    def scene_finished(self, scene):
+        super().scene_finished(scene)
+        for t in self.frame_times:
+            if t not in self.frames:
+                self.grab(scene, t)
@@ -0,0 +1,109 @@
+"""float32 point storage for VMobject-heavy, flat scenes.
+
+Manim keeps every point as three float64s, though these scenes are 2D and
+end on an 8-bit raster.  A ``points`` property casts whatever manim assigns
+(``Transform`` results, ``become``, ``apply_matrix`` ...) to float32, halving
+memory and the bandwidth of every vectorized transform.  With ``flat=True``
+points whose z is all zero are stored as (x, y) only; reads expand them to
+the usual (n, 3) array, which costs a copy per read, so flat mode suits large
+mobjects that mostly sit still (starfields, dense planes).
+
+    compact_points(plane)              # one mobject family
+    use_compact_points(flat=True)      # every VMobject (render.py --float32 --flat)
+
+Value trackers are plain ``Mobject``s and keep float64 values.  Compact
+outlines are private copies, so ``flyweight.share_points`` does not apply.
+"""
+from __future__ import annotations
+
+from functools import cache
+
+import numpy as np
+from manim import VMobject
+
+from layout_cache import mark_dirty
+
+
+class FlatPoints(np.ndarray):
+    """(n, 3) expansion of stored (x, y) points; item writes go back to the owner."""
+
+    owner = None
+
+    @classmethod
+    def expand(cls, xy: np.ndarray, owner: VMobject) -> FlatPoints:
+        points = np.zeros((len(xy), 3), dtype=xy.dtype).view(cls)
+        points[:, :2] = xy
+        points.owner = owner
+        return points
+
+    def __array_finalize__(self, obj):
+        self.owner = None  # slices and results are not the stored points
+
+    def __array_wrap__(self, obj, context=None, return_scalar=False):
+        if return_scalar:
+            return obj[()]
+        return obj.view(np.ndarray)
+
+    def __setitem__(self, index, value):
+        super().__setitem__(index, value)
+        if self.owner is not None:
+            # ``mob.points[:n] = ...`` (pointwise_become_partial, Wiggle)
+            self.owner.points = self
+
+
+def _get_points(self):
+    try:
+        stored = self.__dict__["points"]
+    except KeyError:
+        raise AttributeError("points") from None
+    if stored.ndim == 2 and stored.shape[1] == 2:
+        return FlatPoints.expand(stored, self)
+    return stored
+
+
+def _set_points(self, value):
+    if getattr(value, "dtype", None) == np.float32:
+        points = np.asarray(value)
+    else:
+        with np.errstate(over="ignore"):  # np.empty buffers about to be filled
+            points = np.asarray(value, dtype=np.float32)
+    if self.flat_points and points.ndim == 2 and points.shape[1] == 3 and not points[:, 2].any():
+        points = np.ascontiguousarray(points[:, :2])
+    mark_dirty(self)  # this property shadows layout_cache's
+    self.__dict__["points"] = points
+
+
+POINTS = property(_get_points, _set_points, doc="float32 points, see compact.py")
+
+
+@cache
+def compact_class(cls: type, flat: bool) -> type:
+    """Subclass of ``cls`` with float32 (optionally flat) point storage."""
+    prefix = "Flat" if flat else "Compact"
+    return type(f"{prefix}{cls.__name__}", (cls,), {"points": POINTS, "flat_points": flat})
+
+
+def compact_points(mobject, flat: bool = False):
+    """Switch every VMobject in the family to float32 storage; copies stay compact."""
+    for mob in mobject.get_family():
+        if isinstance(mob, VMobject) and type(mob).__dict__.get("points") is not POINTS:
+            points = mob.points
+            mob.__class__ = compact_class(type(mob), flat)
+            mob.points = points
+    return mobject
+
+
+def point_storage() -> str:
+    """"float64", "float32" or "flat": how new VMobjects store their points."""
+    if VMobject.__dict__.get("points") is not POINTS:
+        return "float64"
+    return "flat" if VMobject.flat_points else "float32"
+
+
+def use_compact_points(flat: bool = False) -> None:
+    """Store the points of every VMobject as float32 from now on.
+
+    Mobjects built before the call convert on their next point assignment.
+    """
+    VMobject.points = POINTS
+    VMobject.flat_points = flat
@@ -1,13 +1,18 @@
 from manim import *
 import math
 
+from adaptive_plot import plot_adaptive
+from cosmology import InflationThenLinear
+from mobject_cache import cached
+
 # ---------- Scene 1: Expanderend "ruimte"-grid ----------
 class ExpandingGrid(Scene):
     def construct(self):
         self.camera.background_color = "#0c1020"  # deep space
 
         # Grid als referentie voor "ruimte"
-        grid = NumberPlane(
+        grid = cached(
+            NumberPlane,
             x_range=[-6, 6, 1],
             y_range=[-3.5, 3.5, 1],
             background_line_style={"stroke_opacity": 0.25, "stroke_width": 1},
@@ -78,13 +83,11 @@ class ScaleFactorPlot(Scene):
         self.play(Create(axes), FadeIn(labels), run_time=0.8)
 
         # Fictieve a(t): eerst super‑exponentieel (inflation), dan trager
-        def a_of_t(t: float) -> float:
-            if t < 2.0:
-                return 0.2 * math.exp(1.5 * t)   # snelle expansie
-            else:
-                return 0.2 * math.exp(1.5 * 2.0) + 0.8 * (t - 2.0)  # lineair trager
+        # (snelle expansie 0.2·e^(1.5t) tot t = 2, daarna lineair met helling 0.8)
+        a_of_t = InflationThenLinear(a0=0.2, rate=1.5, t_end=2.0, slope=0.8).table(0.0, 6.0)
 
-        graph = axes.plot(a_of_t, x_range=[0, 6], color="#22d3ee", stroke_width=6)
+        # knik bij t = 2 komt uit a_of_t.kinks
+        graph = plot_adaptive(axes, a_of_t, x_range=[0, 6], color="#22d3ee", stroke_width=6)
         glow = graph.copy().set_stroke(width=16, opacity=0.25)
 
         title = Text("Scale factor a(t)", weight=BOLD, color="#ffffff").to_edge(UP)
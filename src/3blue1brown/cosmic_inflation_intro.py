@@ -1,27 +1,43 @@
+# python render.py cosmic_inflation_intro.py InflationGridIntro -q h --layout_cache --stable_hash --text_cache
 from __future__ import annotations
 import numpy as np
 from manim import *
 
+from assets import caption, starfield
+from batched import BatchedFadeIn
+from cosmology import InflationThenPower
+
+A_LABEL = "a(τ) = exp(H·τ) (inflation) or a(T_inf)·[1+k(τ-T_inf)]^p (radiation)"
+PATCH_LABEL = "Hubble patch (comoving radius fixed)"
+
+
 class InflationGridIntro(MovingCameraScene):
+    # ---------- Parameters ----------
+    # Class attributes so variants are subclasses (see sweep.py).
+    N = 6              # half grid size in cells (comoving)
+    cell = 0.5         # comoving cell size
+    H = 0.9            # inflation "Hubble" rate (per sec of animation time)
+    T_INF = 5.0        # seconds of exponential inflation
+    k = 0.5            # post-inflation linear factor
+    p = 0.6            # post-inflation power
+    T_TOTAL = 10.0     # total animation seconds
+
+    @classmethod
+    def shared_assets(cls):
+        """Build the parameter-independent mobjects (sweep.py calls this before forking)."""
+        starfield()
+        caption(PATCH_LABEL, 28, PURPLE_B)
+        caption(A_LABEL, 20, WHITE)
+
     def construct(self):
-        # ---------- Parameters ----------
-        N = 6              # half grid size in cells (comoving)
-        cell = 0.5         # comoving cell size
-        H = 0.9            # inflation "Hubble" rate (per sec of animation time)
-        T_INF = 5.0        # seconds of exponential inflation
-        k = 0.5            # post-inflation linear factor
-        p = 0.6            # post-inflation power
-        T_TOTAL = 10.0     # total animation seconds
+        N, cell, H, T_INF = self.N, self.cell, self.H, self.T_INF
+        k, p, T_TOTAL = self.k, self.p, self.T_TOTAL
 
         # ---------- Time / scale factor ----------
         tau = ValueTracker(0.0)
 
-        def a(t: float) -> float:
-            """Piecewise scale factor a(τ)."""
-            if t <= T_INF:
-                return np.exp(H * t)
-            a_inf = np.exp(H * T_INF)
-            return a_inf * (1 + k * (t - T_INF)) ** p
+        # Piecewise scale factor a(τ), tabulated over the animated range.
+        a = InflationThenPower(H, T_INF, k, p).table(0.0, T_TOTAL)
 
         # convenient: an updater-visible a(τ)
         def a_now() -> float:
@@ -29,10 +45,7 @@ class InflationGridIntro(MovingCameraScene):
 
         # ---------- Background stars (parallax-lite) ----------
         # Stars that do NOT scale with a(τ), to sell the "we zoom through" vibe.
-        rng = np.random.default_rng(42)
-        stars_xy = rng.uniform(-7, 7, size=(300, 2))
-        stars = VGroup(*[Dot(point=[x, y, -2], radius=0.015, color=GRAY_E, fill_opacity=0.6)
-                         for x, y in stars_xy])
+        stars = starfield().copy()
         stars.set_z_index(-5)
 
         # ---------- Comoving grid lines & points (scale with a) ----------
@@ -92,17 +105,16 @@ class InflationGridIntro(MovingCameraScene):
 
         # Labels for patches
         def make_patch_label(y_shift, txt):
-            return always_redraw(lambda: Text(
-                txt, font_size=28, color=PURPLE_B
-            ).next_to(ORIGIN, UP, buff=0.2).shift(y_shift).set_z_index(2))
-        patch_lbl = make_patch_label(UP*0.7, "Hubble patch (comoving radius fixed)")
+            return always_redraw(lambda: caption(
+                txt, 28, PURPLE_B
+            ).copy().next_to(ORIGIN, UP, buff=0.2).shift(y_shift).set_z_index(2))
+        patch_lbl = make_patch_label(UP*0.7, PATCH_LABEL)
 
         # ---------- Scale factor indicator & timeline ----------
         # Temporarily replaced MathTex with Text due to LaTeX dependency issue
-        a_label = always_redraw(lambda: Text(
-            "a(τ) = exp(H·τ) (inflation) or a(T_inf)·[1+k(τ-T_inf)]^p (radiation)",
-            font_size=20, color=WHITE
-        ).scale(0.5).to_corner(UL).set_z_index(3))
+        a_label = always_redraw(lambda: caption(
+            A_LABEL, 20, WHITE
+        ).copy().scale(0.5).to_corner(UL).set_z_index(3))
 
         a_value = always_redraw(lambda: Text(
             f"{a_now():.2f}", font_size=32, color=YELLOW_B
@@ -125,7 +137,7 @@ class InflationGridIntro(MovingCameraScene):
 
         # ---------- Build scene ----------
         self.add(stars)
-        self.play(FadeIn(vlines), FadeIn(hlines), FadeIn(dots), FadeIn(patch1), FadeIn(patch2), FadeIn(patch_lbl))
+        self.play(BatchedFadeIn(vlines), BatchedFadeIn(hlines), BatchedFadeIn(dots), FadeIn(patch1), FadeIn(patch2), FadeIn(patch_lbl))
         self.play(FadeIn(a_label), FadeIn(a_value), FadeIn(bar_bg), FadeIn(bar_fg))
 
         # Phase 1: inflation (exponential growth)
@@ -0,0 +1,126 @@
+"""Scale-factor models a(t) shared by the cosmology scenes.
+
+Models evaluate whole NumPy arrays at once.  ``model.table(t0, t1)`` samples
+one densely (in log a, so exponential phases are reproduced exactly) over the
+animation's time range; per-frame updaters and ``axes.plot`` then read it with
+a direct index + lerp instead of re-running the piecewise formula.  Queries
+outside the table fall back to the exact model.
+"""
+from __future__ import annotations
+
+import math
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+
+import numpy as np
+
+
+class ScaleFactor(ABC):
+    """Base class: subclasses implement ``evaluate`` on float arrays.
+
+    ``kinks`` lists the times where the slope of log a jumps; tables answer
+    queries next to them from the model instead of smoothing the corner.
+    """
+
+    @property
+    def kinks(self) -> tuple[float, ...]:
+        return ()
+
+    @abstractmethod
+    def evaluate(self, t: np.ndarray) -> np.ndarray:
+        ...
+
+    def __call__(self, t):
+        values = self.evaluate(np.asarray(t, dtype=float))
+        return float(values) if np.ndim(values) == 0 else values
+
+    def table(self, t_min: float, t_max: float, samples: int = 4096) -> ScaleFactorTable:
+        return ScaleFactorTable(self, t_min, t_max, samples)
+
+
+@dataclass(frozen=True)
+class InflationThenPower(ScaleFactor):
+    """exp(H t) until ``t_inf``, then a(t_inf) * (1 + k (t - t_inf))^p."""
+
+    H: float
+    t_inf: float
+    k: float
+    p: float
+
+    @property
+    def kinks(self):
+        return (self.t_inf,)
+
+    def evaluate(self, t):
+        a_inf = np.exp(self.H * self.t_inf)
+        late = a_inf * (1 + self.k * np.maximum(t - self.t_inf, 0.0)) ** self.p
+        return np.where(t <= self.t_inf, np.exp(self.H * np.minimum(t, self.t_inf)), late)
+
+
+@dataclass(frozen=True)
+class InflationThenLinear(ScaleFactor):
+    """a0 exp(rate t) until ``t_end``, then growing linearly with ``slope``."""
+
+    a0: float
+    rate: float
+    t_end: float
+    slope: float
+
+    @property
+    def kinks(self):
+        return (self.t_end,)
+
+    def evaluate(self, t):
+        early = self.a0 * np.exp(self.rate * np.minimum(t, self.t_end))
+        return np.where(t < self.t_end, early, early + self.slope * (t - self.t_end))
+
+
+@dataclass(frozen=True)
+class LogRamp(ScaleFactor):
+    """10^decade moving linearly from ``start`` to ``end`` decades over t in [0, 1]."""
+
+    start: float
+    end: float
+
+    def evaluate(self, t):
+        return 10.0 ** (self.start + (self.end - self.start) * t)
+
+
+class ScaleFactorTable:
+    """Dense uniform samples of log a(t), read back in O(1) per query."""
+
+    def __init__(self, model: ScaleFactor, t_min: float, t_max: float, samples: int = 4096):
+        self.model = model
+        self.t_min, self.t_max = float(t_min), float(t_max)
+        self.step = (self.t_max - self.t_min) / (samples - 1)
+        self.log_a = np.log(model.evaluate(np.linspace(self.t_min, self.t_max, samples)))
+        self.log_a_list = self.log_a.tolist()  # scalar lookups skip NumPy overhead
+        self.kinks = tuple(float(k) for k in model.kinks)
+
+    def exact(self, t) -> np.ndarray:
+        """Mask of the queries the table cannot answer well."""
+        outside = (t < self.t_min) | (t > self.t_max)
+        for kink in self.kinks:
+            outside |= np.abs(t - kink) < self.step
+        return outside
+
+    def __call__(self, t):
+        if isinstance(t, (int, float)):
+            return self.scalar(float(t))
+        t = np.asarray(t, dtype=float)
+        pos = (t - self.t_min) / self.step
+        i = np.clip(pos.astype(int), 0, len(self.log_a) - 2)
+        frac = pos - i
+        values = np.exp(self.log_a[i] * (1 - frac) + self.log_a[i + 1] * frac)
+        exact = self.exact(t)
+        if np.any(exact):
+            values = np.where(exact, self.model.evaluate(t), values)
+        return float(values) if values.ndim == 0 else values
+
+    def scalar(self, t: float) -> float:
+        if not self.t_min <= t <= self.t_max or any(abs(t - k) < self.step for k in self.kinks):
+            return float(self.model.evaluate(np.float64(t)))
+        pos = (t - self.t_min) / self.step
+        i = min(int(pos), len(self.log_a_list) - 2)
+        frac = pos - i
+        return math.exp(self.log_a_list[i] * (1 - frac) + self.log_a_list[i + 1] * frac)
@@ -0,0 +1,129 @@
+"""Copy-on-write point storage for glyph-heavy scenes.
+
+After ``share_points(group)``, the copies manim makes of the group
+(``.animate`` targets, ``FadeIn``/``Transform`` starting copies, ``.copy()``)
+share one read-only array per outline instead of duplicating it.  Arrays are
+interned by their exact bytes, so two labels share an outline only while they
+have the same points, i.e. the same glyph at the same place; the same glyph
+drawn at two positions is two arrays.
+
+This is deliberately not a flyweight of one canonical outline per glyph with
+a per-instance offset and scale.  Manim reads and writes ``mob.points`` as
+absolute coordinates everywhere (the camera, bounding boxes, every
+transform), so an anchor-relative outline would have to be expanded into a
+fresh array on each read, as the flat mode of ``compact.py`` does, giving the
+memory back as a copy per access.  Sharing whole arrays between a mobject and
+its copies keeps reads free, and copies are where duplicate outlines pile up.
+
+Manim almost always *assigns* a new array when it mutates points
+(``mob.points -= p``, ``mob.points = func(...)``, ``set_points``,
+``pointwise_become_partial``), so the first mutation gives that mobject its
+own copy and the shared outline stays untouched.  The exceptions write items
+in place: ``Wiggle`` gets a private copy first (installed by the first
+``share_points``), and ``DecimalNumber`` / ``ValueTracker`` families, which
+rewrite their points on every update, are never shared.  Other code that
+writes ``mob.points[...] = ...`` on a shared mobject raises ``ValueError``;
+call ``own_points(mob)`` before.
+"""
+from __future__ import annotations
+
+import functools
+import hashlib
+import weakref
+
+import numpy as np
+from manim import DecimalNumber, Mobject, ValueTracker, Wiggle
+
+
+class SharedPoints(np.ndarray):
+    """Read-only point array that is shared instead of copied."""
+
+    def __array_wrap__(self, obj, context=None, return_scalar=False):
+        # results of arithmetic are private, writable arrays
+        if return_scalar:
+            return obj[()]
+        return obj.view(np.ndarray)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    # In-place math on a shared outline returns a fresh array; the
+    # augmented assignment then stores it on the mutating mobject only.
+    def __iadd__(self, other):
+        return np.add(self, other)
+
+    def __isub__(self, other):
+        return np.subtract(self, other)
+
+    def __imul__(self, other):
+        return np.multiply(self, other)
+
+    def __itruediv__(self, other):
+        return np.true_divide(self, other)
+
+
+# ---------- Interning ----------
+_POOL: weakref.WeakValueDictionary[tuple, SharedPoints] = weakref.WeakValueDictionary()
+
+
+def intern_points(points: np.ndarray) -> SharedPoints:
+    """Return the shared, read-only array holding exactly these points."""
+    if isinstance(points, SharedPoints):
+        return points
+    arr = np.ascontiguousarray(points, dtype=float)
+    key = (arr.shape, hashlib.blake2b(arr.tobytes(), digest_size=16).digest())
+    shared = _POOL.get(key)
+    if shared is None:
+        shared = arr.copy().view(SharedPoints)
+        shared.flags.writeable = False
+        _POOL[key] = shared
+    return shared
+
+
+def share_points(mobject: Mobject) -> Mobject:
+    """Intern the points of every family member, so copies become cheap."""
+    _install_copy_on_write()
+    rewritten = {
+        id(member)
+        for mob in mobject.get_family() if isinstance(mob, (DecimalNumber, ValueTracker))
+        for member in mob.get_family()
+    }
+    for mob in mobject.family_members_with_points():
+        if id(mob) not in rewritten:
+            mob.points = intern_points(mob.points)
+    return mobject
+
+
+def own_points(mobject: Mobject) -> Mobject:
+    """Give every family member a private, writable copy of shared points."""
+    for mob in mobject.get_family():
+        if isinstance(mob.points, SharedPoints):
+            mob.points = np.array(mob.points)
+    return mobject
+
+
+# ---------- In-place writers ----------
+ORIGINAL = {}
+
+
+def _install_copy_on_write() -> None:
+    if ORIGINAL:
+        return
+    ORIGINAL["Wiggle.interpolate_submobject"] = original = Wiggle.interpolate_submobject
+
+    @functools.wraps(original)
+    def interpolate_submobject(self, submobject, starting_submobject, alpha):
+        if isinstance(submobject.points, SharedPoints):  # writes submobject.points[:, :]
+            submobject.points = np.array(submobject.points)
+        return original(self, submobject, starting_submobject, alpha)
+
+    Wiggle.interpolate_submobject = interpolate_submobject
+
+
+def pool_stats() -> dict[str, int]:
+    """Number of distinct outlines alive and the bytes they occupy."""
+    arrays = list(_POOL.values())
+    return {"outlines": len(arrays), "bytes": sum(a.nbytes for a in arrays)}
@@ -0,0 +1,82 @@
+"""Skip rasterizing wait frames that would come out identical.
+
+manim only freezes a ``self.wait()`` into one static frame when nothing on
+screen has updaters.  Scenes built on ``always_redraw`` (InflationGridIntro,
+ShowcaseUpdaters, ScaleComparisons_NoTex) therefore re-rasterize every frame
+of every hold, although the updaters rebuild the same mobjects each time.
+
+``ElidingRenderer`` still runs the updaters, then fingerprints what the
+camera is about to draw: the points, colour arrays and scalar style of every
+family member, the camera's own state and the static background of the play.
+When the fingerprint matches the previous frame's, the previous frame buffer
+goes to the writer again instead of rasterizing a new one.
+
+    python render.py cosmic_inflation_intro.py InflationGridIntro --elide_frames
+
+Only frames of plays made of ``Wait``s are checked; animated frames differ
+anyway and render as usual.
+"""
+from __future__ import annotations
+
+import hashlib
+from enum import Enum
+
+import numpy as np
+from manim import CairoRenderer, Wait
+from manim.utils.family import extract_mobject_family_members
+from manim.utils.iterables import list_update
+
+from scene_hash import PLAIN, SKIPPED_KEYS
+
+
+def render_state(mobjects, camera) -> bytes:
+    """Digest of everything ``camera`` reads to draw ``mobjects``."""
+    digest = hashlib.blake2b(digest_size=16)
+    scalars = []
+    family = extract_mobject_family_members(mobjects)
+    if getattr(camera, "frame", None) is not None:  # MovingCamera
+        family += camera.frame.get_family()
+    for obj in (camera, *family):
+        scalars.append(id(obj))
+        for key, value in obj.__dict__.items():
+            if isinstance(value, np.ndarray):
+                if key in SKIPPED_KEYS:  # pixel_array, background
+                    continue
+                scalars.append((key, value.shape))
+                digest.update(np.ascontiguousarray(value).data)
+            elif type(value) in PLAIN or isinstance(value, Enum):
+                scalars.append((key, value))
+    digest.update(repr(scalars).encode())
+    return digest.digest()
+
+
+class ElidingRenderer(CairoRenderer):
+    """Re-emits the previous frame while a wait leaves the screen unchanged.
+
+    Combine with another renderer through ``wrapping``.
+    """
+
+    @classmethod
+    def wrapping(cls, renderer_class) -> type:
+        return type(renderer_class.__name__, (cls, renderer_class), {})
+
+    def init_scene(self, scene) -> None:
+        super().init_scene(scene)
+        self.last_state = self.last_frame = self.last_static = None
+        self.frames_elided = 0
+
+    def render(self, scene, time, moving_mobjects):
+        if self.skip_animations or not all(isinstance(a, Wait) for a in scene.animations):
+            self.last_state = None
+            return super().render(scene, time, moving_mobjects)
+
+        mobjects = moving_mobjects or list_update(scene.mobjects, scene.foreground_mobjects)
+        state = render_state(mobjects, self.camera)
+        if state == self.last_state and self.static_image is self.last_static:
+            self.frames_elided += 1
+            self.add_frame(self.last_frame)
+            return
+        self.update_frame(scene, moving_mobjects)
+        self.last_frame = self.get_frame()
+        self.last_state, self.last_static = state, self.static_image
+        self.add_frame(self.last_frame)
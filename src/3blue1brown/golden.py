@@ -0,0 +1,203 @@
+"""Golden-frame regression checks that render a handful of frames per scene.
+
+Every scene in this folder is replayed with all plays skipped; only the start,
+middle and end of each ``self.play`` are rasterized, at 256x144.  Frames are
+compared to the PNGs under ``tests/golden`` by perceptual hash plus
+a count of clearly changed pixels (small mobjects barely move the hash), so
+anti-aliasing noise passes and a moved or missing mobject does not.
+
+    python golden.py --update --from_commit 7e18780   # goldens from the baseline
+    python golden.py                          # check, same as pytest tests/
+    python golden.py math.py zoom_ladder.py   # only these files
+
+``--from_commit`` renders the scene files as they were at that commit (from
+``git archive``, with today's renderer), so the goldens record what the
+scenes looked like before a refactor rather than what the code under test
+draws now.  Plain ``--update`` takes the working tree, for deliberate
+visual changes.  Commit ``tests/golden`` afterwards; scenes without goldens
+are skipped by pytest.
+
+Every scene renders in a fresh worker process, so a helper a scene switches
+on for the whole process cannot change the frames of the scenes after it.
+"""
+from __future__ import annotations
+
+import argparse
+import ast
+import io
+import subprocess
+import tarfile
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+from scipy.fft import dctn
+
+from checkpoints import FrameRenderer
+from render import render_scene
+
+SCENE_DIR = Path(__file__).resolve().parent
+GOLDEN_DIR = SCENE_DIR.parents[1] / "tests" / "golden"
+SAMPLE_SETTINGS = {"pixel_width": 256, "pixel_height": 144, "frame_rate": 15}
+MAX_DISTANCE = 6  # differing bits out of 64
+MAX_CHANGED = 0.002  # fraction of pixels more than PIXEL_STEP levels off
+PIXEL_STEP = 48
+
+
+class SampleRenderer(FrameRenderer):
+    """Grab the start, middle and end of every play."""
+
+    def grab_frames(self, scene, start: float) -> None:
+        for label, alpha in (("start", 0.0), ("mid", 0.5), ("end", 1.0)):
+            scene.update_to_time(alpha * scene.duration)
+            self.grab(scene, f"play{self.num_plays:03d}_{label}")
+
+
+def discover_scenes(folder: Path = SCENE_DIR) -> list[tuple[str, str]]:
+    """``(file name, class name)`` of every class with a ``construct`` method."""
+    scenes = []
+    for file in sorted(folder.glob("*.py")):
+        for node in ast.parse(file.read_text(encoding="utf-8")).body:
+            if isinstance(node, ast.ClassDef) and any(
+                isinstance(item, ast.FunctionDef) and item.name == "construct"
+                for item in node.body
+            ):
+                scenes.append((file.name, node.name))
+    return scenes
+
+
+@contextmanager
+def scenes_at(commit: str):
+    """This folder as it was at ``commit``, extracted into a temporary directory."""
+    repo = SCENE_DIR.parents[1]
+    folder = SCENE_DIR.relative_to(repo).as_posix()
+    archive = subprocess.run(["git", "archive", "--format=tar", commit, folder],
+                             cwd=repo, capture_output=True, check=True).stdout
+    with tempfile.TemporaryDirectory() as tmp:
+        with tarfile.open(fileobj=io.BytesIO(archive)) as tar:
+            tar.extractall(tmp)
+        yield Path(tmp) / folder
+
+
+def sample_scene(file: str, scene_name: str, scene_dir: Path = SCENE_DIR) -> dict[str, np.ndarray]:
+    scene = render_scene(
+        scene_dir / file, scene_name,
+        renderer_class=SampleRenderer,
+        write_to_movie=False,
+        dry_run=True,
+        progress_bar="none",
+        **SAMPLE_SETTINGS,
+    )
+    return scene.renderer.frames
+
+
+# ---------- Perceptual hash ----------
+def phash(image: np.ndarray) -> int:
+    """64-bit DCT hash: low frequencies of the 32x32 greyscale image vs. their median."""
+    grey = np.asarray(Image.fromarray(image).convert("L").resize((32, 32), Image.LANCZOS), dtype=float)
+    low = dctn(grey, norm="ortho")[:8, :8].flatten()
+    bits = low > np.median(low[1:])
+    return int.from_bytes(np.packbits(bits).tobytes(), "big")
+
+
+def distance(a: int, b: int) -> int:
+    return (a ^ b).bit_count()
+
+
+def changed_fraction(a: np.ndarray, b: np.ndarray) -> float:
+    if a.shape != b.shape:
+        return 1.0
+    return float(np.mean(np.abs(a.astype(int) - b).max(axis=-1) > PIXEL_STEP))
+
+
+# ---------- Checking ----------
+def golden_dir(file: str, scene_name: str, root: Path = GOLDEN_DIR) -> Path:
+    return root / Path(file).stem / scene_name
+
+
+def check_scene(file: str, scene_name: str, root: Path = GOLDEN_DIR) -> list[str]:
+    """Problems found for one scene; empty when every frame matches."""
+    target = golden_dir(file, scene_name, root)
+    frames = sample_scene(file, scene_name)
+    problems = []
+    for key, frame in frames.items():
+        path = target / f"{key}.png"
+        if not path.exists():
+            problems.append(f"{key}: no golden frame")
+            continue
+        expected = np.asarray(Image.open(path))
+        bits = distance(phash(frame), phash(expected))
+        changed = changed_fraction(frame, expected)
+        if bits > MAX_DISTANCE or changed > MAX_CHANGED:
+            problems.append(f"{key}: hash {bits} bits off, {changed:.2%} of pixels changed")
+    extra = {p.stem for p in target.glob("*.png")} - set(frames)
+    problems += [f"{key}: golden frame no longer rendered" for key in sorted(extra)]
+    return problems
+
+
+def update_scene(file: str, scene_name: str, root: Path = GOLDEN_DIR,
+                 scene_dir: Path = SCENE_DIR) -> list[str]:
+    frames = sample_scene(file, scene_name, scene_dir)
+    target = golden_dir(file, scene_name, root)
+    target.mkdir(parents=True, exist_ok=True)
+    for old in target.glob("*.png"):
+        old.unlink()
+    for key, frame in frames.items():
+        Image.fromarray(frame).save(target / f"{key}.png")
+    return []
+
+
+def run_all(scenes, update: bool = False, workers: int | None = None,
+            root: Path = GOLDEN_DIR, scene_dir: Path = SCENE_DIR) -> dict:
+    """Check (or update from ``scene_dir``) every scene on a process pool; ``{(file, scene): problems}``."""
+    # one process per scene: use_layout_cache() & co. patch manim process wide
+    with ProcessPoolExecutor(max_workers=workers, max_tasks_per_child=1) as pool:
+        futures = {
+            scene: pool.submit(update_scene, *scene, root, scene_dir) if update
+            else pool.submit(check_scene, *scene, root)
+            for scene in scenes
+        }
+        results = {}
+        for scene, future in futures.items():
+            try:
+                results[scene] = future.result()
+            except Exception as error:
+                results[scene] = [f"render failed: {error!r}"]
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("files", nargs="*", help="scene files to check (default: all)")
+    parser.add_argument("--update", action="store_true", help="rewrite the golden PNGs")
+    parser.add_argument("--from_commit", metavar="REV",
+                        help="with --update, render the scene files as of this commit")
+    parser.add_argument("-j", "--workers", type=int)
+    args = parser.parse_args()
+    if args.from_commit and not args.update:
+        parser.error("--from_commit only applies to --update")
+
+    scenes = [s for s in discover_scenes() if not args.files or s[0] in args.files]
+    if args.from_commit:
+        with scenes_at(args.from_commit) as scene_dir:
+            old = set(discover_scenes(scene_dir))
+            for file, scene_name in sorted(set(scenes) - old):
+                print(f"skip {file}::{scene_name} (not in {args.from_commit})")
+            results = run_all([s for s in scenes if s in old], True, args.workers,
+                              scene_dir=scene_dir)
+    else:
+        results = run_all(scenes, args.update, args.workers)
+    failed = 0
+    for (file, scene_name), problems in results.items():
+        print(f"{'FAIL' if problems else 'ok  '} {file}::{scene_name}")
+        for problem in problems:
+            print(f"     {problem}")
+        failed += bool(problems)
+    raise SystemExit(failed > 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,15 @@
 from manim import *
 
+from mobject_cache import cached
+
 class ExpandingGrid(Scene):
     def construct(self):
         # Background
         self.camera.background_color = "#0c1736"
         
         # Create grid
-        grid = NumberPlane(
+        grid = cached(
+            NumberPlane,
             x_range=[-4, 4, 1],
             y_range=[-4, 4, 1],
             axis_config={"stroke_color": GREY_B, "stroke_width": 1},
@@ -0,0 +1,211 @@
+"""Small composite icons drawn from a cached raster while they only move.
+
+The ZoomLadder cards carry icons made of a few dozen vector parts (the Oort
+cloud is a shell, 22 dots and a core; the solar system three orbits and a
+sun).  A camera pan moves every card, so every part goes through Cairo again
+on every frame although the icons never change shape.
+
+Wrap such a group in ``CachedIcon`` and render with a camera wrapped by
+``IconCacheCamera``:
+
+    icon = CachedIcon(ic_oort())               # a VGroup; layout works as before
+
+    class MyScene(MovingCameraScene):
+        def __init__(self, camera_class=IconCacheCamera.wrapping(MovingCamera), **kwargs):
+            super().__init__(camera_class=camera_class, **kwargs)
+
+The camera then draws each icon as one premultiplied sprite, rasterized once
+by a plain ``Camera`` at the current pixel scale and reused for as long as
+the icon's shape and style (its points relative to its first anchor, colours,
+stroke widths) stay the same.  Translation is free: sprites exist for
+quarter-pixel offsets, so a moving icon lands within 1/8 px of where Cairo
+would put it.  When the on-screen scale drifts by less than
+``CachedIcon.rescale_tolerance`` the last sprite is resampled; past it the
+icon is rasterized again at the new scale.  Anything else (a recoloured or
+morphing icon, part of an icon being animated alone, an image inside it)
+falls back to drawing the parts as usual.
+
+Without the camera wrapper a ``CachedIcon`` is an ordinary ``VGroup``.
+"""
+from __future__ import annotations
+
+import hashlib
+import math
+from collections import Counter, OrderedDict
+
+import numpy as np
+from manim import Camera, VGroup, VMobject
+from manim.camera.three_d_camera import ThreeDCamera
+from manim.utils.family import extract_mobject_family_members
+from PIL import Image
+
+PHASES = 4            # sprites per pixel along each axis
+QUANT = 64            # geometry is compared to 1/QUANT px
+PAD = 2               # transparent pixels around a sprite
+MAX_BYTES = 128 << 20
+SPRITES: OrderedDict[tuple, tuple[np.ndarray, int, int]] = OrderedDict()
+STATS = Counter()     # "hits" / "misses" / "resampled", process wide
+STYLE_ARRAYS = ("fill_rgbas", "stroke_rgbas", "background_stroke_rgbas", "sheen_direction")
+STYLE_SCALARS = ("stroke_width", "background_stroke_width", "sheen_factor", "joint_type", "cap_style")
+
+
+class CachedIcon(VGroup):
+    """A static group that ``IconCacheCamera`` may draw from a cached raster."""
+
+    rescale_tolerance = 0.05  # relative scale change served by resampling
+    cache_raster = True
+
+
+def icon_key(members: list[VMobject], origin: np.ndarray, scale: float) -> bytes:
+    """Digest of everything Cairo draws from, with points relative to ``origin``."""
+    digest = hashlib.blake2b(digest_size=16)
+    for member in members:
+        relative = (np.asarray(member.points)[:, :2] - origin) * (scale * QUANT)
+        digest.update(np.rint(relative).astype(np.int64).tobytes())
+        for name in STYLE_ARRAYS:
+            digest.update(np.ascontiguousarray(getattr(member, name, ()), np.float64).tobytes())
+        digest.update(repr([getattr(member, name, None) for name in STYLE_SCALARS]).encode())
+    return digest.digest()
+
+
+def blit(pixel_array: np.ndarray, sprite: np.ndarray, x0: int, y0: int) -> None:
+    """Premultiplied ``over`` of ``sprite`` with its top-left pixel at (x0, y0)."""
+    height, width = pixel_array.shape[:2]
+    left, top = max(x0, 0), max(y0, 0)
+    right, bottom = min(x0 + sprite.shape[1], width), min(y0 + sprite.shape[0], height)
+    if left >= right or top >= bottom:
+        return
+    src = sprite[top - y0:bottom - y0, left - x0:right - x0].astype(np.float32)
+    dst = pixel_array[top:bottom, left:right]
+    keep = 1 - src[..., 3:] / 255
+    dst[...] = np.clip(src + dst * keep + 0.5, 0, 255).astype(np.uint8)
+
+
+def _remember(key: tuple, sprite: tuple[np.ndarray, int, int]) -> None:
+    SPRITES[key] = sprite
+    total = sum(pixels.nbytes for pixels, _, _ in SPRITES.values())
+    while total > MAX_BYTES and len(SPRITES) > 1:
+        pixels, _, _ = SPRITES.popitem(last=False)[1]
+        total -= pixels.nbytes
+
+
+def clear_icon_cache() -> None:
+    SPRITES.clear()
+
+
+class IconCacheCamera(Camera):
+    """Draws every ``CachedIcon`` of a frame as one cached sprite.
+
+    Combine with another camera class through ``wrapping``.
+    """
+
+    @classmethod
+    def wrapping(cls, camera_class) -> type:
+        if issubclass(camera_class, (cls, ThreeDCamera)):  # ThreeDCamera shades by depth
+            return camera_class
+        return type(camera_class.__name__, (cls, camera_class), {})
+
+    def get_mobjects_to_display(self, mobjects, include_submobjects=True, excluded_mobjects=None):
+        mobjects = list(mobjects)
+        displayed = super().get_mobjects_to_display(mobjects, include_submobjects, excluded_mobjects)
+        square = abs(self.pixel_width / self.frame_width - self.pixel_height / self.frame_height)
+        if not include_submobjects or square > 1e-9 * self.pixel_width:
+            return displayed
+        owner, parts = {}, {}
+        for icon in extract_mobject_family_members(mobjects):
+            if not isinstance(icon, CachedIcon) or not icon.cache_raster or id(icon) in owner:
+                continue  # an icon nested in another is drawn as part of the outer one
+            members = icon.family_members_with_points()
+            if members and all(isinstance(m, VMobject) and not m.get_background_image() for m in members):
+                parts[id(icon)] = len(members)
+                for member in members:
+                    owner.setdefault(id(member), icon)
+        if not owner:
+            return displayed
+        # an icon with parts excluded (animated on their own) is drawn as parts
+        shown = Counter(id(owner[id(m)]) for m in displayed if id(m) in owner)
+        result, placed = [], set()
+        for mobject in displayed:
+            icon = owner.get(id(mobject))
+            if icon is None or shown[id(icon)] != parts[id(icon)]:
+                result.append(mobject)
+            elif id(icon) not in placed:  # in the place of its first part
+                placed.add(id(icon))
+                result.append(icon)
+        return result
+
+    def type_or_raise(self, mobject):
+        kind = super().type_or_raise(mobject)  # rebuilds display_funcs every call
+        if isinstance(mobject, CachedIcon):
+            self.display_funcs[CachedIcon] = self.display_cached_icons
+            return CachedIcon
+        return kind
+
+    def display_cached_icons(self, icons, pixel_array):
+        for icon in icons:
+            self.display_cached_icon(icon, pixel_array)
+
+    def display_cached_icon(self, icon: CachedIcon, pixel_array: np.ndarray) -> None:
+        members = icon.family_members_with_points()
+        scale = self.pixel_width / self.frame_width
+        raster_scale = icon.__dict__.get("raster_scale")
+        if raster_scale is None or abs(scale / raster_scale - 1) > icon.rescale_tolerance:
+            raster_scale = icon.raster_scale = scale
+        origin = np.asarray(members[0].points[0][:2], np.float64)
+        center = np.asarray(self.frame_center, np.float64)[:2]
+        ox = (origin[0] - center[0]) * scale + self.pixel_width / 2
+        oy = self.pixel_height / 2 - (origin[1] - center[1]) * scale
+        key = icon_key(members, origin, raster_scale)
+        if raster_scale == scale:
+            ix, iy = math.floor(ox), math.floor(oy)
+            px, py = round((ox - ix) * PHASES), round((oy - iy) * PHASES)
+            pixels, x0, y0 = self.sprite(icon, members, origin, scale, key, px % PHASES, py % PHASES)
+            blit(pixel_array, pixels, ix + px // PHASES + x0, iy + py // PHASES + y0)
+            return
+        STATS["resampled"] += 1
+        pixels, x0, y0 = self.sprite(icon, members, origin, raster_scale, key, 0, 0)
+        ratio = scale / raster_scale
+        # sprite pixel x0 + u holds the point at (u + x0) / raster_scale from the origin
+        left = math.floor(ox + x0 * ratio)
+        top = math.floor(oy + y0 * ratio)
+        size = (math.ceil(ox + (x0 + pixels.shape[1]) * ratio) - left,
+                math.ceil(oy + (y0 + pixels.shape[0]) * ratio) - top)
+        image = Image.frombytes("RGBa", pixels.shape[1::-1], pixels.tobytes()).transform(
+            size, Image.AFFINE,
+            (1 / ratio, 0, (left - ox) / ratio - x0, 0, 1 / ratio, (top - oy) / ratio - y0),
+            resample=Image.BILINEAR,
+        )
+        blit(pixel_array, np.asarray(image), left, top)
+
+    def sprite(self, icon, members, origin, scale, key, px, py) -> tuple[np.ndarray, int, int]:
+        """Premultiplied pixels of ``icon`` with its origin at (px, py)/PHASES past a
+        pixel corner, and the offset of their top-left pixel from that corner."""
+        full_key = (key, px, py)
+        sprite = SPRITES.get(full_key)
+        if sprite is not None:
+            STATS["hits"] += 1
+            SPRITES.move_to_end(full_key)
+            return sprite
+        STATS["misses"] += 1
+        points = np.concatenate([np.asarray(m.points)[:, :2] for m in members]) - origin
+        reach = max(max(m.get_stroke_width(), m.get_stroke_width(background=True)) for m in members)
+        reach *= self.cairo_line_width_multiple * scale  # the stroke width, not half: mitres down to 60°
+        fx, fy = px / PHASES, py / PHASES
+        x0 = math.floor(fx + points[:, 0].min() * scale - reach) - PAD
+        y0 = math.floor(fy - points[:, 1].max() * scale - reach) - PAD
+        width = math.ceil(fx + points[:, 0].max() * scale + reach) + PAD - x0
+        height = math.ceil(fy - points[:, 1].min() * scale + reach) + PAD - y0
+        # the origin sits at (fx - x0, fy - y0) in the sprite
+        camera = Camera(
+            pixel_width=width, pixel_height=height,
+            frame_width=width / scale, frame_height=height / scale,
+            frame_center=[origin[0] + (width / 2 - fx + x0) / scale,
+                          origin[1] - (height / 2 - fy + y0) / scale, 0],
+            background_opacity=0,
+            cairo_line_width_multiple=self.cairo_line_width_multiple,
+            use_z_index=self.use_z_index,
+        )
+        camera.capture_mobjects([icon])
+        sprite = (camera.pixel_array.copy(), x0, y0)
+        _remember(full_key, sprite)
+        return sprite
@@ -2,6 +2,10 @@
 from manim import *
 import math
 
+from cosmology import LogRamp
+
+SCALE_RAMP = LogRamp(0, 26).table(0.0, 1.0)  # 1 -> 1e26, evenly in decades
+
 class ScaleComparisons_NoTex(Scene):
     def construct(self):
         BG = "#0c1736"
@@ -48,8 +52,7 @@ class ScaleComparisons_NoTex(Scene):
 
         # Animate the scaling on log scale
         def drive(alpha):
-            logv = interpolate(0, 26, alpha)
-            scale_tracker.set_value(10 ** logv)
+            scale_tracker.set_value(SCALE_RAMP(alpha))
 
         self.play(UpdateFromAlphaFunc(rows, lambda _m, a: drive(a)), run_time=TOTAL, rate_func=linear)
 
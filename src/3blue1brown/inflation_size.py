@@ -2,6 +2,10 @@
 from manim import *
 import math
 
+from cosmology import LogRamp
+
+SCALE_RAMP = LogRamp(0, 26).table(0.0, 1.0)  # 1 -> 1e26, evenly in decades
+
 class ScaleComparisons_NoTex(Scene):
     def construct(self):
         # --- Look & feel ---
@@ -65,9 +69,7 @@ class ScaleComparisons_NoTex(Scene):
 
         # Animate the scale up (log feel)
         def drive(alpha):
-            # animate on log scale: 1 -> 1e26
-            logv = interpolate(0, 26, alpha)  # decades
-            scale_tracker.set_value(10 ** logv)
+            scale_tracker.set_value(SCALE_RAMP(alpha))
 
         self.play(UpdateFromAlphaFunc(rows, lambda _m, a: drive(a)), run_time=TOTAL, rate_func=linear)
 
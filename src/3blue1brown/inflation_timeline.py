@@ -2,6 +2,9 @@
 from manim import *
 import math
 
+from batched import LaggedCreate
+from flyweight import share_points
+
 
 class TimelineZoomInflation(MovingCameraScene):
     def construct(self):
@@ -71,6 +74,7 @@ class TimelineZoomInflation(MovingCameraScene):
             # Subtle background for tick labels too
             lbl_bg = BackgroundRectangle(lbl, fill_opacity=0.35, buff=0.02, color=BLACK)
             labels.add(VGroup(lbl_bg, lbl))
+        share_points(labels)  # FadeIn/FadeOut copies now reuse the glyph arrays
 
         title = Text("Cosmic Time (log seconds)").scale(0.62).to_edge(UP)
         title_bg = BackgroundRectangle(title, fill_opacity=0.35, buff=0.08, color=BLACK)
@@ -89,7 +93,7 @@ class TimelineZoomInflation(MovingCameraScene):
         self.play(
             FadeIn(VGroup(title_bg, title), shift=UP*0.2),
             Create(axis),
-            LaggedStart(*[Create(t) for t in ticks], lag_ratio=0.02),
+            LaggedCreate(*ticks, lag_ratio=0.02),
             FadeIn(labels),
             run_time=1.6
         )
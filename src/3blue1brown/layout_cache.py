@@ -0,0 +1,295 @@
+"""Cached ``get_family()`` and bounding boxes, dropped through dirty flags.
+
+Layout helpers (``next_to``, ``to_edge``, ``arrange``, ``align_to``,
+``get_width``) walk the whole family and rebuild its point list on every
+query, so laying out the ZoomLadder cards costs O(family) per call.  After
+``use_layout_cache()`` every mobject keeps its flattened family and its boxes
+until they go stale: assigning ``points`` drops the boxes of that mobject and
+its ancestors, changing ``submobjects`` (assignment or in-place list edits)
+drops the family as well.
+
+    use_layout_cache()        # once per process (render.py --layout_cache)
+
+Changes are seen through attribute assignment, which covers manim's
+transforms (``mob.points += v`` assigns too).  The manim methods that write
+into a points array in place (``pointwise_become_partial``,
+``set_anchors_and_handles``, ``ValueTracker.set_value``,
+``DecimalNumber.set_value``, ``Wiggle``) are wrapped to drop the boxes they
+touch.  Other in-place writes (``mob.points[:] = ...`` in scene code) are not
+seen; call ``mark_dirty(mob)`` after them, as ``batched.py`` does for its
+shared buffers.
+
+The cost is a Python property on every ``mob.points`` read (about 100 ns,
+roughly twice a plain attribute), which pays off for static layouts with many
+``next_to``/``arrange``/``get_width`` queries and not for scenes that mostly
+animate points.  It is therefore opt-in per render (``--layout_cache``) and
+never switched on from scene code.
+"""
+from __future__ import annotations
+
+import functools
+import weakref
+
+import numpy as np
+from manim import ComplexValueTracker, DecimalNumber, Mobject, ValueTracker, VMobject, Wiggle
+from manim.utils.iterables import remove_list_redundancies
+
+ORIGINAL = {}
+
+
+class LayoutState:
+    """Per-mobject cache, kept in ``mob.__dict__``; copies start empty."""
+
+    __slots__ = ("family", "boxes", "parents")
+
+    def __init__(self):
+        self.family = None   # flattened family
+        self.boxes = None    # {kind: (low, high) or None}
+        self.parents = weakref.WeakSet()
+
+    def __deepcopy__(self, memo):
+        return None
+
+    def __reduce__(self):
+        return LayoutState, ()
+
+
+def _state(mob) -> LayoutState:
+    state = mob.__dict__.get("_layout")
+    if state is None:
+        state = mob.__dict__["_layout"] = LayoutState()
+    return state
+
+
+def mark_dirty(*mobjects, family: bool = False) -> None:
+    """Drop the cached boxes (and with ``family=True`` families) up to the root."""
+    stack = list(mobjects)
+    while stack:
+        state = stack.pop().__dict__.get("_layout")
+        # an ancestor only caches what all its descendants cache, so an
+        # uncached mobject has no cached ancestors left to visit
+        if state is None or (state.boxes is None and (not family or state.family is None)):
+            continue
+        state.boxes = None
+        if family:
+            state.family = None
+        stack.extend(state.parents)
+
+
+def _adopt(owner, children) -> None:
+    for child in children:
+        _state(child).parents.add(owner)
+    mark_dirty(owner, family=True)
+
+
+class TrackedList(list):
+    """``submobjects`` list that reports in-place edits to its owner."""
+
+    __slots__ = ("owner",)
+
+    def __init__(self, owner, items=()):
+        super().__init__(items)
+        self.owner = owner
+
+    def __reduce_ex__(self, protocol):
+        # copies are plain lists; the copied owner wraps them again
+        return list, (list(self),)
+
+
+def _tracked(method):
+    def edit(self, *args, **kwargs):
+        result = method(self, *args, **kwargs)
+        _adopt(self.owner, self)
+        return self if result is self else result
+
+    edit.__name__ = method.__name__
+    return edit
+
+
+for _name in ("append", "extend", "insert", "remove", "pop", "clear", "sort", "reverse",
+              "__setitem__", "__delitem__", "__iadd__", "__imul__"):
+    setattr(TrackedList, _name, _tracked(getattr(list, _name)))
+
+
+def _track(mob) -> None:
+    """Wrap the submobjects of a mobject built before ``use_layout_cache()``."""
+    if type(mob.submobjects) is not TrackedList:
+        mob.submobjects = mob.submobjects
+
+
+# ---------- Patched Mobject methods ----------
+def _stored(name):
+    def get(self):
+        try:
+            return self.__dict__[name]
+        except KeyError:
+            raise AttributeError(name) from None
+    return get
+
+
+def _set_points(self, value):
+    state = self.__dict__.get("_layout")
+    if state is not None and state.boxes is not None:
+        mark_dirty(self)
+    self.__dict__["points"] = value
+
+
+def _set_submobjects(self, value):
+    value = TrackedList(self, value)
+    _adopt(self, value)
+    self.__dict__["submobjects"] = value
+
+
+def _get_family(self, recurse: bool = True) -> list:
+    _track(self)
+    state = _state(self)
+    if state.family is None:
+        members = [self]
+        for sub in self.submobjects:
+            members.extend(sub.get_family())
+        state.family = remove_list_redundancies(members)
+    return list(state.family)
+
+
+def _own_points(mob, kind: str) -> np.ndarray:
+    points = mob.points
+    if kind == "anchors" and isinstance(mob, VMobject) and len(points) > 1:
+        # the points VMobject.get_anchors() pairs up, without building the list
+        n = mob.n_points_per_cubic_curve
+        starts, ends = points[::n], points[n - 1::n]
+        count = min(len(starts), len(ends))
+        return np.concatenate((starts[:count], ends[:count]))
+    return points
+
+
+def _box(mob, kind: str):
+    """(low, high) corners over the family, or None without points."""
+    _track(mob)
+    state = _state(mob)
+    if state.boxes is None:
+        state.boxes = {}
+    elif kind in state.boxes:
+        return state.boxes[kind]
+
+    own = _own_points(mob, kind)
+    if kind == "reduce" and not len(own) and not mob.submobjects:
+        box = (np.zeros(mob.dim), np.zeros(mob.dim))  # as reduce_across_dimension
+    else:
+        box = (own.min(axis=0), own.max(axis=0)) if len(own) else None
+        for sub in mob.submobjects:
+            sub_box = _box(sub, kind)
+            if sub_box is None:
+                continue
+            box = sub_box if box is None else (
+                np.minimum(box[0], sub_box[0]), np.maximum(box[1], sub_box[1]))
+    state.boxes[kind] = box
+    return box
+
+
+def _boundary_kind(mob) -> str | None:
+    """Which box ``get_points_defining_boundary`` spans, None if overridden."""
+    method = type(mob).get_points_defining_boundary
+    if method is VMobject.get_points_defining_boundary:
+        return "anchors"
+    if method is ORIGINAL["get_points_defining_boundary"]:
+        return "points"
+    return None
+
+
+def _pick(box, key):
+    low, high = box
+    return np.where(key < 0, low, np.where(key > 0, high, (low + high) / 2))
+
+
+def _get_critical_point(self, direction):
+    kind = _boundary_kind(self)
+    if kind is None:
+        return ORIGINAL["get_critical_point"](self, direction)
+    box = _box(self, kind)
+    if box is None:
+        return np.zeros(self.dim)
+    return _pick(box, np.asarray(direction))
+
+
+def _get_extremum_along_dim(self, points=None, dim: int = 0, key: int = 0):
+    kind = _boundary_kind(self)
+    if points is not None or kind is None:
+        return ORIGINAL["get_extremum_along_dim"](self, points, dim, key)
+    box = _box(self, kind)
+    if box is None:  # manim raises on an empty point list here
+        return ORIGINAL["get_extremum_along_dim"](self, points, dim, key)
+    return _pick(box, np.sign(key))[dim]
+
+
+def _reduce_across_dimension(self, reduce_func, dim: int):
+    if reduce_func not in (min, max, np.min, np.max):
+        return ORIGINAL["reduce_across_dimension"](self, reduce_func, dim)
+    box = _box(self, "reduce")
+    if box is None:
+        return ORIGINAL["reduce_across_dimension"](self, reduce_func, dim)
+    return box[reduce_func in (max, np.max)][dim]
+
+
+# ---------- In-place writers ----------
+def _dirty_after(method):
+    @functools.wraps(method)
+    def write(self, *args, **kwargs):
+        result = method(self, *args, **kwargs)
+        mark_dirty(self)
+        return result
+
+    return write
+
+
+def _decimal_set_value(method):
+    @functools.wraps(method)
+    def set_value(self, *args, **kwargs):
+        old_family = self.get_family()  # zeroed in place by manim
+        result = method(self, *args, **kwargs)
+        mark_dirty(*old_family)
+        return result
+
+    return set_value
+
+
+def _wiggle_interpolate_submobject(method):
+    @functools.wraps(method)
+    def interpolate_submobject(self, submobject, starting_submobject, alpha):
+        # manim resets the points in place and then asks for the centre
+        submobject.points = np.array(starting_submobject.points)
+        return method(self, submobject, starting_submobject, alpha)
+
+    return interpolate_submobject
+
+
+WRITERS = {
+    (VMobject, "pointwise_become_partial"): _dirty_after,
+    (VMobject, "set_anchors_and_handles"): _dirty_after,
+    (ValueTracker, "set_value"): _dirty_after,
+    (ComplexValueTracker, "set_value"): _dirty_after,
+    (DecimalNumber, "set_value"): _decimal_set_value,
+    (Wiggle, "interpolate_submobject"): _wiggle_interpolate_submobject,
+}
+
+
+PATCHES = {
+    "points": property(_stored("points"), _set_points),
+    "submobjects": property(_stored("submobjects"), _set_submobjects),
+    "get_family": _get_family,
+    "get_critical_point": _get_critical_point,
+    "get_extremum_along_dim": _get_extremum_along_dim,
+    "reduce_across_dimension": _reduce_across_dimension,
+}
+
+
+def use_layout_cache() -> None:
+    """Cache families and boxes of every mobject from now on (idempotent)."""
+    if ORIGINAL:
+        return
+    ORIGINAL["get_points_defining_boundary"] = Mobject.get_points_defining_boundary
+    for name, patch in PATCHES.items():
+        ORIGINAL[name] = Mobject.__dict__.get(name)
+        setattr(Mobject, name, patch)
+    for (cls, name), wrap in WRITERS.items():
+        ORIGINAL[f"{cls.__name__}.{name}"] = method = getattr(cls, name)
+        setattr(cls, name, wrap(method))
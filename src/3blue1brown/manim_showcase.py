@@ -1,6 +1,9 @@
 from manim import *
 import numpy as np
 
+from adaptive_plot import plot_adaptive
+from mobject_cache import cached
+
 # ===== 1) 3D: Parametrische oppervlakte + camera orbit =====
 class Showcase3D(ThreeDScene):
     def construct(self):
@@ -87,8 +90,8 @@ class ShowcaseGraphs(Scene):
             (4,5),(5,6),(3,7),(6,8),(7,9),(8,9),(5,7),(5,8)
         ]
 
-        g = Graph(
-            vertices, edges, layout=layout,
+        g = cached(
+            Graph, vertices, edges, layout=layout,
             vertex_config={"fill_color": BLUE_D, "radius": 0.18},
             edge_config={"stroke_color": GREY_B},
             labels=True
@@ -147,7 +150,7 @@ class ShowcaseUpdaters(Scene):
         ax = Axes(x_range=[0, 8, 1], y_range=[-2, 2, 1],
                   axis_config={"stroke_color": GREY_B, "stroke_width": 2},
                   tips=False).to_edge(DOWN, buff=1)
-        curve = ax.plot(lambda x: 1.2*np.sin(1.5*x)*np.exp(-0.12*x), x_range=[0, 8], stroke_width=4, color=BLUE_D)
+        curve = plot_adaptive(ax, lambda x: 1.2*np.sin(1.5*x)*np.exp(-0.12*x), x_range=[0, 8], stroke_width=4, color=BLUE_D)
         self.play(Create(ax), Create(curve), run_time=1.5)
 
         # Dot dat over de curve beweegt o.b.v. tijd
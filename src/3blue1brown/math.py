@@ -1,6 +1,11 @@
 from manim import *
 import numpy as np
 
+from batched import BatchedFadeIn
+from compact import compact_points
+from flyweight import share_points
+from mobject_cache import cached, disk_cached
+
 class HeavyMathShowcase(MovingCameraScene):
     def construct(self):
         # ---------- STYLING ----------
@@ -16,12 +21,14 @@ class HeavyMathShowcase(MovingCameraScene):
         title1 = Text("Linear Transform & Eigenvectors", color=TEXT).scale(0.6).to_edge(UP)
         self.add(title1)
 
-        plane = NumberPlane(
+        plane = cached(
+            NumberPlane,
             x_range=[-5, 5, 1],
             y_range=[-3, 3, 1],
             background_line_style={"stroke_color": GRID_COLOR, "stroke_width": 1},
             axis_config={"stroke_color": AXIS_COLOR, "stroke_width": 2},
         ).scale(1.0)
+        compact_points(plane)  # float32 grid: half the memory through ApplyMatrix
         axes_label = MathTex("x", ",", "y", color=TEXT).scale(0.6).to_corner(DL)
         self.add(plane, axes_label)
 
@@ -78,13 +85,18 @@ class HeavyMathShowcase(MovingCameraScene):
         self.play(ReplacementTransform(title1, title2))
 
         # Fresh complex plane (thin grid looks better when warping)
-        cplane = ComplexPlane(
-            x_range=[-3, 3, 1],
-            y_range=[-2, 2, 1],
-            background_line_style={"stroke_color": GRID_COLOR, "stroke_width": 1},
-            axis_config={"stroke_color": AXIS_COLOR, "stroke_width": 2},
-        ).scale(1.2)
-        cplane.add_coordinates()  # optional tick labels
+        @disk_cached  # the coordinate labels are MathTex: build them once
+        def complex_plane():
+            cplane = ComplexPlane(
+                x_range=[-3, 3, 1],
+                y_range=[-2, 2, 1],
+                background_line_style={"stroke_color": GRID_COLOR, "stroke_width": 1},
+                axis_config={"stroke_color": AXIS_COLOR, "stroke_width": 2},
+            ).scale(1.2)
+            cplane.add_coordinates()  # optional tick labels
+            return cplane
+        cplane = complex_plane()
+        share_points(cplane)  # FadeTransform/.animate copies share the label glyphs
         self.play(FadeTransform(plane, cplane), run_time=1.4)
 
         formula = MathTex(r"f(z)=z^2", color=TEXT).scale(0.9).to_corner(UR)
@@ -98,7 +110,7 @@ class HeavyMathShowcase(MovingCameraScene):
             z = complex(R*np.cos(angle), R*np.sin(angle))
             dot = Dot(cplane.n2p(z), radius=0.05, color=YELLOW)
             pts.add(dot)
-        self.play(FadeIn(pts, scale=0.8))
+        self.play(BatchedFadeIn(pts, scale=0.8))
 
         # Animate the domain warping
         def f(z: complex) -> complex:
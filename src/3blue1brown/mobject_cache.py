@@ -0,0 +1,152 @@
+"""Constructed static mobjects, cached on disk between renders.
+
+    plane = cached(NumberPlane, x_range=[-5, 5, 1], y_range=[-3, 3, 1])
+
+    @disk_cached
+    def ic_oort():
+        ...
+
+The first call builds the mobject and stores it under
+``<media_dir>/mobject_cache`` as two files: a pickle of the object graph
+(classes, style, submobject tree, attribute links such as ``plane.x_axis``)
+and one ``.bin`` holding every sizeable NumPy array (points, colours) as raw
+aligned bytes.  Later calls unpickle the small part and map the arrays
+copy-on-write from the ``.bin``, so pages load lazily and mutations stay
+private to the process.
+
+The key covers the factory (qualified name, source and closure values), the
+arguments, the manim version, the renderer and the point storage in force
+(``compact.py``), since a cached mobject bakes in all of them.  Whatever does not pickle (updaters,
+lambdas inside the mobject) is built normally every time.
+"""
+from __future__ import annotations
+
+import functools
+import hashlib
+import inspect
+import os
+import pickle
+from collections import Counter
+from pathlib import Path
+
+import numpy as np
+from manim import __version__ as MANIM_VERSION
+from manim import config, logger
+
+from compact import POINTS, compact_class, point_storage
+
+FORMAT = 1
+MIN_ARRAY_BYTES = 256  # smaller arrays stay inline in the pickle
+ALIGN = 64
+STATS = Counter()  # "hits" / "misses", read by render_metrics.py
+
+
+def cache_dir() -> Path:
+    return Path(config.media_dir) / "mobject_cache"
+
+
+def cache_key(factory, args: tuple, kwargs: dict) -> str:
+    parts = [FORMAT, MANIM_VERSION, str(config.renderer), point_storage(),
+             factory.__module__, factory.__qualname__, repr(args), repr(sorted(kwargs.items()))]
+    if inspect.isfunction(factory):
+        try:
+            parts.append(inspect.getsource(factory))
+        except OSError:
+            parts.append(factory.__code__.co_code.hex())
+        parts.extend(repr(cell.cell_contents) for cell in factory.__closure__ or ())
+    digest = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        digest.update(str(part).encode())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+# ---------- Format ----------
+class ArrayPickler(pickle.Pickler):
+    """Pickler that moves NumPy arrays into a side file of raw bytes."""
+
+    def __init__(self, file, blob):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.blob = blob
+        self.written = {}  # id -> (array, pid); keeps shared arrays shared
+
+    def persistent_id(self, obj):
+        if not isinstance(obj, np.ndarray) or obj.dtype.hasobject or obj.nbytes < MIN_ARRAY_BYTES:
+            return None
+        if id(obj) in self.written:
+            return self.written[id(obj)][1]
+        offset = (self.blob.tell() + ALIGN - 1) // ALIGN * ALIGN
+        self.blob.seek(offset)
+        self.blob.write(np.ascontiguousarray(obj).data)
+        pid = ("array", offset, obj.dtype.str, obj.shape)
+        self.written[id(obj)] = (obj, pid)
+        return pid
+
+    def reducer_override(self, obj):
+        if isinstance(obj, type) and obj.__dict__.get("points") is POINTS:
+            # compact.py subclasses are made at runtime; rebuild them by base
+            return compact_class, (obj.__base__, obj.flat_points)
+        return NotImplemented
+
+
+class ArrayUnpickler(pickle.Unpickler):
+    def __init__(self, file, blob_path: Path):
+        super().__init__(file)
+        self.blob = np.memmap(blob_path, mode="c") if blob_path.stat().st_size else None
+        self.loaded = {}
+
+    def persistent_load(self, pid):
+        _, offset, dtype, shape = pid
+        if offset not in self.loaded:
+            self.loaded[offset] = np.ndarray(shape, dtype, buffer=self.blob, offset=offset)
+        return self.loaded[offset]
+
+
+def store(mobject, path: Path) -> None:
+    """Write ``path.pkl`` and ``path.bin``; the pickle appears last."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    pkl, blob = path.with_suffix(".pkl"), path.with_suffix(".bin")
+    tmp_pkl, tmp_blob = (p.with_name(f"{p.name}.{os.getpid()}.tmp") for p in (pkl, blob))
+    try:
+        with open(tmp_blob, "wb") as blob_file, open(tmp_pkl, "wb") as pkl_file:
+            ArrayPickler(pkl_file, blob_file).dump(mobject)
+        os.replace(tmp_blob, blob)
+        os.replace(tmp_pkl, pkl)
+    finally:
+        for tmp in (tmp_pkl, tmp_blob):
+            tmp.unlink(missing_ok=True)
+
+
+def load(path: Path):
+    with open(path.with_suffix(".pkl"), "rb") as file:
+        return ArrayUnpickler(file, path.with_suffix(".bin")).load()
+
+
+# ---------- Entry points ----------
+def cached(factory, *args, **kwargs):
+    """``factory(*args, **kwargs)``, loaded from the disk cache when possible."""
+    path = cache_dir() / cache_key(factory, args, kwargs)
+    if path.with_suffix(".pkl").exists():
+        try:
+            mobject = load(path)
+            STATS["hits"] += 1
+            return mobject
+        except Exception as error:  # stale or truncated entry: rebuild it
+            logger.info("Rebuilding cached %s: %s", factory.__qualname__, error)
+    STATS["misses"] += 1
+    mobject = factory(*args, **kwargs)
+    try:
+        store(mobject, path)
+    except (pickle.PicklingError, AttributeError, TypeError) as error:
+        logger.info("Not caching %s: %s", factory.__qualname__, error)
+    return mobject
+
+
+def disk_cached(factory):
+    """Decorator form of ``cached``."""
+
+    @functools.wraps(factory)
+    def build(*args, **kwargs):
+        return cached(factory, *args, **kwargs)
+
+    return build
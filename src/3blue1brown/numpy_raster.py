@@ -0,0 +1,473 @@
+"""Rasterize dots, straight lines and upright rectangles with NumPy.
+
+Cairo rasterizes every ``VMobject`` through a general Bézier path, one
+mobject at a time: manim feeds it the curves from Python, sets the colour,
+fills and strokes.  Lattices of ``Dot``s, ``NumberPlane`` lines and bars
+(InflationGridIntro, ``griddie.ExpandingGrid``, ``cosmic_demo.ExpandingGrid``,
+``ScaleComparisons_NoTex``) are almost nothing but
+
+* circles: a filled ``Dot``, or a thin stroked ``Circle``,
+* straight lines with butt caps,
+* axis-aligned rectangles, filled and/or stroked with mitred corners.
+
+``NumpyRasterCamera`` recognizes these shapes from their points, all the
+mobjects of a frame with the same number of points at once (so a ``Dot``
+squashed into an ellipse, a rotated ``Square`` or a half-drawn ``Circle`` is
+not one), and draws them in batches.  A batch holds shapes whose pixel boxes
+do not overlap, so they can be composited at once and in any order: every
+pixel of every box goes into one flat array, the area of the pixel the shape
+covers is computed with vectorized half-plane formulas (curvature is ignored
+within a pixel), and colours are blended premultiplied, as Cairo does.
+Everything else (text, gradients, curves, round joins, long diagonal lines
+and large rings, which Cairo scans faster than a box of pixels) goes to
+Cairo in its place in the z-order, on the same frame buffer.
+
+    python render.py cosmic_inflation_intro.py InflationGridIntro -q k --numpy_raster
+
+Coverage follows the analytic pixel area, which Cairo approximates by
+sampling, so anti-aliased edges differ from Cairo's by a few levels out of
+255; interiors are identical.
+"""
+from __future__ import annotations
+
+import math
+from collections import Counter, defaultdict
+
+import numpy as np
+from manim import CairoRenderer, Camera, Circle, Line, Polygram, logger
+from manim.camera.three_d_camera import ThreeDCamera
+from manim.constants import CapStyleType, LineJointType
+
+BOX, CIRCLE, STRIP = range(3)
+TOL = 1e-2  # pixels; how far points may stray from the recognized shape
+NO_HOLE = (0, 0, 0, 0)
+
+
+# ---------- Coverage kernels ----------
+# Each kernel returns the covered fraction of the pixels centred at (px, py);
+# ``p`` holds the shape's parameters, scalars or arrays broadcast to px.
+def halfplane(d, u, v):
+    """Area of a unit pixel inside a half-plane whose edge is ``d`` past its centre.
+
+    ``u >= v`` are the absolute components of the unit edge normal.
+    """
+    e, w = (u - v) / 2, (u + v) / 2
+    t = np.maximum(w - np.abs(d), 0.0)
+    corner = t * t / (2 * u * np.maximum(v, 1e-12))
+    return np.where(np.abs(d) <= e, 0.5 + d / u, np.where(d > 0, 1 - corner, corner)).clip(0, 1)
+
+
+def span(c, low, high):
+    """Overlap of the unit pixel interval around ``c`` with ``[low, high]``."""
+    return (np.minimum(c + 0.5, high) - np.maximum(c - 0.5, low)).clip(0, 1)
+
+
+def box_coverage(p, px, py):
+    """Box ``p[0:4]`` minus the box ``p[4:8]`` (a stroked rectangle's inside)."""
+    coverage = span(px, p[0], p[2]) * span(py, p[1], p[3])
+    if np.any(np.asarray(p[6]) > np.asarray(p[4])):
+        coverage = coverage - span(px, p[4], p[6]) * span(py, p[5], p[7])
+    return coverage
+
+
+def circle_coverage(p, px, py):
+    """Disk of radius ``p[2]`` around ``p[0:2]`` minus the disk of radius ``p[3]``."""
+    dx, dy = px - p[0], py - p[1]
+    d = np.hypot(dx, dy)
+    safe = np.maximum(d, 1e-12)
+    ax, ay = np.abs(dx) / safe, np.abs(dy) / safe
+    u = np.where(d > 0, np.maximum(ax, ay), 1.0)
+    v = np.minimum(ax, ay)
+    coverage = halfplane(p[2] - d, u, v)
+    if np.any(np.asarray(p[3]) > 0):
+        coverage = coverage - halfplane(p[3] - d, u, v)
+    return coverage
+
+
+def strip_coverage(p, px, py):
+    """Segment from ``p[0:2]`` along unit ``p[2:4]``, ``p[4]`` long and ``2 * p[5]`` wide."""
+    dx, dy = px - p[0], py - p[1]
+    along = dx * p[2] + dy * p[3]
+    across = dy * p[2] - dx * p[3]
+    u = np.maximum(np.abs(p[2]), np.abs(p[3]))
+    v = np.minimum(np.abs(p[2]), np.abs(p[3]))
+    return ((halfplane(p[5] - across, u, v) - halfplane(-p[5] - across, u, v))
+            * (halfplane(along, u, v) - halfplane(along - p[4], u, v)))
+
+
+KERNELS = {BOX: box_coverage, CIRCLE: circle_coverage, STRIP: strip_coverage}
+
+
+# ---------- Shape recognition ----------
+# Every function takes (G, m, 4, 2) pixel-space cubic curves, one path per
+# row, and returns a validity mask with the shape's parameters.
+def connected(curves: np.ndarray, closed: bool) -> np.ndarray:
+    """Single subpath, closed or open."""
+    gaps = np.abs(curves[:, 1:, 0] - curves[:, :-1, 3]).max(axis=(1, 2), initial=0.0)
+    ends = np.abs(curves[:, -1, 3] - curves[:, 0, 0]).max(axis=1)
+    return (gaps <= TOL) & ((ends <= TOL) == closed)
+
+
+def straight(curves: np.ndarray) -> np.ndarray:
+    """Every curve runs along its chord."""
+    chord = curves[:, :, 3] - curves[:, :, 0]
+    offsets = curves[:, :, 1:3] - curves[:, :, :1]
+    cross = chord[:, :, None, 0] * offsets[..., 1] - chord[:, :, None, 1] * offsets[..., 0]
+    length = np.hypot(chord[..., 0], chord[..., 1])[..., None]
+    bent = np.abs(cross) > TOL * np.maximum(length, 1.0)
+    loose = (length <= TOL) & (np.abs(offsets).max(axis=-1) > TOL)  # handles of a point
+    return ~(bent | loose).any(axis=(1, 2))
+
+
+def circles(curves: np.ndarray):
+    """Anchors and curve midpoints all on one circle: (valid, center, radius)."""
+    anchors = curves[:, :, 0]
+    center = anchors.mean(axis=1)
+    mids = (anchors + 3 * curves[:, :, 1] + 3 * curves[:, :, 2] + curves[:, :, 3]) / 8
+    offsets = np.concatenate((anchors, mids), axis=1) - center[:, None]
+    radii = np.hypot(offsets[..., 0], offsets[..., 1])
+    r = radii.mean(axis=1)
+    valid = (np.ptp(radii, axis=1) <= TOL + 1e-4 * r) & (curves.shape[1] >= 4)
+    return valid & connected(curves, closed=True), center, r
+
+
+def rects(curves: np.ndarray):
+    """Four straight, upright edges around four corners: (valid, low, high)."""
+    anchors = curves[:, :, 0]
+    low, high = anchors.min(axis=1), anchors.max(axis=1)
+    near_low = np.abs(anchors - low[:, None]) <= TOL
+    near_high = np.abs(anchors - high[:, None]) <= TOL
+    chord = np.abs(curves[:, :, 3] - curves[:, :, 0])
+    edges = (chord.max(axis=-1) > TOL).sum(axis=1)
+    upright = (chord.min(axis=-1) <= TOL).all(axis=1)
+    codes = near_high[..., 0] & ~near_low[..., 0] | (near_high[..., 1] & ~near_low[..., 1]) << 1
+    seen = np.zeros((len(curves), 4), bool)
+    seen[np.arange(len(curves))[:, None], codes] = True
+    valid = ((near_low | near_high).all(axis=(1, 2)) & upright & (edges == 4) & seen.all(axis=1)
+             & straight(curves) & connected(curves, closed=True))
+    return valid, low, high
+
+
+def segments(curves: np.ndarray):
+    """Straight, monotonic open paths: (valid, start, unit direction, length)."""
+    start, end = curves[:, 0, 0], curves[:, -1, 3]
+    length = np.hypot(*(end - start).T)
+    direction = (end - start) / np.maximum(length, 1e-12)[:, None]
+    direction[length <= TOL] = (1.0, 0.0)
+    offsets = curves.reshape(len(curves), -1, 2) - start[:, None]
+    along = np.einsum("gnk,gk->gn", offsets, direction)
+    across = offsets[..., 1] * direction[:, None, 0] - offsets[..., 0] * direction[:, None, 1]
+    valid = ((np.abs(across).max(axis=1) <= TOL)
+             & (np.diff(along[:, ::4], axis=1) >= -TOL).all(axis=1)
+             & (along.min(axis=1) >= -TOL) & (along.max(axis=1) <= length + TOL))
+    return valid & connected(curves, closed=False), start, direction, length
+
+
+# ---------- Batches ----------
+def _regions(op: tuple):
+    """(y0, y1, x0, x1) pixel slices of an op's box, without its hole."""
+    _, x0, y0, x1, y1, _, _, (hx0, hy0, hx1, hy1) = op
+    if hx1 <= hx0 or hy1 <= hy0:
+        yield y0, y1, x0, x1
+        return
+    yield y0, hy0, x0, x1
+    yield hy1, y1, x0, x1
+    yield hy0, hy1, x0, hx0
+    yield hy0, hy1, hx1, x1
+
+
+def _blend(dst: np.ndarray, alpha: np.ndarray, rgba: np.ndarray) -> None:
+    """Premultiplied ``over`` of ``rgba`` at ``alpha`` onto uint8 RGBA ``dst``, in place."""
+    alpha = np.asarray(alpha, np.float32)
+    source = np.asarray(rgba, np.float32) * 255
+    source[..., 3] = 255
+    dst[...] = np.minimum(source * alpha + dst * (1 - alpha) + 0.5, 255)
+
+
+class RasterBatch:
+    """Shapes with pairwise disjoint pixel boxes, composited in one pass."""
+
+    small = 1 << 14  # pixels; larger boxes are drawn one by one on views
+
+    def __init__(self, pixel_array: np.ndarray, mask: np.ndarray):
+        self.pixel_array = pixel_array
+        self.mask = mask  # pixels claimed by the pending shapes
+        self.ops: list[tuple] = []
+
+    def add(self, op: tuple) -> None:
+        regions = list(_regions(op))
+        if any(self.mask[y0:y1, x0:x1].any() for y0, y1, x0, x1 in regions):
+            self.flush()  # overlaps a pending shape, which must go first
+        for y0, y1, x0, x1 in regions:
+            self.mask[y0:y1, x0:x1] = True
+        self.ops.append(op)
+
+    def flush(self) -> bool:
+        if not self.ops:
+            return False
+        small = []
+        for op in self.ops:
+            for y0, y1, x0, x1 in _regions(op):
+                self.mask[y0:y1, x0:x1] = False
+            if op[7] == NO_HOLE and (op[3] - op[1]) * (op[4] - op[2]) <= self.small:
+                small.append(op)
+            else:
+                self.draw_large(op)
+        self.ops.clear()
+        if small:
+            self.draw_small(small)
+        return True
+
+    def draw_large(self, op: tuple) -> None:
+        kind, rgba, params = op[0], np.array(op[5]), np.array(op[6], np.float32)
+        for y0, y1, x0, x1 in _regions(op):
+            if y1 <= y0 or x1 <= x0:
+                continue
+            px = np.arange(x0, x1, dtype=np.float32) + 0.5
+            py = (np.arange(y0, y1, dtype=np.float32) + 0.5)[:, None]
+            coverage = np.broadcast_to(KERNELS[kind](params, px, py), (y1 - y0, x1 - x0))
+            _blend(self.pixel_array[y0:y1, x0:x1], coverage[..., None] * rgba[3], rgba)
+
+    def draw_small(self, ops: list[tuple]) -> None:
+        groups = defaultdict(list)  # disjoint, so any order will do
+        for op in ops:
+            groups[op[0], op[3] - op[1], op[4] - op[2]].append(op)
+        frame = self.pixel_array.view(np.uint32).reshape(-1)  # one RGBA pixel per item
+        for (kind, w, h), group in groups.items():
+            origin = np.array([op[1:3] for op in group], np.int32)
+            x = origin[:, 0, None, None] + np.arange(w, dtype=np.int32)
+            y = origin[:, 1, None, None] + np.arange(h, dtype=np.int32)[:, None]
+            # pixel coordinates fit float32, which halves the memory traffic
+            params = np.array([op[6] for op in group], np.float32).T[..., None, None]
+            coverage = KERNELS[kind](params, x.astype(np.float32) + 0.5, y.astype(np.float32) + 0.5)
+            coverage = np.broadcast_to(coverage, (len(group), h, w))
+            # Sampling at pixel centres misjudges the area of dots a pixel or
+            # two across; rescale those to their exact area, as Cairo's is.
+            exact = params[8, :, 0, 0]
+            if exact.any():
+                drawn = coverage.sum(axis=(1, 2))
+                coverage = coverage * np.where(exact > 0, exact / np.maximum(drawn, 1e-12), 1)[:, None, None]
+
+            index = y * self.pixel_array.shape[1] + x
+            pixels = frame[index].view(np.uint8).reshape(len(group), h, w, 4)
+            rgba = np.array([op[5] for op in group], np.float32)[:, None, None]
+            _blend(pixels, coverage[..., None] * rgba[..., 3:], rgba)
+            frame[index] = pixels.view(np.uint32).reshape(index.shape)
+
+
+# ---------- Camera ----------
+class NumpyRasterCamera(Camera):
+    """Draws circles, straight lines and upright rectangles without Cairo.
+
+    Combine with another camera class through ``wrapping``.
+    """
+
+    max_waste = 8  # box pixels per inked pixel beyond which Cairo draws the shape
+
+    @classmethod
+    def wrapping(cls, camera_class) -> type:
+        if issubclass(camera_class, (cls, ThreeDCamera)):  # ThreeDCamera projects points
+            return camera_class
+        return type(camera_class.__name__, (cls, camera_class), {})
+
+    def display_multiple_non_background_colored_vmobjects(self, vmobjects, pixel_array):
+        vmobjects = list(vmobjects)  # an itertools.groupby group
+        square = abs(self.pixel_width / self.frame_width - self.pixel_height / self.frame_height)
+        if (pixel_array.dtype != np.uint8 or not pixel_array.flags.c_contiguous
+                or square > 1e-9 * self.pixel_width):
+            return super().display_multiple_non_background_colored_vmobjects(vmobjects, pixel_array)
+        if not hasattr(self, "raster_counts"):
+            self.raster_counts = Counter()
+        mask = getattr(self, "raster_mask", None)
+        if mask is None or mask.shape != pixel_array.shape[:2]:
+            mask = self.raster_mask = np.zeros(pixel_array.shape[:2], bool)
+
+        plans = self.plan(vmobjects, pixel_array.shape)
+        batch = RasterBatch(pixel_array, mask)
+        ctx = None
+        cairo_drew = False
+        for vmobject, ops in zip(vmobjects, plans):
+            if ops is None:
+                self.raster_counts["cairo"] += 1
+                numpy_drew = batch.flush()
+                if ctx is None:
+                    ctx = self.get_cairo_context(pixel_array)
+                if numpy_drew:
+                    ctx.get_target().mark_dirty()
+                self.display_vectorized(vmobject, ctx)
+                cairo_drew = True
+                continue
+            self.raster_counts["numpy"] += 1
+            if cairo_drew:
+                ctx.get_target().flush()
+                cairo_drew = False
+            for op in ops:
+                batch.add(op)
+        if batch.flush() and ctx is not None:
+            ctx.get_target().mark_dirty()
+
+    # ---------- Recognition ----------
+    def plan(self, vmobjects, shape: tuple) -> list[list[tuple] | None]:
+        """Raster ops drawing each vmobject as Cairo would; None where Cairo must draw."""
+        plans: list[list[tuple] | None] = [None] * len(vmobjects)
+        styles = {}
+        groups = defaultdict(list)  # (class, number of points) -> indices
+        for i, vmobject in enumerate(vmobjects):
+            points = vmobject.points
+            if len(points) == 0:
+                plans[i] = []
+                continue
+            style = self.style(vmobject)
+            if style is None or len(points) % 4:
+                continue
+            styles[i] = style
+            kind = Line if isinstance(vmobject, Line) else Circle if isinstance(vmobject, Circle) else Polygram
+            groups[kind, len(points)].append(i)
+
+        scale = self.pixel_width / self.frame_width
+        center = np.asarray(self.frame_center)[:2]
+        for (kind, n), indices in groups.items():
+            points = np.stack([vmobjects[i].points[:, :2] for i in indices])
+            pixels = (points - center) * scale
+            pixels[..., 0] += self.pixel_width / 2
+            pixels[..., 1] = self.pixel_height / 2 - pixels[..., 1]
+            curves = pixels.reshape(len(indices), n // 4, 4, 2)
+            if kind is Line:
+                shapes = self.line_ops(curves, [styles[i] for i in indices])
+            elif kind is Circle:
+                shapes = self.circle_ops(curves, [styles[i] for i in indices])
+            else:
+                shapes = self.rect_ops(curves, [styles[i] for i in indices])
+            for i, ops in zip(indices, shapes):
+                plans[i] = ops if ops is None else self.clipped(ops, shape)
+        return plans
+
+    def style(self, vmobject):
+        """(fill rgba or None, stroke rgba or None, stroke half width in pixels)."""
+        if not isinstance(vmobject, (Circle, Line, Polygram)):
+            return None
+        if vmobject.get_stroke_width(background=True) > 0 or vmobject.get_sheen_factor():
+            return None
+        fill, stroke = vmobject.get_fill_rgbas(), vmobject.get_stroke_rgbas()
+        width = vmobject.get_stroke_width()
+        if len(fill) != 1 or len(stroke) != 1:  # gradients
+            return None
+        if isinstance(vmobject, Polygram) and vmobject.joint_type not in (LineJointType.AUTO, LineJointType.MITER):
+            return None
+        if isinstance(vmobject, Line) and vmobject.cap_style not in (CapStyleType.AUTO, CapStyleType.BUTT):
+            return None
+        if not np.all(np.isfinite(vmobject.points)):
+            return None
+        fill = tuple(fill[0]) if fill[0, 3] > 0 else None
+        stroke = tuple(stroke[0]) if stroke[0, 3] > 0 and width > 0 else None
+        half = width * self.cairo_line_width_multiple * self.pixel_width / self.frame_width / 2
+        return fill, stroke, half
+
+    @staticmethod
+    def line_ops(curves, styles):
+        valid, start, direction, length = segments(curves)
+        for g, (_, stroke, half) in enumerate(styles):
+            if not valid[g]:
+                yield None
+            elif stroke is None or length[g] <= TOL:  # an open straight path has no area
+                yield []
+            else:
+                (x0, y0), (ux, uy), span_ = start[g], direction[g], length[g]
+                x1, y1 = x0 + ux * span_, y0 + uy * span_
+                ink = (span_ + 2) * (2 * half + 2)
+                if abs(uy) * span_ <= TOL or abs(ux) * span_ <= TOL:  # upright: exact box
+                    lx, hx = (min(x0, x1), max(x0, x1)) if abs(uy) * span_ <= TOL else (x0 - half, x0 + half)
+                    ly, hy = (min(y0, y1), max(y0, y1)) if abs(ux) * span_ <= TOL else (y0 - half, y0 + half)
+                    yield [(BOX, (lx, ly, hx, hy), stroke, (lx, ly, hx, hy), ink)]
+                else:
+                    box = (min(x0, x1) - half, min(y0, y1) - half, max(x0, x1) + half, max(y0, y1) + half)
+                    yield [(STRIP, box, stroke, (x0, y0, ux, uy, span_, half), ink)]
+
+    @staticmethod
+    def circle_ops(curves, styles):
+        valid, center, radius = circles(curves)
+        for g, (fill, stroke, half) in enumerate(styles):
+            if not valid[g]:
+                yield None
+                continue
+            (cx, cy), r = center[g], radius[g]
+            ops = []
+            if fill is not None:
+                exact = np.pi * r * r if r < 2 else 0.0
+                ops.append((CIRCLE, (cx - r, cy - r, cx + r, cy + r), fill,
+                            (cx, cy, r, 0.0), np.pi * (r + 1) ** 2, exact))
+            if stroke is not None:
+                outer = r + half
+                ops.append((CIRCLE, (cx - outer, cy - outer, cx + outer, cy + outer), stroke,
+                            (cx, cy, outer, r - half), 2 * np.pi * (r + 1) * (2 * half + 2)))
+            yield ops
+
+    @staticmethod
+    def rect_ops(curves, styles):
+        valid, low, high = rects(curves)
+        for g, (fill, stroke, half) in enumerate(styles):
+            if not valid[g]:
+                yield None
+                continue
+            (x0, y0), (x1, y1) = low[g], high[g]
+            ops = []
+            if fill is not None:
+                ops.append((BOX, (x0, y0, x1, y1), fill, (x0, y0, x1, y1), (x1 - x0 + 2) * (y1 - y0 + 2)))
+            if stroke is not None:
+                if min(x1 - x0, y1 - y0) <= TOL:  # Cairo bevels the folded-back path
+                    yield None
+                    continue
+                outer = (x0 - half, y0 - half, x1 + half, y1 + half)
+                inner = (x0 + half, y0 + half, x1 - half, y1 - half)
+                ink = (x1 - x0 + y1 - y0 + 4) * 2 * (2 * half + 2)
+                ops.append((BOX, outer, stroke, outer + inner, ink, 0.0, inner))
+            yield ops
+
+    def clipped(self, shapes, shape: tuple) -> list[tuple] | None:
+        """Ops on integer pixel boxes; None when a box would be mostly empty."""
+        height, width = shape[:2]
+        ops = []
+        for kind, (lx, ly, hx, hy), rgba, params, ink, *extra in shapes:
+            exact = extra[0] if extra else 0.0
+            # boxes sized by the extent alone, so equal shapes batch together
+            x0, y0 = math.floor(lx) - 1, math.floor(ly) - 1
+            x1, y1 = x0 + math.ceil(hx - lx) + 3, y0 + math.ceil(hy - ly) + 3
+            if x0 < 0 or y0 < 0 or x1 > width or y1 > height:
+                exact = 0.0  # cut by the frame edge: no area to match
+                x0, y0, x1, y1 = max(x0, 0), max(y0, 0), min(x1, width), min(y1, height)
+            if x1 <= x0 or y1 <= y0:
+                continue  # off screen
+            hole = NO_HOLE
+            if len(extra) > 1:  # pixels wholly inside the inner box see nothing
+                ix0, iy0, ix1, iy1 = extra[1]
+                hole = (max(math.ceil(ix0), x0), max(math.ceil(iy0), y0),
+                        min(math.floor(ix1), x1), min(math.floor(iy1), y1))
+            area = (x1 - x0) * (y1 - y0) - max(hole[2] - hole[0], 0) * max(hole[3] - hole[1], 0)
+            if area > self.max_waste * ink + 64:
+                return None  # long diagonal lines, large rings: Cairo scans them faster
+            params = (*params, *(0.0,) * (8 - len(params)), exact)
+            ops.append((kind, x0, y0, x1, y1, rgba, params, hole))
+        return ops
+
+
+class NumpyRasterRenderer(CairoRenderer):
+    """Renders with ``NumpyRasterCamera`` around the scene's camera class.
+
+    Combine with another renderer through ``wrapping``.
+    """
+
+    @classmethod
+    def wrapping(cls, renderer_class) -> type:
+        return type(renderer_class.__name__, (cls, renderer_class), {})
+
+    def __init__(self, file_writer_class=None, camera_class=None, **kwargs):
+        if file_writer_class is not None:
+            kwargs["file_writer_class"] = file_writer_class
+        super().__init__(camera_class=NumpyRasterCamera.wrapping(camera_class or Camera), **kwargs)
+
+    def scene_finished(self, scene) -> None:
+        counts = getattr(self.camera, "raster_counts", None)
+        if counts:
+            logger.info("NumPy rasterized %i of %i vmobject draws",
+                        counts["numpy"], counts["numpy"] + counts["cairo"])
+        super().scene_finished(scene)
@@ -0,0 +1,167 @@
+"""Scene file writer that keeps encoding off the render thread.
+
+Stock manim starts a writer thread per ``self.play`` but opens the container,
+flushes the encoder and closes the file on the render thread, with an
+unbounded queue in between.  Here one long-lived encoder thread owns the
+containers and takes frames from a bounded queue, so rasterizing the next
+frame overlaps with encoding and disk I/O of the previous ones, and memory
+stays flat on 2160p renders.
+
+With caching disabled there is nothing to reuse between runs, so frames are
+streamed straight into the final movie instead of partial files that would be
+concatenated (and re-read) afterwards.
+"""
+from __future__ import annotations
+
+from pathlib import Path
+from queue import Queue
+from threading import Thread
+
+import av
+from manim import SceneFileWriter, config, logger
+from manim.scene.scene_file_writer import to_av_frame_rate
+from manim.utils.file_ops import is_gif_format, is_png_format, write_to_movie
+from PIL import Image
+
+# Control messages share the (num_frames, payload) tuples of regular frames.
+_OPEN, _CLOSE, _STOP = -1, -2, -3
+
+
+def open_video_container(file_path, width: int, height: int, frame_rate: float):
+    """Same codec choices as ``SceneFileWriter.open_partial_movie_stream``."""
+    codec, pix_fmt = "libx264", "yuv420p"
+    av_options = {"an": "1", "crf": "23"}
+    if config.movie_file_extension == ".webm":
+        codec = "libvpx-vp9"
+        av_options["-auto-alt-ref"] = "1"
+        if config.transparent:
+            pix_fmt = "yuva420p"
+    elif config.transparent:
+        codec, pix_fmt = "qtrle", "argb"
+
+    container = av.open(str(file_path), mode="w")
+    stream = container.add_stream(codec, rate=to_av_frame_rate(frame_rate), options=av_options)
+    stream.pix_fmt = pix_fmt
+    stream.width = width
+    stream.height = height
+    return container, stream
+
+
+class PipelinedFileWriter(SceneFileWriter):
+    queue_size = 8
+
+    def __init__(self, renderer, scene_name, **kwargs):
+        super().__init__(renderer, scene_name, **kwargs)
+        self.stream_direct = (
+            config.disable_caching and not config.save_sections and not is_gif_format()
+        )
+        self.encoder_thread: Thread | None = None
+        self.encoder_error: BaseException | None = None
+        self.direct_opened = False
+
+    @classmethod
+    def with_queue_size(cls, queue_size: int) -> type[PipelinedFileWriter]:
+        return type(cls.__name__, (cls,), {"queue_size": queue_size})
+
+    # ---------- Render thread side ----------
+    def submit(self, num_frames: int, payload) -> None:
+        if self.encoder_error is not None:
+            raise RuntimeError("encoder thread failed") from self.encoder_error
+        if self.encoder_thread is None:
+            self.queue: Queue = Queue(maxsize=self.queue_size)
+            self.encoder_thread = Thread(target=self.listen_and_write, daemon=True)
+            self.encoder_thread.start()
+        self.queue.put((num_frames, payload))
+
+    def begin_animation(self, allow_write: bool = False, file_path=None) -> None:
+        if not (write_to_movie() and allow_write):
+            return
+        if self.stream_direct:
+            if not self.direct_opened:
+                self.submit(_OPEN, self.movie_file_path)
+                self.direct_opened = True
+            return
+        if file_path is None:
+            file_path = self.partial_movie_files[self.renderer.num_plays]
+        self.submit(_OPEN, file_path)
+
+    def end_animation(self, allow_write: bool = False) -> None:
+        # Closing (encoder flush + moov write) happens on the encoder thread.
+        if write_to_movie() and allow_write and not self.stream_direct:
+            self.submit(_CLOSE, None)
+
+    def write_frame(self, frame_or_renderer, num_frames: int = 1):
+        if write_to_movie():
+            self.submit(num_frames, frame_or_renderer)
+        if is_png_format() and not config["dry_run"]:
+            target_dir = self.image_file_path.parent / self.image_file_path.stem
+            self.output_image(
+                Image.fromarray(frame_or_renderer),
+                target_dir,
+                self.image_file_path.suffix,
+                config["zero_pad"],
+            )
+
+    def drain(self) -> None:
+        """Wait until every queued frame is encoded and every file is closed."""
+        if self.encoder_thread is None:
+            return
+        if self.stream_direct and self.direct_opened:
+            self.queue.put((_CLOSE, None))
+        self.queue.put((_STOP, None))
+        self.encoder_thread.join()
+        self.encoder_thread = None
+        if self.encoder_error is not None:
+            raise RuntimeError("encoder thread failed") from self.encoder_error
+
+    def finish(self) -> None:
+        self.drain()
+        if not (self.stream_direct and write_to_movie()):
+            super().finish()
+            return
+        if self.includes_sound:
+            # The audio has to be muxed in; let the stock code remux the one file.
+            stream_path = self.movie_file_path.with_name(
+                f"{self.movie_file_path.stem}_stream{self.movie_file_path.suffix}"
+            )
+            Path(self.movie_file_path).replace(stream_path)
+            self.partial_movie_files = [str(stream_path)]
+            self.combine_to_movie()
+            stream_path.unlink()
+        else:
+            self.print_file_ready_message(str(self.movie_file_path))
+        if self.subcaptions:
+            self.write_subcaption_file()
+
+    # ---------- Encoder thread side ----------
+    def listen_and_write(self):
+        try:
+            while True:
+                num_frames, payload = self.queue.get()
+                if num_frames == _STOP:
+                    break
+                if num_frames == _OPEN:
+                    self.open_container(payload)
+                elif num_frames == _CLOSE:
+                    self.close_container()
+                else:
+                    self.encode_and_write_frame(payload, num_frames)
+        except BaseException as error:  # surfaced on the render thread
+            self.encoder_error = error
+            # keep consuming so the render thread never blocks on a full queue
+            while self.queue.get()[0] != _STOP:
+                pass
+
+    def open_container(self, file_path) -> None:
+        self.partial_movie_file_path = file_path
+        self.video_container, self.video_stream = open_video_container(
+            file_path, config.pixel_width, config.pixel_height, config.frame_rate
+        )
+
+    def close_container(self) -> None:
+        for packet in self.video_stream.encode():
+            self.video_container.mux(packet)
+        self.video_container.close()
+        logger.info(
+            "Movie file written in %(path)s", {"path": f"'{self.partial_movie_file_path}'"}
+        )
@@ -0,0 +1,387 @@
+"""Scrub through a scene in the browser while tuning its timing.
+
+    python preview_server.py inflation_timeline.py TimelineZoomInflation
+    # open http://127.0.0.1:50608/ and drag the slider (arrow keys step a frame)
+
+Frames are rendered on demand at a small size (270p, 15 fps by default) in
+windows of a couple of seconds around the requested time: a window is one
+pass of ``construct()`` with the plays before it skipped (``checkpoints.
+FrameRenderer``), so a moment ten minutes in costs about as much as the first
+one.  Finished frames go to a size-bounded LRU of PNGs in memory, backed by a
+size-bounded LRU on disk under ``<media_dir>/preview_cache``.  While you look
+at a frame, spare cores render the windows after (and just before) it.
+
+Every job runs in a fresh child process, so saving the scene file -- or any
+helper module next to it -- is picked up by the next request: the cache is
+keyed by the modification times of the ``.py`` files in the scene's folder,
+and the viewer reloads the frame it shows.
+"""
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import multiprocessing
+import os
+import traceback
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from itertools import count
+from pathlib import Path
+from queue import PriorityQueue
+from threading import Event, Lock, Thread
+from urllib.parse import parse_qs, urlparse
+
+HOST = "127.0.0.1"
+DEFAULT_PORT = 50608
+
+
+# ---------- Frame cache ----------
+class FrameCache:
+    """PNG bytes by (version, frame index): memory LRU in front of a disk LRU."""
+
+    def __init__(self, directory: Path, memory_bytes: int, disk_bytes: int, on_evict=None):
+        self.directory = Path(directory)
+        self.on_evict = on_evict  # called with (version, index) of frames gone from disk
+        self.memory_bytes, self.disk_bytes = memory_bytes, disk_bytes
+        self.memory: OrderedDict[tuple, bytes] = OrderedDict()
+        self.memory_used = 0
+        self.disk: OrderedDict[Path, int] = OrderedDict()  # least recently used first
+        self.disk_used = 0
+        self.lock = Lock()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        files = [(p.stat().st_mtime, p) for p in self.directory.glob("*/*.png")]
+        for _, path in sorted(files):  # earlier runs, oldest first
+            self.add_file(path)
+
+    def path(self, version: str, index: int) -> Path:
+        return self.directory / version / f"{index:06d}.png"
+
+    def __contains__(self, key: tuple) -> bool:
+        with self.lock:
+            return key in self.memory or self.path(*key) in self.disk
+
+    def get(self, version: str, index: int) -> bytes | None:
+        key, path = (version, index), self.path(version, index)
+        with self.lock:
+            if key in self.memory:
+                self.memory.move_to_end(key)
+                return self.memory[key]
+            if path not in self.disk:
+                return None
+            self.disk.move_to_end(path)
+        try:
+            data = path.read_bytes()
+        except OSError:  # removed behind our back
+            with self.lock:
+                self.disk_used -= self.disk.pop(path, 0)
+            self.evicted([path])
+            return None
+        with self.lock:
+            self.memory[key] = data
+            self.memory_used += len(data)
+            while self.memory_used > self.memory_bytes and len(self.memory) > 1:
+                self.memory_used -= len(self.memory.popitem(last=False)[1])
+        return data
+
+    def add_file(self, path: Path) -> None:
+        """Register a frame a worker wrote; evicts the least recently used."""
+        size = path.stat().st_size
+        removed = []
+        with self.lock:
+            self.disk_used += size - self.disk.pop(path, 0)
+            self.disk[path] = size
+            while self.disk_used > self.disk_bytes and len(self.disk) > 1:
+                old, old_size = self.disk.popitem(last=False)
+                self.disk_used -= old_size
+                old.unlink(missing_ok=True)
+                removed.append(old)
+        self.evicted(removed)
+
+    def evicted(self, paths) -> None:
+        if self.on_evict is not None:
+            for path in paths:
+                self.on_evict(path.parent.name, int(path.stem))
+
+
+# ---------- Worker processes ----------
+def render_frames(file, scene_name: str, indices: list[int], fps: int, height: int,
+                  directory: Path, media_dir: str | None) -> float:
+    """Write the frames at ``index / fps`` as PNGs; returns the scene time reached.
+
+    Without indices the whole scene is skipped through, giving its duration.
+    """
+    from checkpoints import FrameRenderer
+    from PIL import Image
+    from render import render_scene
+
+    times = [index / fps for index in indices]
+    scene = render_scene(
+        file, scene_name, "l", media_dir,
+        renderer_class=FrameRenderer.at(*times),
+        pixel_height=height, pixel_width=round(height * 16 / 9) // 2 * 2, frame_rate=fps,
+        write_to_movie=False, save_last_frame=False, disable_caching=True,
+    )
+    directory.mkdir(parents=True, exist_ok=True)
+    for index, t in zip(indices, times):
+        path = directory / f"{index:06d}.png"
+        tmp = path.with_name(f".{path.name}.{os.getpid()}")
+        Image.fromarray(scene.renderer.frames[t]).save(tmp, format="PNG", compress_level=1)
+        os.replace(tmp, path)
+    return scene.renderer.time
+
+
+def _child(send, function, args) -> None:
+    try:
+        send.send((True, function(*args)))
+    except BaseException:
+        send.send((False, traceback.format_exc()))
+
+
+def in_child(function, *args):
+    """``function(*args)`` in a new process forked from this warm one."""
+    methods = multiprocessing.get_all_start_methods()
+    context = multiprocessing.get_context("fork" if "fork" in methods else None)
+    receive, send = context.Pipe(duplex=False)
+    child = context.Process(target=_child, args=(send, function, args), daemon=True)
+    child.start()
+    send.close()
+    try:
+        ok, value = receive.recv()
+    except EOFError:
+        ok, value = False, "preview worker died"
+    finally:
+        child.join()
+    if not ok:
+        raise RuntimeError(value)
+    return value
+
+
+# ---------- Server ----------
+class PreviewServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, file, scene_name: str, port: int = DEFAULT_PORT, height: int = 270,
+                 fps: int = 15, window: float = 2.0, prefetch: int = 3, workers: int | None = None,
+                 memory_mb: int = 256, disk_mb: int = 2048, media_dir: str | None = None):
+        super().__init__((HOST, port), PreviewHandler)
+        self.file, self.scene_name = Path(file).resolve(), scene_name
+        self.height, self.fps, self.media_dir = height, fps, media_dir
+        self.window = max(1, round(window * fps))  # frames per render job
+        self.prefetch = prefetch
+        root = Path(media_dir or "media") / "preview_cache"
+        self.cache = FrameCache(root, memory_mb << 20, disk_mb << 20, on_evict=self.forget)
+        self.durations: dict[str, float] = {}
+        self.errors: dict[tuple, str] = {}
+        self.jobs: dict[tuple, Event] = {}  # (version, window) -> done
+        self.running: set[tuple] = set()
+        self.queue: PriorityQueue = PriorityQueue()
+        self.order = count()
+        self.lock = Lock()
+        for _ in range(workers or max(1, (os.cpu_count() or 2) - 1)):
+            Thread(target=self.work, daemon=True).start()
+
+    def version(self) -> str:
+        """Changes whenever a ``.py`` file next to the scene is saved."""
+        digest = hashlib.blake2b(digest_size=6)
+        digest.update(f"{self.scene_name}|{self.height}|{self.fps}".encode())
+        for path in sorted(self.file.parent.glob("*.py")):
+            stat = path.stat()
+            digest.update(f"{path.name}|{stat.st_mtime_ns}|{stat.st_size}".encode())
+        return digest.hexdigest()
+
+    def schedule(self, version: str, window, priority: float) -> Event:
+        with self.lock:
+            done = self.jobs.get((version, window))
+            if done is None:
+                done = self.jobs[(version, window)] = Event()
+            if not done.is_set():  # a repeat with better priority jumps the queue
+                self.queue.put((priority, next(self.order), version, window))
+        return done
+
+    def forget(self, version: str, index: int) -> None:
+        """A frame left the disk cache: its window renders again when asked for."""
+        with self.lock:
+            job = (version, index // self.window)
+            done = self.jobs.get(job)
+            if done is not None and done.is_set():
+                del self.jobs[job]
+
+    def work(self) -> None:
+        while True:
+            _, _, version, window = self.queue.get()
+            job = (version, window)
+            with self.lock:
+                done = self.jobs.get(job)
+                if done is None or done.is_set() or job in self.running:
+                    continue
+                self.running.add(job)
+            try:
+                if version != self.version():
+                    continue  # the scene was edited while this waited
+                if window == "duration":
+                    self.durations[version] = self.render_duration(version)
+                else:
+                    self.render_window(version, window)
+            except Exception as error:
+                self.errors[job] = str(error)
+            finally:
+                with self.lock:
+                    self.running.discard(job)
+                done.set()
+
+    def render_duration(self, version: str) -> float:
+        return in_child(render_frames, self.file, self.scene_name, [], self.fps, self.height,
+                        self.cache.directory / version, self.media_dir)
+
+    def render_window(self, version: str, window: int) -> None:
+        indices = [i for i in range(window * self.window, (window + 1) * self.window)
+                   if (version, i) not in self.cache]
+        duration = self.durations.get(version)
+        if duration is not None:
+            indices = [i for i in indices if i <= duration * self.fps]
+        if not indices:
+            return
+        directory = self.cache.directory / version
+        in_child(render_frames, self.file, self.scene_name, indices, self.fps, self.height,
+                 directory, self.media_dir)
+        for index in indices:
+            self.cache.add_file(directory / f"{index:06d}.png")
+
+    def frame(self, t: float) -> bytes:
+        version = self.version()
+        self.schedule(version, "duration", 0)
+        index = max(0, round(t * self.fps))
+        duration = self.durations.get(version)
+        if duration is not None:
+            index = min(index, int(duration * self.fps))
+        window = index // self.window
+        data = self.cache.get(version, index)
+        if data is None:
+            self.schedule(version, window, 0).wait()
+            data = self.cache.get(version, index)
+        for step in range(1, self.prefetch + 1):  # ahead first, one window back
+            self.schedule(version, window + step, step)
+        if window > 0:
+            self.schedule(version, window - 1, 1.5)
+        if data is None:
+            raise RuntimeError(self.errors.get((version, window), f"frame {index} was not rendered"))
+        return data
+
+    def info(self) -> dict:
+        version = self.version()
+        self.schedule(version, "duration", 0)
+        return {"scene": self.scene_name, "version": version, "fps": self.fps,
+                "duration": self.durations.get(version), "error": self.errors.get((version, "duration"))}
+
+
+class PreviewHandler(BaseHTTPRequestHandler):
+    server: PreviewServer
+
+    def do_GET(self) -> None:
+        url = urlparse(self.path)
+        try:
+            if url.path == "/":
+                self.reply(200, "text/html", VIEWER.replace("{scene}", self.server.scene_name).encode())
+            elif url.path == "/info":
+                self.reply(200, "application/json", json.dumps(self.server.info()).encode())
+            elif url.path == "/frame":
+                t = float(parse_qs(url.query).get("t", ["0"])[0])
+                self.reply(200, "image/png", self.server.frame(t))
+            else:
+                self.reply(404, "text/plain", b"not found")
+        except Exception as error:
+            self.reply(500, "text/plain", str(error).encode())
+
+    def reply(self, status: int, content_type: str, body: bytes) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args) -> None:
+        pass  # one line per frame would drown the worker output
+
+
+VIEWER = """<!doctype html>
+<title>{scene} preview</title>
+<style>
+  body { background: #111; color: #ccc; font: 14px sans-serif; margin: 1em; }
+  img { display: block; width: 100%; max-width: 960px;
+        background: repeating-conic-gradient(#333 0 25%, #444 0 50%) 0 0 / 16px 16px; }
+  input { width: 100%; max-width: 960px; }
+  pre { color: #f77; white-space: pre-wrap; }
+</style>
+<img id="frame"><input id="slider" type="range" min="0" max="10" step="any" value="0">
+<div id="status">loading</div><pre id="error"></pre>
+<script>
+let fps = 15, version = null, busy = false, wanted = null;
+function show() {
+  if (busy || wanted === null) return;
+  const t = wanted, started = performance.now();
+  busy = true; wanted = null;
+  fetch(`frame?t=${t}`)
+    .then(r => r.ok ? r.blob() : r.text().then(e => Promise.reject(e)))
+    .then(blob => {
+      URL.revokeObjectURL(frame.src);
+      frame.src = URL.createObjectURL(blob);
+      status.textContent = `t = ${(+t).toFixed(3)} s   frame ${Math.round(t * fps)}   ${Math.round(performance.now() - started)} ms`;
+      error.textContent = "";
+    })
+    .catch(e => { error.textContent = e; })
+    .finally(() => { busy = false; show(); });
+}
+slider.oninput = () => { wanted = slider.value; show(); };
+document.onkeydown = e => {
+  const step = {ArrowLeft: -1, ArrowRight: 1}[e.key];
+  if (step) { slider.value = +slider.value + step / fps; slider.oninput(); }
+};
+function poll() {
+  fetch("info").then(r => r.json()).then(info => {
+    fps = info.fps; slider.step = 1 / fps;
+    if (info.duration !== null) slider.max = info.duration;
+    if (info.error) error.textContent = info.error;
+    if (info.version !== version) { version = info.version; slider.oninput(); }
+  }).finally(() => setTimeout(poll, 1000));
+}
+poll();
+</script>
+"""
+
+
+def warm_up() -> None:
+    """Import manim once here; every forked job starts from this state."""
+    import manim  # noqa: F401
+    import manimpango
+
+    manimpango.list_fonts()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("file")
+    parser.add_argument("scene")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--height", type=int, default=270, help="preview height in pixels")
+    parser.add_argument("--fps", type=int, default=15)
+    parser.add_argument("--window", type=float, default=2.0, help="seconds rendered per job")
+    parser.add_argument("--prefetch", type=int, default=3, help="windows rendered ahead")
+    parser.add_argument("-j", "--workers", type=int, help="render processes (default: cores - 1)")
+    parser.add_argument("--memory_mb", type=int, default=256)
+    parser.add_argument("--disk_mb", type=int, default=2048)
+    parser.add_argument("--media_dir")
+    args = parser.parse_args()
+
+    warm_up()
+    server = PreviewServer(
+        args.file, args.scene, args.port, args.height, args.fps, args.window, args.prefetch,
+        args.workers, args.memory_mb, args.disk_mb, args.media_dir,
+    )
+    print(f"previewing {args.scene} at http://{HOST}:{args.port}/", flush=True)
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,265 @@
+"""Render scenes from this folder without going through the ``manim`` CLI.
+
+    python render.py cosmic_demo.py ExpandingGrid -q k --pipelined
+
+Same output layout as ``manim -qk cosmic_demo.py ExpandingGrid``; the extra
+flags switch on the render helpers that live next to the scenes.
+"""
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import inspect
+import sys
+from pathlib import Path
+
+import numpy as np
+from manim import QUALITIES, CairoRenderer, Camera, Scene, SceneFileWriter, tempconfig
+
+from checkpoints import FrameRenderer, ResumableRenderer
+from compact import use_compact_points
+from frame_elision import ElidingRenderer
+from layout_cache import use_layout_cache
+from numpy_raster import NumpyRasterRenderer
+from pipelined_writer import PipelinedFileWriter
+from render_metrics import MeteredRenderer
+from scene_hash import use_stable_hashing
+from sequence_writer import ImageSequenceWriter
+from text_cache import use_text_cache
+from tiered_writer import TieredFileWriter
+from timing_manifest import ManifestRenderer
+
+QUALITY_FLAGS = {q["flag"]: name for name, q in QUALITIES.items() if q["flag"]}
+
+
+def quality_settings(flag: str) -> dict:
+    """Config entries for a ``-q`` flag (l, m, h, p, k)."""
+    q = QUALITIES[QUALITY_FLAGS[flag]]
+    return {
+        "pixel_width": q["pixel_width"],
+        "pixel_height": q["pixel_height"],
+        "frame_rate": q["frame_rate"],
+    }
+
+
+def load_module(file: str | Path):
+    """Import a scene file the way manim does (its folder goes on sys.path).
+
+    The module is registered under a prefixed name so ``math.py`` does not
+    shadow the standard library for the rest of the process.
+    """
+    path = Path(file).resolve()
+    name = f"scene_{path.stem}"
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    if str(path.parent) not in sys.path:
+        sys.path.insert(0, str(path.parent))
+    spec.loader.exec_module(module)
+    return module
+
+
+def load_scene_class(file: str | Path, scene_name: str) -> type[Scene]:
+    scene_cls = getattr(load_module(file), scene_name, None)
+    if not (inspect.isclass(scene_cls) and issubclass(scene_cls, Scene)):
+        raise LookupError(f"{scene_name} is not a Scene in {file}")
+    return scene_cls
+
+
+def camera_class_for(scene_cls: type[Scene]) -> type[Camera]:
+    """MovingCameraScene / ThreeDScene pick their camera via a default argument."""
+    for klass in scene_cls.__mro__:
+        param = inspect.signature(klass.__init__).parameters.get("camera_class")
+        if param is not None and param.default is not inspect.Parameter.empty:
+            return param.default
+    return Camera
+
+
+def build_scene(
+    scene_cls: type[Scene],
+    writer_class=SceneFileWriter,
+    renderer_class=CairoRenderer,
+    **kwargs,
+) -> Scene:
+    """Instantiate a scene whose renderer uses ``writer_class``; needs the config in place."""
+    renderer = renderer_class(
+        file_writer_class=writer_class,
+        camera_class=camera_class_for(scene_cls),
+    )
+    return scene_cls(renderer=renderer, **kwargs)
+
+
+def scene_variant(scene_cls: type[Scene], params: dict) -> type[Scene]:
+    """Subclass with some class-level parameters replaced, named after them."""
+    for name in params:
+        if not hasattr(scene_cls, name):
+            raise AttributeError(f"{scene_cls.__name__} has no parameter {name!r}")
+    name = "_".join([scene_cls.__name__, *(f"{k}{v}" for k, v in params.items())])
+    return type(name, (scene_cls,), dict(params))
+
+
+def render_scene(
+    file: str | Path,
+    scene_name: str,
+    quality: str = "l",
+    media_dir: str | None = None,
+    writer_class=SceneFileWriter,
+    renderer_class=CairoRenderer,
+    params: dict | None = None,
+    **overrides,
+) -> Scene:
+    """Render one scene; ``overrides`` are extra manim config entries.
+
+    ``params`` renders a variant of the scene (see ``scene_variant``).
+    """
+    settings = {
+        "input_file": Path(file).resolve(),
+        "scene_names": [scene_name],
+        **quality_settings(quality),
+        **overrides,
+    }
+    if media_dir:
+        settings["media_dir"] = media_dir
+    with tempconfig(settings):
+        scene_cls = load_scene_class(file, scene_name)
+        if params:
+            scene_cls = scene_variant(scene_cls, params)
+        scene = build_scene(scene_cls, writer_class, renderer_class)
+        scene.render()
+    return scene
+
+
+def render_scene_at(file, scene_name: str, t: float, quality: str = "l", **kwargs) -> Scene:
+    """Play ``scene_name`` up to ``t`` seconds and save that frame as ``<Scene>_t<t>.png``.
+
+    Earlier plays are skipped, so updaters driven by ``dt`` see one large step
+    per play, as with ``-n``.
+    """
+    return render_scene(
+        file, scene_name, quality,
+        renderer_class=FrameRenderer.at(t),
+        save_last_frame=True,
+        write_to_movie=False,
+        output_file=f"{scene_name}_t{t:g}",
+        **kwargs,
+    )
+
+
+def render_frame(file, scene_name: str, t: float, quality: str = "l", **kwargs) -> np.ndarray:
+    """The RGBA frame shown ``t`` seconds into the scene."""
+    return render_scene_at(file, scene_name, t, quality, **kwargs).renderer.frames[t]
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("file")
+    parser.add_argument("scene")
+    parser.add_argument("-q", "--quality", default="h", choices=sorted(QUALITY_FLAGS))
+    parser.add_argument("--media_dir")
+    parser.add_argument("-t", "--transparent", action="store_true")
+    parser.add_argument("--disable_caching", action="store_true")
+    parser.add_argument("--pipelined", action="store_true",
+                        help="encode on a separate thread; with --disable_caching "
+                             "stream straight into the final movie")
+    parser.add_argument("--queue_size", type=int, default=8,
+                        help="frames buffered between renderer and encoder")
+    parser.add_argument("--tiers", nargs="+", default=[], metavar="HEIGHTpFPS",
+                        help="also write downsampled copies, e.g. --tiers 1080p60 480p15 "
+                             "(renders every frame, so caching is disabled)")
+    parser.add_argument("--png_sequence", action="store_true",
+                        help="write numbered PNGs on a worker pool instead of a movie")
+    parser.add_argument("--raw_sequence", action="store_true",
+                        help="write one raw RGBA file to memory-map (see sequence_writer.py)")
+    parser.add_argument("--compress_level", type=int, default=1, choices=range(10),
+                        help="zlib level of --png_sequence frames")
+    parser.add_argument("--workers", type=int,
+                        help="--png_sequence worker threads (default: one per CPU)")
+    parser.add_argument("--resume", action="store_true",
+                        help="checkpoint every play and continue after the last one a "
+                             "previous run finished (implies --disable_caching)")
+    parser.add_argument("--frame", type=float, metavar="SECONDS",
+                        help="save only the frame at this time as a PNG")
+    parser.add_argument("--float32", action="store_true",
+                        help="store VMobject points as float32 (see compact.py)")
+    parser.add_argument("--flat", action="store_true",
+                        help="with --float32, drop the z column of flat mobjects")
+    parser.add_argument("--layout_cache", action="store_true",
+                        help="cache families and bounding boxes (see layout_cache.py)")
+    parser.add_argument("--stable_hash", action="store_true",
+                        help="hash play calls from raw bytes for the partial-movie cache "
+                             "(see scene_hash.py)")
+    parser.add_argument("--text_cache", action="store_true",
+                        help="reuse shaped Text/MarkupText within the process (see text_cache.py)")
+    parser.add_argument("--numpy_raster", action="store_true",
+                        help="draw dots, straight lines and upright rectangles with NumPy "
+                             "(see numpy_raster.py)")
+    parser.add_argument("--elide_frames", action="store_true",
+                        help="repeat the previous frame while a wait changes nothing "
+                             "(see frame_elision.py)")
+    parser.add_argument("--no_manifest", action="store_true",
+                        help="skip <Scene>.timing.json next to the output (see timing_manifest.py)")
+    parser.add_argument("--metrics", metavar="PATH",
+                        help="append JSON-lines render metrics to PATH ('-' for stdout)")
+    parser.add_argument("--prometheus", action="store_true",
+                        help="also write <Scene>.prom next to the movie (see render_metrics.py)")
+    args = parser.parse_args(argv)
+    if args.tiers and args.resume:
+        parser.error("--tiers needs every frame and cannot --resume")
+    if (args.png_sequence or args.raw_sequence) and (args.tiers or args.pipelined):
+        parser.error("image sequences replace the movie; drop --tiers/--pipelined")
+    return args
+
+
+def run(argv=None) -> Scene:
+    """Parse render.py arguments and render; shared with the render daemon."""
+    args = parse_args(argv)
+    if args.float32 or args.flat:
+        use_compact_points(flat=args.flat)
+    if args.layout_cache:
+        use_layout_cache()
+    if args.stable_hash:
+        use_stable_hashing()
+    if args.text_cache:
+        use_text_cache()
+    if args.frame is not None:
+        return render_scene_at(
+            args.file, args.scene, args.frame, args.quality, media_dir=args.media_dir
+        )
+
+    overrides = {"disable_caching": args.disable_caching}
+    if args.transparent:
+        overrides["background_opacity"] = 0.0
+
+    renderer_class = CairoRenderer
+    if args.resume:
+        overrides["disable_caching"] = True
+        renderer_class = ResumableRenderer
+    if args.numpy_raster:
+        renderer_class = NumpyRasterRenderer.wrapping(renderer_class)
+    if args.elide_frames:
+        renderer_class = ElidingRenderer.wrapping(renderer_class)
+    if not args.no_manifest:
+        renderer_class = ManifestRenderer.wrapping(renderer_class)
+    if args.metrics or args.prometheus:
+        renderer_class = MeteredRenderer.wrapping(renderer_class, args.metrics, args.prometheus)
+
+    writer_class = SceneFileWriter
+    if args.tiers:
+        overrides["disable_caching"] = True
+        writer_class = TieredFileWriter.with_tiers(args.tiers, args.queue_size)
+    elif args.pipelined:
+        writer_class = PipelinedFileWriter.with_queue_size(args.queue_size)
+    elif args.png_sequence or args.raw_sequence:
+        overrides["format"] = "png"
+        writer_class = ImageSequenceWriter.with_options(
+            args.workers, args.queue_size, args.compress_level, raw=args.raw_sequence
+        )
+
+    return render_scene(
+        args.file, args.scene, args.quality, args.media_dir,
+        writer_class, renderer_class, **overrides,
+    )
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,158 @@
+"""Keep manim imported and warm between renders.
+
+    python render_daemon.py --serve                      # once, in its own terminal
+    python render_daemon.py griddie.py ExpandingGrid -q l
+
+The server pays for ``from manim import *``, font discovery and config parsing
+once.  Each job is a render.py command line; it runs in a forked child (so a
+crashing scene or leaked state cannot hurt the server, and the scene file is
+re-imported fresh every time) and the client gets a one-line JSON result.
+Platforms without ``fork`` (Windows) run the jobs in the server process.
+
+A job is arbitrary code (the scene file), and any local user can connect to
+a loopback port.  The server therefore writes a random token to
+``~/.render_daemon-<port>.token``, readable by its owner only, and refuses
+requests that do not carry it, as well as requests whose working directory
+is outside this repository.
+"""
+from __future__ import annotations
+
+import argparse
+import hmac
+import json
+import os
+import secrets
+import signal
+import socket
+import sys
+import time
+import traceback
+from pathlib import Path
+
+HOST = "127.0.0.1"
+DEFAULT_PORT = 50607
+REPO = Path(__file__).resolve().parents[2]
+
+
+def token_path(port: int) -> Path:
+    return Path.home() / f".render_daemon-{port}.token"
+
+
+# ---------- Server ----------
+def warm_up() -> None:
+    """Import everything a render touches before the first job arrives."""
+    import manimpango
+
+    import render  # noqa: F401  (pulls in manim, av, PIL and the writers)
+
+    manimpango.list_fonts()
+
+
+def run_job(request: dict) -> dict:
+    import render
+
+    started = time.perf_counter()
+    try:
+        os.chdir(request.get("cwd", os.getcwd()))
+        scene = render.run(request["argv"])
+    except SystemExit as exit_:  # argparse errors
+        return {"ok": False, "error": f"bad arguments (exit {exit_.code})"}
+    except Exception:
+        return {"ok": False, "error": traceback.format_exc()}
+    writer = scene.renderer.file_writer
+    output = getattr(writer, "movie_file_path", None) or getattr(writer, "image_file_path", None)
+    return {
+        "ok": True,
+        "seconds": round(time.perf_counter() - started, 3),
+        "output": str(output) if output else None,
+    }
+
+
+def write_token(port: int) -> str:
+    """A fresh token in a file only this user can read."""
+    token = secrets.token_hex(16)
+    path = token_path(port)
+    path.unlink(missing_ok=True)  # a file that exists keeps its old mode
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    with os.fdopen(fd, "w") as file:
+        file.write(token)
+    return token
+
+
+def refusal(request: dict, token: str) -> str | None:
+    """Why ``request`` may not run, or None."""
+    if not hmac.compare_digest(str(request.get("token", "")).encode(), token.encode()):
+        return "bad token"
+    cwd = Path(request.get("cwd", os.getcwd())).resolve()
+    if not cwd.is_relative_to(REPO):
+        return f"cwd {cwd} is outside {REPO}"
+    return None
+
+
+def handle(conn: socket.socket, token: str) -> None:
+    with conn, conn.makefile("rw", encoding="utf-8") as stream:
+        request = json.loads(stream.readline())
+        error = refusal(request, token)
+        result = {"ok": False, "error": error} if error else run_job(request)
+        stream.write(json.dumps(result) + "\n")
+
+
+def serve(port: int = DEFAULT_PORT) -> None:
+    warm_up()
+    token = write_token(port)
+    can_fork = hasattr(os, "fork")
+    if can_fork:
+        signal.signal(signal.SIGCHLD, signal.SIG_IGN)  # children reap themselves
+    with socket.create_server((HOST, port)) as server:
+        print(f"render daemon listening on {HOST}:{port}", flush=True)
+        while True:
+            conn, _ = server.accept()
+            if not can_fork:
+                handle(conn, token)
+                continue
+            if os.fork() == 0:
+                server.close()
+                try:
+                    handle(conn, token)
+                finally:
+                    os._exit(0)
+            conn.close()
+
+
+# ---------- Client ----------
+def submit(argv: list[str], port: int = DEFAULT_PORT) -> dict:
+    try:
+        token = token_path(port).read_text().strip()
+    except FileNotFoundError:
+        raise SystemExit(f"no {token_path(port)}; start the server with --serve") from None
+    request = {"argv": argv, "cwd": os.getcwd(), "token": token}
+    with socket.create_connection((HOST, port)) as conn:
+        with conn.makefile("rw", encoding="utf-8") as stream:
+            stream.write(json.dumps(request) + "\n")
+            stream.flush()
+            return json.loads(stream.readline())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__.splitlines()[0],
+        epilog="Any other arguments are passed to render.py on the server.",
+    )
+    parser.add_argument("--serve", action="store_true")
+    parser.add_argument("--port", type=int, default=int(os.environ.get("RENDER_DAEMON_PORT", DEFAULT_PORT)))
+    args, render_argv = parser.parse_known_args()
+
+    if args.serve:
+        sys.path.insert(0, str(Path(__file__).resolve().parent))
+        serve(args.port)
+        return
+
+    result = submit(render_argv, args.port)
+    if not result["ok"]:
+        print(result["error"], file=sys.stderr)
+        sys.exit(1)
+    print(f"{result['output']}  ({result['seconds']}s)")
+
+
+if __name__ == "__main__":
+    main()
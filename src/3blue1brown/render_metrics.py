@@ -0,0 +1,282 @@
+"""Machine-readable telemetry for every render.
+
+    python render.py cosmic_inflation_intro.py InflationGridIntro --metrics metrics.jsonl --prometheus
+
+``--metrics`` appends JSON lines (``-`` for stdout): one ``play`` event per
+``self.play``/``self.wait`` and one ``render`` summary with frames, average
+and p99 frame time, encode time, bytes written, peak memory and the hit
+rates of the partial-movie, Text, Tex, ``mobject_cache`` and icon caches.
+``--prometheus`` also writes ``<Scene>.prom`` next to the movie in the text
+exposition format, for a node_exporter textfile collector.
+
+Peak memory comes from ``resource`` on Unix and ``psutil`` (if installed) on
+Windows; without either it is ``null`` and left out of the ``.prom`` file.
+
+The cost is two ``perf_counter`` calls per frame; nothing leaves the machine.
+Encode time is the time the render thread spends handing frames to the
+writer plus ``file_writer.finish()``; with ``--pipelined`` the encoding
+itself overlaps rendering and is not counted.
+"""
+from __future__ import annotations
+
+import json
+import os
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+import numpy as np
+from manim import __version__ as MANIM_VERSION
+from manim import CairoRenderer, MarkupText, Text, config
+from manim.mobject.text import tex_mobject, text_mobject
+from manim.utils import tex_file_writing
+
+import icon_cache
+import mobject_cache
+import text_cache
+
+CACHE_COUNTS = Counter()  # "<cache>_hits" / "<cache>_lookups", process wide
+_clock = time.perf_counter
+
+
+# ---------- Text / Tex cache counters ----------
+# manim only reaches Pango / LaTeX when the SVG is not on disk yet, so a
+# lookup that made no such call was a hit; nothing is hashed a second time
+RENDERS = Counter()  # "text" / "tex"
+
+
+class _CountedRenderer:
+    """Stands in for ``manimpango`` / ``MarkupUtils``; counts ``text2svg`` calls."""
+
+    def __init__(self, wrapped):
+        self.wrapped = wrapped
+
+    def __getattr__(self, name):
+        return getattr(self.wrapped, name)
+
+    def text2svg(self, *args, **kwargs):
+        RENDERS["text"] += 1
+        return self.wrapped.text2svg(*args, **kwargs)
+
+
+def _count_compile(original):
+    def compile_tex(*args, **kwargs):
+        RENDERS["tex"] += 1
+        return original(*args, **kwargs)
+
+    return compile_tex
+
+
+def _count_lookups(cache, original):
+    def lookup(*args, **kwargs):
+        before = RENDERS[cache]
+        svg = original(*args, **kwargs)
+        CACHE_COUNTS[f"{cache}_lookups"] += 1
+        CACHE_COUNTS[f"{cache}_hits"] += RENDERS[cache] == before
+        return svg
+
+    return lookup
+
+
+def cache_counts() -> Counter:
+    """Hits and lookups of every process-wide cache, prefixed by cache."""
+    counts = CACHE_COUNTS.copy()
+    for prefix, stats in (("mobject", mobject_cache.STATS), ("text_layout", text_cache.STATS),
+                          ("icon", icon_cache.STATS)):
+        counts.update({f"{prefix}_{k}": v for k, v in stats.items()})
+    return counts
+
+
+def count_text_caches() -> None:
+    """Count Text/MarkupText/Tex SVG cache lookups from now on (idempotent)."""
+    if getattr(Text._text2svg, "counted", False):
+        return
+    for cls in (Text, MarkupText):
+        cls._text2svg = _count_lookups("text", cls.__dict__["_text2svg"])
+        cls._text2svg.counted = True
+    text_mobject.manimpango = _CountedRenderer(text_mobject.manimpango)
+    text_mobject.MarkupUtils = _CountedRenderer(text_mobject.MarkupUtils)
+    tex_file_writing.compile_tex = _count_compile(tex_file_writing.compile_tex)
+    tex_mobject.tex_to_svg_file = _count_lookups("tex", tex_mobject.tex_to_svg_file)
+
+
+def peak_memory_bytes() -> int | None:
+    """Peak resident memory of this process, None where it cannot be read."""
+    try:
+        import resource  # Unix only
+    except ImportError:
+        try:
+            import psutil
+        except ImportError:
+            return None
+        # peak working set on Windows; the current RSS elsewhere
+        info = psutil.Process().memory_info()
+        return getattr(info, "peak_wset", info.rss)
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+# ---------- Renderer ----------
+class MeteredRenderer(CairoRenderer):
+    """Times frames and plays, then reports when the scene finishes.
+
+    Combine with another renderer through ``wrapping``.
+    """
+
+    metrics_path: str | None = None  # JSON lines; "-" for stdout
+    prometheus = False
+
+    @classmethod
+    def wrapping(cls, renderer_class, metrics_path=None, prometheus=False) -> type:
+        return type(renderer_class.__name__, (cls, renderer_class),
+                    {"metrics_path": metrics_path, "prometheus": prometheus})
+
+    def init_scene(self, scene) -> None:
+        super().init_scene(scene)
+        count_text_caches()
+        self.scene_name = type(scene).__name__
+        self.started = time.perf_counter()
+        self.caches_before = cache_counts()
+        self.frame_seconds: list[float] = []
+        self.frames_written = 0
+        self.encode_seconds = 0.0
+        self.partial_lookups = self.partial_hits = 0
+
+        is_already_cached = self.file_writer.is_already_cached
+
+        def counted(hash_invocation) -> bool:
+            hit = is_already_cached(hash_invocation)
+            self.partial_lookups += 1
+            self.partial_hits += hit
+            return hit
+
+        self.file_writer.is_already_cached = counted
+
+    def render(self, scene, time, moving_mobjects):
+        start = _clock()
+        super().render(scene, time, moving_mobjects)
+        self.frame_seconds.append(_clock() - start)
+
+    def add_frame(self, frame, num_frames: int = 1):
+        if self.skip_animations:
+            return super().add_frame(frame, num_frames)
+        start = _clock()
+        super().add_frame(frame, num_frames)
+        self.encode_seconds += _clock() - start
+        self.frames_written += num_frames
+
+    def play(self, scene, *args, **kwargs):
+        start, frames = _clock(), self.frames_written
+        super().play(scene, *args, **kwargs)
+        self.emit({
+            "event": "play",
+            "scene": self.scene_name,
+            "play": self.num_plays - 1,
+            "frames": self.frames_written - frames,
+            "seconds": round(_clock() - start, 6),
+            "skipped": self.skip_animations,
+        })
+
+    def scene_finished(self, scene) -> None:
+        start = _clock()
+        super().scene_finished(scene)
+        self.encode_seconds += _clock() - start
+        summary = self.summary()
+        self.emit(summary)
+        if self.prometheus:
+            self.write_prometheus(summary)
+
+    # ---------- Reporting ----------
+    def output_files(self) -> list[Path]:
+        writer = self.file_writer
+        paths = [p for p in writer.partial_movie_files if p]
+        paths += [getattr(writer, "movie_file_path", None), getattr(writer, "image_file_path", None)]
+        return [Path(p) for p in paths if p]
+
+    def bytes_written(self) -> int:
+        """Sizes of the output files this run created or rewrote."""
+        since = time.time() - (time.perf_counter() - self.started) - 1
+        total = 0
+        for path in set(self.output_files()):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            if stat.st_mtime >= since:
+                total += stat.st_size
+        return total
+
+    def summary(self) -> dict:
+        frame_ms = np.array(self.frame_seconds) * 1e3
+        caches = cache_counts()
+        caches.subtract(self.caches_before)
+        return {
+            "event": "render",
+            "scene": self.scene_name,
+            "file": str(config["input_file"]),
+            "resolution": f"{config.pixel_width}x{config.pixel_height}",
+            "fps": config.frame_rate,
+            "manim": MANIM_VERSION,
+            "timestamp": time.time(),
+            "wall_seconds": round(time.perf_counter() - self.started, 6),
+            "plays": self.num_plays,
+            "frames": self.frames_written,
+            "frames_rendered": len(frame_ms),
+            "frames_elided": getattr(self, "frames_elided", 0),  # frame_elision.py
+            "frame_ms_avg": round(float(frame_ms.mean()), 4) if len(frame_ms) else 0.0,
+            "frame_ms_p99": round(float(np.percentile(frame_ms, 99)), 4) if len(frame_ms) else 0.0,
+            "encode_seconds": round(self.encode_seconds, 6),
+            "bytes_written": self.bytes_written(),
+            "peak_memory_bytes": peak_memory_bytes(),
+            "cache": {
+                "partial_movie": {"hits": self.partial_hits, "lookups": self.partial_lookups},
+                "text": {"hits": caches["text_hits"], "lookups": caches["text_lookups"]},
+                "tex": {"hits": caches["tex_hits"], "lookups": caches["tex_lookups"]},
+                "mobject": {"hits": caches["mobject_hits"],
+                            "lookups": caches["mobject_hits"] + caches["mobject_misses"]},
+                "text_layout": {"hits": caches["text_layout_hits"],
+                                "lookups": caches["text_layout_hits"] + caches["text_layout_misses"]},
+                "icon": {"hits": caches["icon_hits"], "lookups": caches["icon_hits"] + caches["icon_misses"]},
+            },
+        }
+
+    def emit(self, record: dict) -> None:
+        if self.metrics_path is None:
+            return
+        line = json.dumps(record, separators=(",", ":")) + "\n"
+        if self.metrics_path == "-":
+            sys.stdout.write(line)
+            sys.stdout.flush()
+            return
+        with open(self.metrics_path, "a") as stream:
+            stream.write(line)
+
+    def write_prometheus(self, summary: dict) -> None:
+        labels = f'scene="{summary["scene"]}",resolution="{summary["resolution"]}",fps="{summary["fps"]}"'
+        gauges = {
+            "frames": summary["frames"],
+            "frame_ms_avg": summary["frame_ms_avg"],
+            "frame_ms_p99": summary["frame_ms_p99"],
+            "encode_seconds": summary["encode_seconds"],
+            "wall_seconds": summary["wall_seconds"],
+            "bytes_written": summary["bytes_written"],
+            "peak_memory_bytes": summary["peak_memory_bytes"],
+        }
+        lines = []
+        for name, value in gauges.items():
+            if value is None:  # peak memory on platforms without resource/psutil
+                continue
+            lines += [f"# TYPE manim_render_{name} gauge", f"manim_render_{name}{{{labels}}} {value}"]
+        lines.append("# TYPE manim_render_cache_hit_ratio gauge")
+        for cache, counts in summary["cache"].items():
+            ratio = counts["hits"] / counts["lookups"] if counts["lookups"] else 0.0
+            lines.append(f'manim_render_cache_hit_ratio{{{labels},cache="{cache}"}} {ratio:.6g}')
+
+        movie = getattr(self.file_writer, "movie_file_path", None) or self.file_writer.image_file_path
+        path = Path(movie).with_name(f"{summary['scene']}.prom")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(path.name + ".tmp")
+        tmp.write_text("\n".join(lines) + "\n")
+        os.replace(tmp, path)  # collectors never see half a file
+
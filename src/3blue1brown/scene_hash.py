@@ -0,0 +1,288 @@
+"""Play-call hashes for the partial-movie cache, from raw bytes instead of JSON.
+
+Before every ``self.play`` manim serializes the camera, the animations and
+every mobject on screen to JSON: arrays go through ``repr``, every closure
+through ``inspect.getsource``, and each captured mobject is serialized again
+inside every closure that captures it.  With hundreds of ``always_redraw``
+mobjects (InflationGridIntro) that is a measurable slice of the render.  It
+is also lossy in places (arrays over 1000 entries are truncated, floats keep
+8 digits), so edits can hit stale partial movies.
+
+``use_stable_hashing()`` swaps in a hasher that
+
+* feeds arrays to BLAKE2 as bytes, exactly and without formatting them,
+* digests each mobject, function or object once per play and reuses that
+  digest wherever it is referenced again (a tracker captured by 200 updaters
+  is hashed once),
+* hashes a function by its source (cached per code object), its defaults, the
+  values it captures and the globals it reads: editing a lambda misses, a
+  tracker at a new value misses, a re-created but identical closure hits.
+
+Once installed, every mobject also keeps the digest of its arrays (points
+and colours) between plays, in ``mob.__dict__["_digest"]``, so a static
+starfield or a plotted curve is not read again before every play.  Any
+attribute assignment on a mobject drops it (``mob.points += v`` assigns too),
+and so do the manim methods that write into those arrays in place
+(``set_fill``/``set_stroke`` via ``update_rgbas_array``,
+``pointwise_become_partial``, ``set_anchors_and_handles``,
+``ValueTracker.set_value``, ``DecimalNumber.set_value``, ``Wiggle``).  Other
+in-place writes (``mob.points[:] = ...`` in scene code) are not seen; call
+``forget_digest(mob)`` after them.  Everything else a mobject holds (flags,
+submobjects, updaters and what they capture) is still encoded on every play.
+The hook costs a Python call per attribute assignment on a mobject.
+"""
+from __future__ import annotations
+
+import functools
+import hashlib
+import inspect
+from types import BuiltinFunctionType, FunctionType, MethodType, ModuleType
+
+import numpy as np
+from manim import (
+    ComplexValueTracker, DecimalNumber, Mobject, PMobject, Scene, ValueTracker, VMobject, Wiggle,
+)
+from manim.renderer import cairo_renderer
+from manim.utils import caching
+from manim.utils.hashing import KEYS_TO_FILTER_OUT
+
+SKIPPED_KEYS = KEYS_TO_FILTER_OUT | {"_layout", "_digest"}  # layout_cache and array digests
+SCALARS = (type(None), bool, int, float, complex, str)
+PLAIN = frozenset(SCALARS)  # exact types whose repr is their content
+ORIGINAL = {}
+
+
+@functools.cache
+def function_source(code) -> str:
+    try:
+        return inspect.getsource(code)
+    except (OSError, TypeError):  # exec'd or interactive code
+        return code.co_code.hex()
+
+
+@functools.cache
+def global_names(code) -> tuple[str, ...]:
+    """Names ``code`` (and the functions defined in it) may read as globals."""
+    names = list(code.co_names)
+    for const in code.co_consts:
+        if inspect.iscode(const):
+            names.extend(global_names(const))
+    return tuple(dict.fromkeys(names))
+
+
+class PlayHasher:
+    """Digests for one play call; every object is encoded once."""
+
+    def __init__(self):
+        self.memo = {}   # id -> digest, None while in progress
+        self.alive = []  # keeps memoized objects alive so ids stay unique
+
+    def hexdigest(self, obj) -> str:
+        digest = hashlib.blake2b(digest_size=8)
+        self.encode(obj, digest.update)
+        return digest.hexdigest()
+
+    def digest(self, obj) -> bytes:
+        key = id(obj)
+        if key in self.memo:
+            # a reference back into an object being hashed (an updater that
+            # captures its own mobject) stands for itself
+            return self.memo[key] or b"cycle"
+        self.memo[key] = None
+        self.alive.append(obj)
+        digest = hashlib.blake2b(digest_size=16)
+        self.encode_object(obj, digest.update)
+        self.memo[key] = digest.digest()
+        return self.memo[key]
+
+    def encode(self, obj, update) -> None:
+        if isinstance(obj, SCALARS):
+            update(b"%s:%s;" % (type(obj).__name__.encode(), repr(obj).encode()))
+        elif isinstance(obj, np.ndarray) and not obj.dtype.hasobject:
+            update(b"nd:%s%s;" % (obj.dtype.str.encode(), repr(obj.shape).encode()))
+            update(np.ascontiguousarray(obj).data)
+        elif isinstance(obj, np.generic):
+            update(b"np:%s%s;" % (obj.dtype.str.encode(), repr(obj.item()).encode()))
+        elif isinstance(obj, (list, tuple, np.ndarray)):
+            if all(type(item) in PLAIN for item in obj):
+                update(b"seq:%s;" % repr(list(obj)).encode())
+                return
+            update(b"seq:%d[" % len(obj))
+            for item in obj:
+                self.encode(item, update)
+            update(b"]")
+        elif isinstance(obj, dict):
+            self.encode_dict(obj, update)
+        elif isinstance(obj, (set, frozenset)):
+            update(b"set:%d[" % len(obj))
+            for item in sorted(self.hexdigest(item) for item in obj):
+                update(item.encode())
+            update(b"]")
+        elif isinstance(obj, Scene):
+            update(b"scene;")  # closures that capture ``self`` in construct
+        elif isinstance(obj, (type, ModuleType, BuiltinFunctionType)):
+            name = getattr(obj, "__qualname__", obj.__name__)
+            update(b"ref:%s.%s;" % (str(getattr(obj, "__module__", "")).encode(), name.encode()))
+        else:
+            update(b"obj:")
+            update(self.digest(obj))
+
+    def encode_dict(self, obj: dict, update, arrays: bool = True) -> None:
+        plain, rest = [], []
+        for item in obj.items():
+            if item[0] in SKIPPED_KEYS or not arrays and _is_array(item[1]):
+                continue
+            if type(item[0]) in PLAIN and type(item[1]) in PLAIN:
+                plain.append(item)  # one repr for all the flags and sizes
+            else:
+                rest.append(item)
+        update(b"dict:%s{" % repr(plain).encode())
+        for key, value in rest:
+            self.encode(key, update)
+            self.encode(value, update)
+        update(b"}")
+
+    def encode_object(self, obj, update) -> None:
+        kind = type(obj)
+        update(b"%s.%s;" % (kind.__module__.encode(), kind.__qualname__.encode()))
+        if isinstance(obj, FunctionType):
+            self.encode_function(obj, update)
+        elif isinstance(obj, MethodType):
+            self.encode(obj.__func__, update)
+            self.encode(obj.__self__, update)
+        elif isinstance(obj, functools.partial):
+            self.encode((obj.func, obj.args, obj.keywords), update)
+        elif isinstance(obj, Mobject):
+            update(self.array_digest(obj))
+            self.encode_dict(obj.__dict__, update, arrays=False)
+        elif isinstance(getattr(obj, "__dict__", None), dict):
+            self.encode_dict(obj.__dict__, update)
+        else:
+            try:
+                reduced = obj.__reduce_ex__(4)
+            except Exception:  # contexts, locks, generators: as manim, the type only
+                return
+            self.encode(reduced[1:] if isinstance(reduced, tuple) else reduced, update)
+
+    def array_digest(self, mob: Mobject) -> bytes:
+        """Digest of the arrays of ``mob``, kept on it while stable hashing is installed."""
+        # trusted only while assignments are seen (mobject_cache pickles it too)
+        digest = mob.__dict__.get("_digest") if ORIGINAL else None
+        if digest is None:
+            arrays = hashlib.blake2b(digest_size=16)
+            for key, value in mob.__dict__.items():
+                if _is_array(value) and key not in SKIPPED_KEYS:
+                    self.encode(key, arrays.update)
+                    self.encode(value, arrays.update)
+            digest = arrays.digest()
+            if ORIGINAL:
+                mob.__dict__["_digest"] = digest
+        return digest
+
+    def encode_function(self, function: FunctionType, update) -> None:
+        code = function.__code__
+        update(function_source(code).encode())
+        self.encode((function.__defaults__, function.__kwdefaults__), update)
+        for cell in function.__closure__ or ():
+            try:
+                self.encode(cell.cell_contents, update)
+            except ValueError:  # cell not filled yet
+                update(b"empty;")
+        namespace = function.__globals__
+        for name in global_names(code):
+            if name in namespace:
+                update(name.encode())
+                self.encode(namespace[name], update)
+
+
+def _is_array(value) -> bool:
+    return isinstance(value, np.ndarray) and not value.dtype.hasobject
+
+
+# ---------- Invalidation ----------
+def forget_digest(*mobjects) -> None:
+    """Drop the kept array digests, after writing into their arrays in place."""
+    for mob in mobjects:
+        mob.__dict__.pop("_digest", None)
+
+
+def _setattr(self, name, value):
+    self.__dict__.pop("_digest", None)
+    object.__setattr__(self, name, value)
+
+
+def _forget_after(method):
+    @functools.wraps(method)
+    def write(self, *args, **kwargs):
+        result = method(self, *args, **kwargs)
+        forget_digest(self)
+        return result
+
+    return write
+
+
+def _forget_family_after(method):
+    @functools.wraps(method)
+    def write(self, *args, **kwargs):
+        result = method(self, *args, **kwargs)
+        forget_digest(*self.get_family())
+        return result
+
+    return write
+
+
+def _decimal_set_value(method):
+    @functools.wraps(method)
+    def set_value(self, *args, **kwargs):
+        old_family = self.get_family()  # zeroed in place by manim
+        result = method(self, *args, **kwargs)
+        forget_digest(*old_family)
+        return result
+
+    return set_value
+
+
+def _wiggle_interpolate_submobject(method):
+    @functools.wraps(method)
+    def interpolate_submobject(self, submobject, starting_submobject, alpha):
+        result = method(self, submobject, starting_submobject, alpha)
+        forget_digest(submobject)  # points[:, :] = starting points
+        return result
+
+    return interpolate_submobject
+
+
+WRITERS = {
+    (VMobject, "update_rgbas_array"): _forget_after,
+    (VMobject, "pointwise_become_partial"): _forget_after,
+    (VMobject, "set_anchors_and_handles"): _forget_after,
+    (PMobject, "set_color"): _forget_family_after,
+    (ValueTracker, "set_value"): _forget_after,
+    (ComplexValueTracker, "set_value"): _forget_after,
+    (DecimalNumber, "set_value"): _decimal_set_value,
+    (Wiggle, "interpolate_submobject"): _wiggle_interpolate_submobject,
+}
+
+
+def get_hash_from_play_call(scene_object, camera_object, animations_list, current_mobjects_list) -> str:
+    """Drop-in for ``manim.utils.hashing.get_hash_from_play_call``."""
+    hasher = PlayHasher()
+    return "_".join((
+        hasher.hexdigest(camera_object),
+        hasher.hexdigest(sorted(animations_list, key=str)),
+        hasher.hexdigest(list(current_mobjects_list)),
+    ))
+
+
+def use_stable_hashing() -> None:
+    """Hash play calls with ``PlayHasher``, keeping array digests, from now on (idempotent)."""
+    if ORIGINAL:
+        return
+    for module in (cairo_renderer, caching):
+        ORIGINAL[module.__name__] = module.get_hash_from_play_call
+        module.get_hash_from_play_call = get_hash_from_play_call
+    ORIGINAL["Mobject.__setattr__"] = Mobject.__dict__.get("__setattr__")
+    Mobject.__setattr__ = _setattr
+    for (cls, name), wrap in WRITERS.items():
+        ORIGINAL[f"{cls.__name__}.{name}"] = method = getattr(cls, name)
+        setattr(cls, name, wrap(method))
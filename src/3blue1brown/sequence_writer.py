@@ -0,0 +1,148 @@
+"""Image-sequence output for compositing, written off the render thread.
+
+With ``--format png`` stock manim compresses and saves every frame on the
+render thread, at PIL's default zlib level.  ``ImageSequenceWriter`` hands
+frames to a pool of worker threads (zlib and PIL release the GIL while
+compressing) through a bounded number of in-flight frames, with a selectable
+compression level.  Transparent renders keep their alpha channel.
+
+    python render.py inflation_timeline.py TimelineZoomInflation -t --png_sequence --compress_level 1
+    python render.py inflation_timeline.py TimelineZoomInflation -t --raw_sequence
+
+Frames land in ``<images_dir>/<Scene>0000.png``, ``<Scene>0001.png`` ... as with
+``--format png``, except that a held frame (``self.wait()`` without updaters)
+is written once per frame it lasts, as hard links, so the sequence keeps its
+timing in the editor.
+
+``raw=True`` skips compression altogether: every frame goes to
+``<Scene>.rgba``, a flat (frames, height, width, 4) uint8 array, with its
+shape in ``<Scene>.rgba.json``, for readers that map the file:
+
+    meta = json.loads(Path("Scene.rgba.json").read_text())
+    frames = np.memmap("Scene.rgba", np.uint8, "r", shape=tuple(meta["shape"]))
+"""
+from __future__ import annotations
+
+import json
+import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from threading import BoundedSemaphore, Lock
+
+import numpy as np
+from manim import SceneFileWriter, config, logger
+from manim.utils.file_ops import is_png_format
+from PIL import Image
+
+
+class ImageSequenceWriter(SceneFileWriter):
+    workers = os.cpu_count() or 4
+    queue_size = 8       # frames handed over but not yet on disk
+    compress_level = 1   # zlib level 0-9; PIL's default is 6
+    raw = False
+
+    @classmethod
+    def with_options(cls, workers: int | None = None, queue_size: int = 8,
+                     compress_level: int = 1, raw: bool = False) -> type[ImageSequenceWriter]:
+        return type(cls.__name__, (cls,), {
+            "workers": workers or cls.workers,
+            "queue_size": queue_size,
+            "compress_level": compress_level,
+            "raw": raw,
+        })
+
+    def __init__(self, renderer, scene_name, **kwargs):
+        super().__init__(renderer, scene_name, **kwargs)
+        self.pool: ThreadPoolExecutor | None = None
+        self.slots = BoundedSemaphore(self.queue_size)
+        self.worker_error: BaseException | None = None
+        self.raw_file = None
+        self.raw_lock = Lock()
+        self.raw_shape: tuple[int, ...] | None = None
+
+    # ---------- Render thread side ----------
+    def write_frame(self, frame_or_renderer, num_frames: int = 1):
+        if not is_png_format() or config["dry_run"]:
+            return super().write_frame(frame_or_renderer, num_frames)
+        if self.worker_error is not None:
+            raise RuntimeError("image writer failed") from self.worker_error
+        if self.pool is None:
+            self.pool = ThreadPoolExecutor(self.workers, thread_name_prefix="png")
+        if self.raw and self.raw_file is None:
+            self.open_raw(frame_or_renderer.shape)
+        index = self.frame_count
+        self.frame_count += num_frames
+        self.slots.acquire()  # blocks while queue_size frames are in flight
+        job = self.write_raw if self.raw else self.write_png
+        self.pool.submit(self.run_job, job, frame_or_renderer, index, num_frames)
+
+    def finish(self) -> None:
+        if self.pool is not None:
+            self.pool.shutdown(wait=True)
+            self.pool = None
+        if self.raw_file is not None:
+            self.close_raw()
+        if self.worker_error is not None:
+            raise RuntimeError("image writer failed") from self.worker_error
+        if not self.raw:
+            super().finish()
+
+    # ---------- Worker side ----------
+    def run_job(self, job, frame: np.ndarray, index: int, num_frames: int) -> None:
+        try:
+            if self.worker_error is None:
+                job(frame, index, num_frames)
+        except BaseException as error:  # surfaced on the render thread
+            self.worker_error = error
+        finally:
+            self.slots.release()
+
+    def frame_path(self, index: int) -> Path:
+        target = self.image_file_path.parent / self.image_file_path.stem
+        number = str(index).zfill(config["zero_pad"]) if config["zero_pad"] else str(index)
+        return Path(f"{target}{number}{self.image_file_path.suffix}")
+
+    def write_png(self, frame: np.ndarray, index: int, num_frames: int) -> None:
+        path = self.frame_path(index)
+        tmp = path.with_name(f".{path.name}")
+        Image.fromarray(frame).save(tmp, format="PNG", compress_level=self.compress_level)
+        os.replace(tmp, path)  # an editor watching the folder never reads half a frame
+        for repeat in range(index + 1, index + num_frames):
+            copy = self.frame_path(repeat)
+            copy.unlink(missing_ok=True)
+            try:
+                os.link(path, copy)
+            except OSError:  # filesystems without hard links
+                shutil.copyfile(path, copy)
+
+    def write_raw(self, frame: np.ndarray, index: int, num_frames: int) -> None:
+        data = np.ascontiguousarray(frame).data
+        # workers fill their slots in any order; seek and write go together
+        # (os.pwrite would not need the lock, but Windows lacks it)
+        with self.raw_lock:
+            for repeat in range(index, index + num_frames):
+                self.raw_file.seek(repeat * data.nbytes)
+                self.raw_file.write(data)
+
+    def raw_path(self) -> Path:
+        return self.image_file_path.with_suffix(".rgba")
+
+    def open_raw(self, shape: tuple[int, ...]) -> None:
+        self.raw_shape = shape
+        self.raw_file = open(self.raw_path(), "w+b")
+
+    def close_raw(self) -> None:
+        frame_bytes = int(np.prod(self.raw_shape))
+        self.raw_file.truncate(self.frame_count * frame_bytes)
+        self.raw_file.close()
+        self.raw_file = None
+        meta = {
+            "shape": [self.frame_count, *self.raw_shape],
+            "dtype": "uint8",
+            "channels": "RGBA",
+            "fps": config.frame_rate,
+        }
+        path = self.raw_path()
+        Path(f"{path}.json").write_text(json.dumps(meta, indent=2))
+        logger.info("%i raw RGBA frames ready at %s", self.frame_count, str(path))
@@ -0,0 +1,87 @@
+"""Render a grid of parameter variants of one scene in parallel.
+
+    python sweep.py cosmic_inflation_intro.py InflationGridIntro --set H=0.6,0.9,1.2 --set p=0.5,0.7
+
+Every combination becomes a subclass named after its values
+(``InflationGridIntro_H0.6_p0.5.mp4``), so variants land side by side in the
+usual video folder without copying scene files.  The scene's
+``shared_assets()`` hook runs once in this process before the workers fork,
+so they all inherit the starfield and text prototypes from ``assets.py``;
+the TeX cache is shared on disk through the common media folder.
+"""
+from __future__ import annotations
+
+import argparse
+import ast
+import itertools
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+from render import QUALITY_FLAGS, load_scene_class, render_scene, scene_variant
+
+
+def parse_value(text: str):
+    try:
+        return ast.literal_eval(text)
+    except (ValueError, SyntaxError):
+        return text
+
+
+def parse_grid(assignments: list[str]) -> list[dict]:
+    """``["H=0.6,0.9", "p=0.5"]`` -> one dict per combination."""
+    axes = {}
+    for assignment in assignments:
+        name, _, values = assignment.partition("=")
+        if not values:
+            raise ValueError(f"expected NAME=V1,V2,..., got {assignment!r}")
+        axes[name.strip()] = [parse_value(v.strip()) for v in values.split(",")]
+    return [dict(zip(axes, combo)) for combo in itertools.product(*axes.values())]
+
+
+def render_variant(file, scene_name, params, quality, media_dir, overrides) -> str:
+    scene = render_scene(file, scene_name, quality, media_dir, params=params, **overrides)
+    return str(scene.renderer.file_writer.movie_file_path)
+
+
+def sweep(file, scene_name, grid: list[dict], quality="l", media_dir=None,
+          workers: int | None = None, **overrides) -> list[str]:
+    """Render every variant in ``grid``; returns the movie paths in grid order."""
+    scene_cls = load_scene_class(file, scene_name)
+    for params in grid:
+        scene_variant(scene_cls, params)  # fail on a typo before forking
+    if hasattr(scene_cls, "shared_assets"):
+        scene_cls.shared_assets()
+
+    methods = multiprocessing.get_all_start_methods()
+    context = multiprocessing.get_context("fork" if "fork" in methods else None)
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+        futures = [
+            pool.submit(render_variant, file, scene_name, params, quality, media_dir, overrides)
+            for params in grid
+        ]
+        return [future.result() for future in futures]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("file")
+    parser.add_argument("scene")
+    parser.add_argument("--set", dest="axes", action="append", default=[], metavar="NAME=V1,V2",
+                        help="class attribute to sweep; repeat for a grid")
+    parser.add_argument("-q", "--quality", default="l", choices=sorted(QUALITY_FLAGS))
+    parser.add_argument("--media_dir")
+    parser.add_argument("-j", "--workers", type=int)
+    parser.add_argument("--disable_caching", action="store_true")
+    args = parser.parse_args()
+
+    grid = parse_grid(args.axes) if args.axes else [{}]
+    paths = sweep(
+        args.file, args.scene, grid, args.quality, args.media_dir, args.workers,
+        disable_caching=args.disable_caching,
+    )
+    for params, path in zip(grid, paths):
+        print(f"{params}  {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""Shaped ``Text`` / ``MarkupText`` kept in memory and handed out as copies.
+
+``Text(...)`` runs Pango, writes or reads an SVG in ``text_dir``, parses it
+and turns every glyph into Bézier points, even when the same string was built
+a frame earlier.  ``always_redraw`` readouts (InflationGridIntro's scale
+factor, the ZoomLadder card labels, TimelineZoomInflation's ``ping``) pay
+that on every call.
+
+After ``use_text_cache()`` the first construction of a given text, font,
+weight, slant, size and style keeps a prototype in an LRU; later
+constructions with the same arguments become a dictionary lookup and a copy.
+The prototype's outlines are interned through ``flyweight.share_points``, so
+the copy shares them until it moves (see that module for the one caveat:
+item writes such as ``text.points[:] = ...`` raise).
+
+    use_text_cache()          # once per process (render.py --text_cache)
+
+Only plain arguments are keyed (strings, numbers, colours and containers of
+them); anything else is built as usual.  Subclasses of ``Text`` are never
+cached, since their ``__init__`` may do more than ``Text`` does.
+"""
+from __future__ import annotations
+
+import functools
+from collections import Counter, OrderedDict
+
+import numpy as np
+from manim import MarkupText, Text, config
+from manim.utils.color import ManimColor
+
+from flyweight import share_points
+from scene_hash import PLAIN
+
+MAX_ENTRIES = 1024
+CACHE: OrderedDict[tuple, Text] = OrderedDict()
+STATS = Counter()  # "hits" / "misses", process wide
+ORIGINAL = {}
+
+
+def _plain(value) -> bool:
+    if type(value) in PLAIN or isinstance(value, (ManimColor, np.generic)):
+        return True
+    if isinstance(value, (list, tuple)):
+        return all(map(_plain, value))
+    if isinstance(value, dict):
+        return all(_plain(k) and _plain(v) for k, v in value.items())
+    return False
+
+
+def text_key(mobject: Text, args: tuple, kwargs: dict) -> tuple | None:
+    """Cache key for ``type(mobject)(*args, **kwargs)``, or None when uncacheable."""
+    if type(mobject) not in (Text, MarkupText) or not _plain(args) or not _plain(kwargs):
+        return None
+    # the SVG canvas follows the pixel size, the mobject classes the renderer
+    return (type(mobject), config.pixel_width, config.pixel_height, str(config.renderer),
+            repr(args), repr(sorted(kwargs.items())))
+
+
+def _cached_init(original):
+    @functools.wraps(original)
+    def __init__(self, *args, **kwargs):
+        key = text_key(self, args, kwargs)
+        if key is None:
+            return original(self, *args, **kwargs)
+        prototype = CACHE.get(key)
+        if prototype is None:
+            STATS["misses"] += 1
+            original(self, *args, **kwargs)
+            CACHE[key] = share_points(self.copy())
+            if len(CACHE) > MAX_ENTRIES:
+                CACHE.popitem(last=False)
+            return None
+        STATS["hits"] += 1
+        CACHE.move_to_end(key)
+        state = prototype.copy().__dict__
+        # layout_cache state belongs to the copy; re-adopt the glyphs as ours
+        state.pop("_layout", None)
+        submobjects = state.pop("submobjects")
+        self.__dict__.update(state)
+        self.submobjects = list(submobjects)
+        return None
+
+    return __init__
+
+
+def use_text_cache(max_entries: int = MAX_ENTRIES) -> None:
+    """Serve repeated Text/MarkupText constructions from memory (idempotent)."""
+    global MAX_ENTRIES
+    MAX_ENTRIES = max_entries
+    if ORIGINAL:
+        return
+    for cls in (Text, MarkupText):
+        ORIGINAL[cls.__name__] = cls.__init__
+        cls.__init__ = _cached_init(cls.__init__)
+
+
+def clear_text_cache() -> None:
+    CACHE.clear()
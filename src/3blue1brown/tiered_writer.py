@@ -0,0 +1,155 @@
+"""Derive preview tiers (1080p60, 480p15, ...) from a single master render.
+
+Each tier runs on its own thread: the master frame is area-filtered down to
+the tier resolution (PIL's BOX filter, alpha-aware) and groups of consecutive
+frames are averaged to reach the lower frame rate, so 60 -> 15 fps keeps the
+motion blur of the skipped frames instead of dropping them.  Tiers are written
+next to the master in the usual ``videos/<module>/<height>p<fps>`` layout.
+"""
+from __future__ import annotations
+
+import re
+from queue import Queue
+from threading import Thread
+
+import av
+import numpy as np
+from manim import config, logger
+from manim.utils.file_ops import guarantee_existence
+from PIL import Image
+
+from pipelined_writer import PipelinedFileWriter, open_video_container
+
+
+def parse_tier(tier: str) -> tuple[int, int]:
+    """``"480p15"`` -> ``(480, 15)``."""
+    match = re.fullmatch(r"(\d+)p(\d+)", tier)
+    if match is None:
+        raise ValueError(f"tier must look like 480p15, got {tier!r}")
+    return int(match[1]), int(match[2])
+
+
+class TierEncoder:
+    """Downscale + frame-blend the master stream into one extra movie."""
+
+    def __init__(self, file_path, height: int, fps: int, queue_size: int = 8):
+        group = config.frame_rate / fps
+        if fps > config.frame_rate or abs(group - round(group)) > 1e-6:
+            raise ValueError(f"{fps} fps is not an integer fraction of {config.frame_rate:g} fps")
+        self.group = round(group)
+        self.file_path = file_path
+        # even width for yuv420p, aspect ratio of the master
+        self.size = (2 * round(height * config.pixel_width / config.pixel_height / 2), height)
+        self.fps = fps
+
+        self.acc: np.ndarray | None = None
+        self.count = 0
+        self.error: BaseException | None = None
+        self.queue: Queue = Queue(maxsize=queue_size)
+        self.thread = Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def put(self, frame: np.ndarray, num_frames: int) -> None:
+        if self.error is not None:
+            raise RuntimeError(f"tier {self.file_path} failed") from self.error
+        self.queue.put((num_frames, frame))
+
+    def close(self) -> None:
+        self.queue.put((0, None))
+        self.thread.join()
+        if self.error is not None:
+            raise RuntimeError(f"tier {self.file_path} failed") from self.error
+
+    # ---------- Tier thread ----------
+    def run(self) -> None:
+        try:
+            self.container, self.stream = open_video_container(
+                self.file_path, *self.size, self.fps
+            )
+            while True:
+                num_frames, frame = self.queue.get()
+                if frame is None:
+                    break
+                self.add(frame, num_frames)
+            if self.count:  # blend the tail so durations match
+                self.emit(self.acc / self.count)
+            for packet in self.stream.encode():
+                self.container.mux(packet)
+            self.container.close()
+        except BaseException as error:
+            self.error = error
+            while self.queue.get()[1] is not None:
+                pass
+
+    def add(self, frame: np.ndarray, num_frames: int) -> None:
+        small = np.asarray(Image.fromarray(frame).resize(self.size, Image.BOX))
+        while num_frames > 0:
+            if self.count == 0 and num_frames >= self.group:
+                # a frozen frame spanning whole groups blends to itself
+                for _ in range(num_frames // self.group):
+                    self.emit(small)
+                num_frames %= self.group
+                continue
+            take = min(num_frames, self.group - self.count)
+            if self.count == 0:
+                self.acc = small.astype(np.uint32) * take
+            else:
+                self.acc += small.astype(np.uint32) * take
+            self.count += take
+            num_frames -= take
+            if self.count == self.group:
+                self.emit(self.acc / self.group)
+                self.count = 0
+
+    def emit(self, frame: np.ndarray) -> None:
+        pixels = np.rint(frame).astype(np.uint8) if frame.dtype != np.uint8 else frame
+        av_frame = av.VideoFrame.from_ndarray(pixels, format="rgba")
+        for packet in self.stream.encode(av_frame):
+            self.container.mux(packet)
+
+
+class TieredFileWriter(PipelinedFileWriter):
+    """Pipelined writer that also feeds every frame to the preview tiers."""
+
+    tiers: tuple[str, ...] = ()
+
+    @classmethod
+    def with_tiers(cls, tiers, queue_size: int = 8) -> type[TieredFileWriter]:
+        return type(cls.__name__, (cls,), {"tiers": tuple(tiers), "queue_size": queue_size})
+
+    def __init__(self, renderer, scene_name, **kwargs):
+        super().__init__(renderer, scene_name, **kwargs)
+        if self.tiers and not config.disable_caching:
+            raise ValueError("preview tiers need every frame; render with disable_caching")
+        self.scene_name = str(scene_name)
+        self.tier_encoders: list[TierEncoder] = []
+
+    def tier_path(self, height: int, fps: int):
+        """Where ``manim -q...`` would put this scene at that height and rate."""
+        tier_config = config.copy()
+        tier_config.pixel_height = height
+        tier_config.frame_rate = fps
+        module_name = config.get_dir("input_file").stem if config["input_file"] else ""
+        tier_dir = tier_config.get_dir(
+            "video_dir", module_name=module_name, scene_name=self.scene_name
+        )
+        return guarantee_existence(tier_dir) / self.movie_file_path.name
+
+    def write_frame(self, frame_or_renderer, num_frames: int = 1):
+        super().write_frame(frame_or_renderer, num_frames)
+        if not self.tier_encoders and self.tiers:
+            for tier in self.tiers:
+                height, fps = parse_tier(tier)
+                path = self.tier_path(height, fps)
+                if path == self.movie_file_path:
+                    raise ValueError(f"tier {tier} is the master resolution")
+                self.tier_encoders.append(TierEncoder(path, height, fps, self.queue_size))
+        for encoder in self.tier_encoders:
+            encoder.put(frame_or_renderer, num_frames)
+
+    def finish(self) -> None:
+        super().finish()
+        for encoder in self.tier_encoders:
+            encoder.close()
+            logger.info("Tier ready at %(path)s", {"path": f"'{encoder.file_path}'"})
+        self.tier_encoders = []
@@ -0,0 +1,126 @@
+"""A JSON manifest of where every play and wait lands in the rendered clip.
+
+    python render.py cosmic_inflation_intro.py InflationGridIntro -q h    # writes it by default
+
+Next to ``InflationGridIntro.mp4`` (or ``.mov`` with ``-t``, or the PNG
+sequence) render.py writes ``InflationGridIntro.timing.json``:
+
+    {"scene": "InflationGridIntro", "resolution": [1920, 1080], "fps": 60,
+     "alpha": false, "frames": 912, "duration": 15.2,
+     "movie": ".../InflationGridIntro.mp4",
+     "plays": [{"index": 0, "kind": "play", "animations": ["Create(NumberPlane)"],
+                "section": "autocreated", "start_frame": 0, "end_frame": 90,
+                "start": 0.0, "end": 1.5, "cached": false,
+                "partial_movie": ".../partial_movie_files/.../1185818338_....mp4"}, ...]}
+
+Frame ranges are half open and times are ``frame / fps``, so an editor can
+place cuts from the manifest alone instead of probing the movie and its
+partial movies.  Plays served from the partial-movie cache are counted as
+manim would have rendered them; plays skipped with ``-n`` have an empty range
+and no partial movie, since they are not in the clip.
+"""
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+import numpy as np
+from manim import CairoRenderer, Wait, config, logger
+from manim.utils.file_ops import write_to_movie
+
+
+def expected_frames(scene) -> int:
+    """Frames manim writes for the play just compiled on ``scene``."""
+    dt = 1 / config.frame_rate
+    if scene.is_current_animation_frozen_frame():
+        return int(scene.duration / dt)  # CairoRenderer.freeze_current_frame
+    return len(np.arange(0, scene.duration, dt))  # one per Scene.get_time_progression step
+
+
+class ManifestRenderer(CairoRenderer):
+    """Records the frame range of every play and writes ``<Scene>.timing.json``.
+
+    Combine with another renderer through ``wrapping``.
+    """
+
+    @classmethod
+    def wrapping(cls, renderer_class) -> type:
+        return type(renderer_class.__name__, (cls, renderer_class), {})
+
+    def init_scene(self, scene) -> None:
+        super().init_scene(scene)
+        self.manifest_frames = 0  # frames in the clip so far
+        self.plays: list[dict] = []
+
+    def add_frame(self, frame, num_frames: int = 1):
+        if not self.skip_animations:
+            self.manifest_frames += num_frames
+        return super().add_frame(frame, num_frames)
+
+    def play(self, scene, *args, **kwargs):
+        before = self.manifest_frames
+        super().play(scene, *args, **kwargs)
+        index = self.num_plays - 1
+        partial = self.file_writer.partial_movie_files
+        partial = partial[index] if index < len(partial) else None
+        in_movie = self.animations_hashes[index] is not None
+        cached = in_movie and self.skip_animations
+        if cached:
+            self.manifest_frames = before + expected_frames(scene)
+        start, end = before, self.manifest_frames
+        fps = config.frame_rate
+        self.plays.append({
+            "index": index,
+            "kind": "wait" if all(isinstance(a, Wait) for a in scene.animations) else "play",
+            "animations": [str(a) for a in scene.animations],
+            "section": self.file_writer.sections[-1].name,
+            "start_frame": start,
+            "end_frame": end,
+            "start": round(start / fps, 6),
+            "end": round(end / fps, 6),
+            "cached": cached,
+            "partial_movie": str(partial) if partial and in_movie else None,
+        })
+
+    def scene_finished(self, scene) -> None:
+        super().scene_finished(scene)
+        path = self.manifest_path()
+        if path is None:
+            return
+        tmp = path.with_name(f".{path.name}")
+        tmp.write_text(json.dumps(self.manifest(scene), indent=2))
+        os.replace(tmp, path)  # tools watching the folder never read half a manifest
+        logger.info("Timing manifest written to %s", str(path))
+
+    # ---------- Manifest ----------
+    def output_path(self) -> Path | None:
+        writer = self.file_writer
+        if write_to_movie() and getattr(writer, "movie_file_path", None):
+            return Path(writer.movie_file_path)
+        if getattr(writer, "image_file_path", None):
+            return Path(writer.image_file_path)
+        return None
+
+    def manifest_path(self) -> Path | None:
+        output = self.output_path()
+        if output is None or config.dry_run:
+            return None
+        return output.with_name(f"{output.stem}.timing.json")
+
+    def manifest(self, scene) -> dict:
+        frames = self.manifest_frames
+        output = self.output_path()
+        movie = write_to_movie()
+        return {
+            "scene": type(scene).__name__,
+            "file": str(config.input_file),
+            "resolution": [config.pixel_width, config.pixel_height],
+            "fps": config.frame_rate,
+            "alpha": config.transparent,
+            "frames": frames,
+            "duration": round(frames / config.frame_rate, 6),
+            "movie": str(output) if output and movie else None,
+            "images": str(output) if output and not movie else None,
+            "plays": self.plays,
+        }
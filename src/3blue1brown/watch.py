@@ -0,0 +1,255 @@
+"""Re-render the scenes a save actually touched.
+
+    python watch.py -- -q l                      # every scene in this folder
+    python watch.py manim_showcase.py -- -q l --stable_hash
+
+Polls the ``.py`` files next to this one.  When a file is saved, its
+top-level definitions are compared with the previous version by AST (so
+comments, blank lines and formatting do not count), and a scene is rendered
+again only if its own class changed or it reaches a changed definition
+through the names it uses: module functions and constants, base classes, and
+``from helper import name`` across the modules of this folder.  Scenes are
+the classes deriving from a ``...Scene`` base, directly or through other
+scenes of the folder (``InflationGridIntro2`` subclasses the imported
+``InflationGridIntro``).  Editing ``ShowcaseGraphs`` re-renders that scene
+alone; editing ``assets.caption`` re-renders the scenes that use captions.
+Inside a re-rendered scene, unchanged ``self.play`` calls hit manim's
+partial-movie cache.
+
+Renders run in children forked from this process, which keeps manim, PyAV
+and the font list imported; the modules of this folder are imported afresh
+in every child.  Arguments after ``--`` go to render.py.
+"""
+from __future__ import annotations
+
+import argparse
+import ast
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from preview_server import in_child
+
+FOLDER = Path(__file__).resolve().parent
+BODY, ANY = "<body>", "<any>"  # module-level statements / anything in the module
+
+
+@dataclass
+class ModuleInfo:
+    """Top-level definitions of one module, as AST dumps and the names they read."""
+
+    symbols: dict[str, str] = field(default_factory=dict)
+    refs: dict[str, set[str]] = field(default_factory=dict)
+    imports: dict[str, tuple[str, str]] = field(default_factory=dict)  # alias -> (module, name)
+    star_imports: list[str] = field(default_factory=list)
+    scenes: list[str] = field(default_factory=list)
+    bases: dict[str, list[str]] = field(default_factory=dict)  # class -> base names
+
+
+def _names(node: ast.AST) -> set[str]:
+    return {n.id for n in ast.walk(node) if isinstance(n, ast.Name)}
+
+
+def _is_main_guard(node: ast.AST) -> bool:
+    return isinstance(node, ast.If) and "__name__" in _names(node.test)
+
+
+def parse_module(path: Path, local: set[str]) -> ModuleInfo:
+    info = ModuleInfo()
+    body = []
+    for node in ast.parse(path.read_text(), str(path)).body:
+        dump = ast.dump(node)
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            targets = [node.name]
+            if isinstance(node, ast.ClassDef):
+                info.bases[node.name] = bases = [ast.unparse(base) for base in node.bases]
+                if any(name.endswith("Scene") or name in info.scenes for name in bases):
+                    info.scenes.append(node.name)
+        elif isinstance(node, (ast.Assign, ast.AnnAssign, ast.AugAssign)):
+            assigned = node.targets if isinstance(node, ast.Assign) else [node.target]
+            targets = sorted(set().union(*map(_names, assigned)))
+        elif isinstance(node, (ast.Import, ast.ImportFrom)):
+            module = getattr(node, "module", None)
+            targets = []
+            for alias in node.names:
+                name = alias.asname or alias.name
+                if module in local and alias.name == "*":
+                    info.star_imports.append(module)
+                    continue
+                if module in local:
+                    info.imports[name] = (module, alias.name)
+                elif module is None and alias.name in local:
+                    info.imports[name] = (alias.name, ANY)
+                targets.append(name)
+        elif _is_main_guard(node) or (
+                isinstance(node, ast.Expr) and isinstance(node.value, ast.Constant)):
+            continue  # ``if __name__ == "__main__"``, docstrings
+        else:
+            body.append(dump)
+            continue
+        for name in targets:
+            info.symbols[name] = info.symbols.get(name, "") + dump
+            info.refs.setdefault(name, set()).update(_names(node) - {name})
+    info.symbols[BODY] = "".join(body)
+    return info
+
+
+def _is_scene(modules: dict[str, ModuleInfo], module: str, base: str) -> bool:
+    """Whether ``base``, as written in ``module``, names a scene of this folder."""
+    info = modules[module]
+    head, _, rest = base.partition(".")
+    if not rest and head in info.scenes:
+        return True
+    source = info.imports.get(head)
+    if source is not None:
+        other, name = source
+        name = rest if name == ANY else name if not rest else None
+        return other in modules and name in modules[other].scenes
+    return not rest and any(head in modules[star].scenes
+                            for star in info.star_imports if star in modules)
+
+
+def resolve_scenes(modules: dict[str, ModuleInfo]) -> None:
+    """Add subclasses of scenes imported from the other modules, until none is left."""
+    changed = True
+    while changed:
+        changed = False
+        for module, info in modules.items():
+            for name, bases in info.bases.items():
+                if name not in info.scenes and any(_is_scene(modules, module, b) for b in bases):
+                    info.scenes.append(name)
+                    changed = True
+
+
+def parse_folder(folder: Path = FOLDER, previous: dict[str, ModuleInfo] | None = None) -> dict[str, ModuleInfo]:
+    paths = {path.stem: path for path in folder.glob("*.py")}
+    modules = {}
+    for name, path in paths.items():
+        try:
+            modules[name] = parse_module(path, set(paths))
+        except SyntaxError as error:  # mid-edit; keep the last good version
+            print(f"{path.name}: {error}", file=sys.stderr)
+            if previous and name in previous:
+                modules[name] = previous[name]
+    resolve_scenes(modules)
+    return modules
+
+
+def changed_symbols(old: dict[str, ModuleInfo], new: dict[str, ModuleInfo]) -> set[tuple[str, str]]:
+    changed = set()
+    for module, info in new.items():
+        before = old.get(module, ModuleInfo())
+        for name in info.symbols.keys() | before.symbols.keys():
+            if info.symbols.get(name) != before.symbols.get(name):
+                changed.update({(module, name), (module, ANY)})
+    return changed
+
+
+def affected_scenes(old, new) -> list[tuple[str, str]]:
+    """(module, scene) pairs whose code or dependencies differ between snapshots."""
+    changed = changed_symbols(old, new)
+    memo: dict[tuple[str, str], bool] = {}
+
+    def dependencies(module: str, name: str):
+        info = new.get(module)
+        if info is None:
+            return
+        if name == ANY:
+            yield from ((module, symbol) for symbol in info.symbols)
+            return
+        yield module, BODY
+        for ref in info.refs.get(name, ()):
+            if ref in info.imports:
+                yield info.imports[ref]
+            elif ref in info.symbols:
+                yield module, ref
+            else:
+                yield from ((star, ref) for star in info.star_imports)
+
+    def affected(node) -> bool:
+        if node in changed:
+            return True
+        if node not in memo:
+            memo[node] = False  # cycles (recursive helpers) add nothing
+            memo[node] = any(affected(dep) for dep in dependencies(*node) if dep != node)
+        return memo[node]
+
+    return [(module, scene) for module, info in sorted(new.items())
+            for scene in info.scenes if affected((module, scene))]
+
+
+# ---------- Rendering ----------
+def render_in_child(argv: list[str]) -> str:
+    """Fresh imports of this folder's modules, then ``render.run(argv)``."""
+    for name, module in list(sys.modules.items()):
+        path = getattr(module, "__file__", None)
+        if path and Path(path).resolve().parent == FOLDER and name not in ("__main__", "__mp_main__"):
+            del sys.modules[name]
+    import render
+
+    writer = render.run(argv).renderer.file_writer
+    return str(getattr(writer, "movie_file_path", None) or writer.image_file_path)
+
+
+def render_scenes(scenes, render_args: list[str], workers: int) -> None:
+    def one(module: str, scene: str) -> None:
+        started = time.perf_counter()
+        try:
+            output = in_child(render_in_child, [str(FOLDER / f"{module}.py"), scene, *render_args])
+        except RuntimeError as error:
+            print(f"FAILED {module}.{scene}\n{error}", flush=True)
+            return
+        print(f"{module}.{scene}  {output}  ({time.perf_counter() - started:.1f}s)", flush=True)
+
+    with ThreadPoolExecutor(workers) as pool:
+        for module, scene in scenes:
+            pool.submit(one, module, scene)
+
+
+def snapshot(folder: Path = FOLDER) -> dict[Path, int]:
+    return {path: path.stat().st_mtime_ns for path in folder.glob("*.py")}
+
+
+def watch(files: list[str], render_args: list[str], workers: int = 2,
+          interval: float = 0.5) -> None:
+    from render_daemon import warm_up
+
+    warm_up()
+    wanted = {Path(f).stem for f in files}
+    stamps, modules = snapshot(), parse_folder()
+    count = sum(len(info.scenes) for name, info in modules.items() if not wanted or name in wanted)
+    print(f"watching {len(stamps)} modules, {count} scenes", flush=True)
+    while True:
+        time.sleep(interval)
+        current = snapshot()
+        if current == stamps:
+            continue
+        time.sleep(interval)  # let the editor finish writing
+        stamps, previous = snapshot(), modules
+        modules = parse_folder(previous=previous)
+        scenes = [(m, s) for m, s in affected_scenes(previous, modules) if not wanted or m in wanted]
+        if not scenes:
+            print("no scene affected", flush=True)
+            continue
+        print("re-rendering " + ", ".join(f"{m}.{s}" for m, s in scenes), flush=True)
+        render_scenes(scenes, render_args, workers)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__.splitlines()[0],
+        epilog="Arguments after -- are passed to render.py.",
+    )
+    parser.add_argument("files", nargs="*", help="only re-render scenes from these files")
+    parser.add_argument("-j", "--workers", type=int, default=2)
+    parser.add_argument("--interval", type=float, default=0.5, help="seconds between polls")
+    argv = sys.argv[1:]
+    render_args = argv[argv.index("--") + 1:] if "--" in argv else []
+    args = parser.parse_args(argv[:argv.index("--")] if "--" in argv else argv)
+    watch(args.files, render_args, args.workers, args.interval)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,17 @@
 # manim -pqh zoom_ladder_v2.py ZoomLadder_NoTex_V2
+# python render.py zoom_ladder.py ZoomLadder_NoTex_V2 -q h --layout_cache  # nested card layout
 from manim import *
 import math
 
+from flyweight import share_points
+from icon_cache import CachedIcon, IconCacheCamera
+from mobject_cache import disk_cached
+
 class ZoomLadder_NoTex_V2(MovingCameraScene):
+    # icons are drawn from cached sprites while the camera pans (icon_cache.py)
+    def __init__(self, camera_class=IconCacheCamera.wrapping(MovingCamera), **kwargs):
+        super().__init__(camera_class=camera_class, **kwargs)
+
     def construct(self):
         USE_GREENSCREEN = False
         USE_TRANSPARENT = True
@@ -23,13 +32,16 @@ class ZoomLadder_NoTex_V2(MovingCameraScene):
         CARD_ICON_H = 1.2
         CARD_SPACING = 3.0
 
-        # --- simple icons (kept small & consistent) ---
+        # --- simple icons (kept small & consistent, cached on disk) ---
+        @disk_cached
         def ic_nm():
             return RoundedRectangle(width=0.6, height=0.14, corner_radius=0.07,
                                     fill_opacity=1, fill_color=BLUE_E, stroke_width=0)
+        @disk_cached
         def ic_bact():
             c = Circle(radius=0.5, color=TEAL_B, fill_opacity=0.6, stroke_width=2)
             return VGroup(c, Dot(radius=0.06, color=WHITE).shift(LEFT*0.12+UP*0.05))
+        @disk_cached
         def ic_human():
             head = Circle(radius=0.16, color=WHITE, stroke_width=2)
             body = Line(ORIGIN, DOWN*0.8, stroke_width=2).next_to(head, DOWN, buff=0.02)
@@ -37,21 +49,25 @@ class ZoomLadder_NoTex_V2(MovingCameraScene):
             legs = VGroup(Line(ORIGIN, DOWN*0.45+LEFT*0.25, stroke_width=2),
                           Line(ORIGIN, DOWN*0.45+RIGHT*0.25, stroke_width=2)).next_to(body, DOWN, buff=0)
             return VGroup(head, body, arms, legs)
+        @disk_cached
         def ic_earth():
             g = Circle(radius=0.5, color=BLUE_B, fill_opacity=0.8)
             land = VGroup(Dot(radius=0.10, color=GREEN_B).shift(LEFT*0.12+UP*0.08),
                           Dot(radius=0.08, color=GREEN_B).shift(RIGHT*0.18+DOWN*0.05))
             return VGroup(g, land)
+        @disk_cached
         def ic_solar():
             sun = Dot(radius=0.10, color=YELLOW_B)
             orbs = VGroup(*[Circle(radius=r, color=GREY_B, stroke_opacity=0.6) for r in (0.45, 0.85, 1.2)])
             return VGroup(orbs, sun)
+        @disk_cached
         def ic_oort():
             core = Dot(radius=0.05, color=YELLOW_B)
             shell = Circle(radius=1.2, color=GREY_B, stroke_opacity=0.4)
             dots = VGroup(*[Dot(color=GREY_B, radius=0.02).move_to(shell.point_at_angle(a))
                             for a in [i*TAU/22 for i in range(22)]])
             return VGroup(shell, dots, core)
+        @disk_cached
         def ic_stars():
             a = RegularPolygon(5).scale(0.45).set_stroke(WHITE, 2)
             b = RegularPolygon(4).scale(0.3).set_stroke(WHITE, 2).shift(RIGHT*0.7+UP*0.25)
@@ -75,7 +91,7 @@ class ZoomLadder_NoTex_V2(MovingCameraScene):
         # --- build cards ---
         cards = VGroup()
         for name, size_txt, _m, factory in steps:
-            icon = factory()
+            icon = CachedIcon(factory())
             icon.set_height(CARD_ICON_H)
             cap = VGroup(
                 Text(name).scale(0.45),
@@ -84,6 +100,7 @@ class ZoomLadder_NoTex_V2(MovingCameraScene):
             cards.add(VGroup(icon, cap).arrange(DOWN, buff=0.22))
 
         cards.arrange(RIGHT, buff=CARD_SPACING).to_edge(DOWN, buff=1.1)
+        share_points(cards)  # .animate/FadeIn copies share the card outlines
 
         # --- continuous track behind ALL cards ---
         track_w = cards.get_width() + 2.0
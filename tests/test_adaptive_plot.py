@@ -0,0 +1,40 @@
+"""Partial drawing of adaptive graphs paces like ``axes.plot`` (src/3blue1brown/adaptive_plot.py)."""
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+pytest.importorskip("manim")
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src" / "3blue1brown"))
+
+from manim import Axes  # noqa: E402
+
+from adaptive_plot import plot_adaptive  # noqa: E402
+from cosmology import InflationThenLinear  # noqa: E402
+
+
+@pytest.fixture
+def graphs():
+    axes = Axes(x_range=[0, 6, 1], y_range=[0, 8, 1])
+    a_of_t = InflationThenLinear(a0=0.2, rate=1.5, t_end=2.0, slope=0.8)
+    return axes, plot_adaptive(axes, a_of_t, x_range=[0, 6]), axes.plot(a_of_t, x_range=[0, 6])
+
+
+def test_partial_graph_reaches_the_same_t(graphs):
+    axes, adaptive, plain = graphs
+    assert adaptive.get_num_curves() < plain.get_num_curves()
+    for alpha in (0.1, 1 / 3, 0.5, 0.9):
+        ends = []
+        for graph in (adaptive, plain):
+            partial = graph.copy().pointwise_become_partial(graph, 0, alpha)
+            ends.append(axes.point_to_coords(partial.points[-1])[0])
+        assert ends[0] == pytest.approx(ends[1], abs=1e-6)
+        assert ends[0] == pytest.approx(6 * alpha, abs=1e-6)
+
+
+def test_full_range_keeps_the_points(graphs):
+    _, adaptive, _ = graphs
+    whole = adaptive.copy().pointwise_become_partial(adaptive, 0, 1)
+    np.testing.assert_array_equal(whole.points, adaptive.points)
@@ -0,0 +1,102 @@
+"""Batched interpolation against manim's per-submobject code (src/3blue1brown/batched.py)."""
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+pytest.importorskip("manim")
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src" / "3blue1brown"))
+
+from manim import (  # noqa: E402
+    BLUE, RED, Animation, Circle, Dot, LaggedStart, Create, Square, Transform, VGroup,
+    linear, smooth, there_and_back,
+)
+
+from batched import BatchedTransform, FlatBatch, LaggedCreate, sub_alphas  # noqa: E402
+
+
+@pytest.mark.parametrize("lag_ratio", [0, 0.05, 0.3, 1])
+@pytest.mark.parametrize("rate_func", [linear, smooth, there_and_back])
+@pytest.mark.parametrize("reverse", [False, True])
+def test_sub_alphas_match_get_sub_alpha(lag_ratio, rate_func, reverse):
+    animation = Animation(Dot(), lag_ratio=lag_ratio, rate_func=rate_func,
+                          reverse_rate_function=reverse)
+    for alpha in np.linspace(0, 1, 11):
+        expected = [animation.get_sub_alpha(alpha, i, 7) for i in range(7)]
+        np.testing.assert_allclose(sub_alphas(animation, alpha, 7), expected, atol=1e-12)
+
+
+@pytest.mark.parametrize("reverse", [False, True])
+def test_clipped_sub_alphas_stay_in_range(reverse):
+    animation = Animation(Dot(), lag_ratio=0.3, rate_func=linear, reverse_rate_function=reverse)
+    for alpha in np.linspace(0, 1, 11):
+        local = [alpha * (6 * 0.3 + 1) - i * 0.3 for i in range(7)]
+        expected = [linear(1 - np.clip(x, 0, 1) if reverse else np.clip(x, 0, 1)) for x in local]
+        np.testing.assert_allclose(sub_alphas(animation, alpha, 7, clip=True), expected, atol=1e-12)
+
+
+def states():
+    start = [Circle(radius=0.5, color=BLUE).shift(i * 0.3 * np.array([1, 0, 0])) for i in range(4)]
+    end = [Square(0.8, color=RED, stroke_width=8).rotate(i) for i in range(4)]
+    for s, e in zip(start, end):
+        e.match_points(e.copy().insert_n_curves(len(s.points) // 4 - len(e.points) // 4))
+    return start, end
+
+
+def test_flat_batch_matches_mobject_interpolate():
+    start, end = states()
+    members = [s.copy() for s in start]
+    batch = FlatBatch(list(zip(members, start, end)))
+    alphas = np.array([0.0, 0.25, 0.6, 1.0])
+    batch.interpolate(alphas)
+    for mob, s, e, a in zip(members, start, end, alphas):
+        expected = s.copy().interpolate(s, e, a)
+        np.testing.assert_allclose(mob.points, expected.points, atol=1e-12)
+        np.testing.assert_allclose(mob.fill_rgbas, expected.fill_rgbas, atol=1e-12)
+        np.testing.assert_allclose(mob.stroke_rgbas, expected.stroke_rgbas, atol=1e-12)
+        assert mob.stroke_width == pytest.approx(expected.stroke_width)
+
+
+def test_flat_batch_release_unshares_members():
+    start, end = states()
+    members = [s.copy() for s in start]
+    batch = FlatBatch(list(zip(members, start, end)))
+    batch.interpolate(np.full(4, 0.5))
+    batch.release()
+    before = members[1].points.copy()
+    members[0].points[:] = 0
+    np.testing.assert_array_equal(members[1].points, before)
+    assert not np.shares_memory(members[0].points, batch.out)
+
+
+@pytest.mark.parametrize("lag_ratio", [0, 0.2])
+def test_batched_transform_matches_transform(lag_ratio):
+    start, end = states()
+    plain, batched = VGroup(*[s.copy() for s in start]), VGroup(*[s.copy() for s in start])
+    a = Transform(plain, VGroup(*end), lag_ratio=lag_ratio)
+    b = BatchedTransform(batched, VGroup(*[e.copy() for e in end]), lag_ratio=lag_ratio)
+    a.begin(), b.begin()
+    for alpha in (0.1, 0.5, 0.9):
+        a.interpolate(alpha), b.interpolate(alpha)
+        for p, q in zip(plain.family_members_with_points(), batched.family_members_with_points()):
+            np.testing.assert_allclose(q.points, p.points, atol=1e-9)
+    b.finish()
+
+
+@pytest.mark.parametrize("rate_func", [smooth, linear])
+def test_lagged_create_traces_the_same_curves(rate_func):
+    shapes = [Circle(radius=0.3 + 0.1 * i) for i in range(5)]
+    lagged = LaggedCreate(*[s.copy() for s in shapes], lag_ratio=0.2, rate_func=rate_func)
+    reference = LaggedStart(*[Create(s.copy(), rate_func=rate_func) for s in shapes], lag_ratio=0.2)
+    lagged.begin(), reference.begin()
+    for alpha in (0.0, 0.1, 0.3, 0.7, 1.0):
+        lagged.interpolate(alpha), reference.interpolate(alpha)
+        for mob, ref in zip(lagged.members, (a.mobject for a in reference.animations)):
+            drawn = mob.points.reshape(-1, 4, 3)
+            # the collapsed tail is zero-length curves at the pen position
+            moving = np.ptp(drawn, axis=1).max(axis=1) > 1e-12
+            expected = ref.points.reshape(-1, 4, 3)
+            expected = expected[np.ptp(expected, axis=1).max(axis=1) > 1e-12]
+            np.testing.assert_allclose(drawn[moving], expected, atol=1e-9)
@@ -0,0 +1,67 @@
+"""ScaleFactorTable against the exact models it tabulates (src/3blue1brown/cosmology.py)."""
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src" / "3blue1brown"))
+
+from cosmology import (  # noqa: E402
+    InflationThenLinear,
+    InflationThenPower,
+    LogRamp,
+    ScaleFactor,
+)
+
+# the models and ranges the scenes use
+CASES = [
+    (InflationThenPower(H=0.9, t_inf=5.0, k=0.5, p=0.6), 0.0, 10.0),
+    (InflationThenLinear(a0=0.2, rate=1.5, t_end=2.0, slope=0.8), 0.0, 6.0),
+    (LogRamp(0, 26), 0.0, 1.0),
+]
+IDS = [type(model).__name__ for model, _, _ in CASES]
+
+
+@pytest.mark.parametrize("model, t0, t1", CASES, ids=IDS)
+def test_table_matches_model_on_arrays(model, t0, t1):
+    table = model.table(t0, t1)
+    t = np.random.default_rng(0).uniform(t0, t1, 10_000)
+    np.testing.assert_allclose(table(t), model(t), rtol=1e-6)
+
+
+@pytest.mark.parametrize("model, t0, t1", CASES, ids=IDS)
+def test_scalar_and_array_paths_agree(model, t0, t1):
+    table = model.table(t0, t1)
+    t = np.linspace(t0, t1, 257)
+    scalars = [table(float(x)) for x in t]
+    np.testing.assert_allclose(scalars, table(t), rtol=1e-12)
+
+
+@pytest.mark.parametrize("model, t0, t1", CASES, ids=IDS)
+def test_kinks_and_out_of_range_use_the_model(model, t0, t1):
+    table = model.table(t0, t1, samples=64)  # coarse, so lerping would show
+    queries = [t0 - 0.5, t1 + 0.5, *model.kinks, *(k + table.step / 3 for k in model.kinks)]
+    for t in queries:
+        assert table(t) == pytest.approx(model(t), rel=1e-12)
+    np.testing.assert_allclose(table(np.array(queries)), model(np.array(queries)), rtol=1e-12)
+
+
+def test_exponential_phase_is_exact():
+    model = LogRamp(0, 26)
+    table = model.table(0.0, 1.0, samples=8)  # log a is linear: any sample count is exact
+    t = np.linspace(0.0, 1.0, 101)
+    np.testing.assert_allclose(table(t), model(t), rtol=1e-12)
+
+
+def test_scalar_call_returns_float():
+    assert isinstance(LogRamp(0, 1)(0.5), float)
+    assert isinstance(LogRamp(0, 1).table(0, 1)(0.5), float)
+
+
+def test_incomplete_model_fails_at_construction():
+    class Unfinished(ScaleFactor):
+        pass
+
+    with pytest.raises(TypeError):
+        Unfinished()
@@ -0,0 +1,34 @@
+"""Sampled frames of every scene against tests/golden (see src/3blue1brown/golden.py).
+
+Goldens are rendered from the baseline scene files (``golden.py --update
+--from_commit``) and committed; a scene without them is skipped, since
+goldens made from the code under test would only compare it with itself.
+"""
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("manim")
+
+SCENE_DIR = Path(__file__).resolve().parents[1] / "src" / "3blue1brown"
+sys.path.insert(0, str(SCENE_DIR))
+
+import golden  # noqa: E402
+
+SCENES = golden.discover_scenes()
+COMMITTED = [s for s in SCENES if any(golden.golden_dir(*s).glob("*.png"))]
+
+
+@pytest.fixture(scope="session")
+def results():
+    # one process pool for the whole package instead of one render per test
+    return golden.run_all(COMMITTED)
+
+
+@pytest.mark.parametrize("file, scene_name", SCENES, ids=[f"{f}::{s}" for f, s in SCENES])
+def test_sampled_frames_match_golden(request, file, scene_name):
+    if (file, scene_name) not in COMMITTED:
+        pytest.skip(f"no golden frames in {golden.golden_dir(file, scene_name)}; "
+                    f"run `python golden.py --update --from_commit <baseline> {file}` and commit them")
+    assert request.getfixturevalue("results")[file, scene_name] == []
@@ -0,0 +1,56 @@
+"""Cached boxes follow manim's in-place point writers (src/3blue1brown/layout_cache.py).
+
+The cache patches manim for the whole process, so the checks run in a child
+interpreter.
+"""
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("manim")
+
+SCENE_DIR = Path(__file__).resolve().parents[1] / "src" / "3blue1brown"
+
+SCRIPT = f"""
+import sys
+sys.path.insert(0, {str(SCENE_DIR)!r})
+import numpy as np
+from manim import RIGHT, UP, Circle, Group, Square, ValueTracker, VGroup, Wiggle
+from layout_cache import ORIGINAL, use_layout_cache
+
+use_layout_cache()
+uncached = ORIGINAL["get_critical_point"]
+
+def same_box(mob):
+    return all(np.allclose(mob.get_corner(d), uncached(mob, d)) for d in (UP + RIGHT, -UP - RIGHT))
+
+group = VGroup(Circle(), Square().shift(3 * RIGHT))
+group.get_width()
+group[0].pointwise_become_partial(Circle().shift(5 * UP), 0, 0.6)
+assert same_box(group), (group.get_top(), uncached(group, UP))
+
+tracker = ValueTracker(1)
+holder = Group(tracker)
+holder.get_center()
+tracker.set_value(5)
+assert np.isclose(holder.get_center()[0], 5), holder.get_center()
+
+squares = VGroup(Square(), Square().shift(2 * RIGHT))
+wiggle = Wiggle(squares)
+wiggle.begin()
+for alpha in np.linspace(0, 1, 7):
+    wiggle.interpolate(alpha)
+    assert same_box(squares)
+wiggle.finish()
+assert np.allclose(squares[0].get_center(), 0, atol=1e-9), squares[0].get_center()
+assert np.allclose(squares.get_center(), [1, 0, 0], atol=1e-9), squares.get_center()
+print("ok")
+"""
+
+
+def test_in_place_writers_drop_cached_boxes():
+    result = subprocess.run([sys.executable, "-c", SCRIPT], capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip().endswith("ok")
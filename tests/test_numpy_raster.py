@@ -0,0 +1,132 @@
+"""NumPy rasterization against Cairo, and its shape recognition (src/3blue1brown/numpy_raster.py)."""
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+pytest.importorskip("manim")
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src" / "3blue1brown"))
+
+from manim import (  # noqa: E402
+    BLUE, RIGHT, UP, YELLOW, Camera, Circle, Dot, Line, NumberPlane, Polygon, Rectangle,
+    Square, VGroup, VMobject, tempconfig,
+)
+
+from numpy_raster import NumpyRasterCamera, circles, rects, segments  # noqa: E402
+
+EDGE_LEVELS = 32  # anti-aliased edges: analytic area vs. Cairo's sampling
+MEAN_LEVELS = 0.5
+
+
+# ---------- Against Cairo ----------
+def dot_lattice():
+    return VGroup(*[Dot([x + 0.013, y - 0.021, 0], radius=0.04)
+                    for x in np.arange(-6.5, 6.6, 0.5) for y in np.arange(-3.5, 3.6, 0.5)])
+
+
+def rectangles():
+    return VGroup(
+        Rectangle(width=3.1, height=1.7, stroke_width=0, fill_color=BLUE, fill_opacity=0.6).shift(3 * RIGHT),
+        Rectangle(width=2.3, height=2.9, stroke_width=6, color=YELLOW).shift(3 * RIGHT + UP),
+        Square(1.37, stroke_width=3, fill_opacity=1, fill_color=BLUE).shift(4 * RIGHT + 2 * UP),
+    )
+
+
+def half_circle():
+    circle = Circle(radius=1.3)
+    return circle.copy().pointwise_become_partial(circle, 0, 0.5).shift(2 * UP)
+
+
+SCENES = {
+    "dot_lattice": dot_lattice,
+    "number_plane": NumberPlane,
+    "rectangles": rectangles,
+    "half_circle": half_circle,
+}
+
+
+def render(camera_class, mobject):
+    with tempconfig({"pixel_width": 480, "pixel_height": 270}):
+        camera = camera_class()
+        camera.capture_mobjects([mobject])
+        return camera, camera.pixel_array.copy()
+
+
+@pytest.mark.parametrize("build", SCENES.values(), ids=SCENES)
+def test_frames_match_cairo(build):
+    pytest.importorskip("cairo")
+    mobject = build()
+    _, expected = render(Camera, mobject)
+    camera, frame = render(NumpyRasterCamera, mobject)
+    assert expected.any()
+    diff = np.abs(frame.astype(int) - expected)
+    assert diff.max() <= EDGE_LEVELS
+    assert diff.mean() <= MEAN_LEVELS
+    if build is not half_circle:  # not a whole circle: Cairo draws it
+        assert camera.raster_counts["numpy"] > 0
+
+
+# ---------- Recognition ----------
+def curves(*mobjects, scale=40.0):
+    """Pixel-space (G, m, 4, 2) curves, as NumpyRasterCamera.plan builds them."""
+    return np.stack([m.points[:, :2] * scale for m in mobjects]).reshape(len(mobjects), -1, 4, 2)
+
+
+def partial(mobject, b):
+    return mobject.copy().pointwise_become_partial(mobject, 0, b)
+
+
+def test_circles_recognizes_dots_and_circles():
+    valid, center, radius = circles(curves(Dot([1, 2, 0], radius=0.1), Circle(radius=2).shift(RIGHT)))
+    assert valid.all()
+    np.testing.assert_allclose(center, [[40, 80], [40, 0]], atol=1e-6)
+    np.testing.assert_allclose(radius, [4, 80], rtol=1e-3)
+
+
+def test_circles_rejects_ellipses_partials_and_squares():
+    circle = Circle(radius=1)
+    squashed = circle.copy().stretch(1.2, 0)
+    square = Square(2).insert_n_curves(4)  # same point count as a Circle
+    valid, _, _ = circles(curves(squashed, partial(circle, 0.999), square))
+    assert not valid.any()
+
+
+def test_rects_recognizes_upright_rectangles():
+    valid, low, high = rects(curves(Rectangle(width=2, height=1).shift(RIGHT)))
+    assert valid.all()
+    np.testing.assert_allclose(low, [[0, -20]], atol=1e-6)
+    np.testing.assert_allclose(high, [[80, 20]], atol=1e-6)
+
+
+def test_rects_rejects_rotated_bent_open_and_other_polygons():
+    square = Square(2)
+    bent = square.copy()
+    bent.points[1] += [0.3, 0.3, 0]  # a handle off the edge
+    shapes = [
+        square.copy().rotate(0.3),
+        bent,
+        partial(square, 0.75),  # three edges
+        Polygon([0, 0, 0], [2, 0, 0], [2, 1, 0], [1, 2, 0]).insert_n_curves(0),
+    ]
+    for shape in shapes:
+        valid, _, _ = rects(curves(shape))
+        assert not valid.any()
+
+
+def test_segments_recognizes_lines():
+    valid, start, direction, length = segments(curves(Line([0, 0, 0], [3, 4, 0])))
+    assert valid.all()
+    np.testing.assert_allclose(start, [[0, 0]], atol=1e-9)
+    np.testing.assert_allclose(direction, [[0.6, 0.8]], atol=1e-9)
+    np.testing.assert_allclose(length, [200], atol=1e-9)
+
+
+def test_segments_rejects_bends_backtracking_and_closed_paths():
+    bend, back, closed = VMobject(), VMobject(), VMobject()
+    bend.set_points_as_corners([[0, 0, 0], [1, 0, 0], [2, 0.5, 0]])
+    back.set_points_as_corners([[0, 0, 0], [2, 0, 0], [1, 0, 0]])
+    closed.set_points_as_corners([[0, 0, 0], [1, 0, 0], [0, 0, 0]])
+    valid, *_ = segments(curves(bend, back, closed))
+    assert not valid.any()
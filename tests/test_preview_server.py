@@ -0,0 +1,103 @@
+"""FrameCache LRU eviction and re-rendering evicted frames (src/3blue1brown/preview_server.py)."""
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src" / "3blue1brown"))
+
+from preview_server import FrameCache, PreviewServer  # noqa: E402
+
+
+def write(cache: FrameCache, version: str, index: int, size: int = 100) -> Path:
+    path = cache.path(version, index)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(bytes([index % 256]) * size)
+    cache.add_file(path)
+    return path
+
+
+def test_missing_frame_is_none(tmp_path):
+    cache = FrameCache(tmp_path, memory_bytes=1000, disk_bytes=1000)
+    assert cache.get("v1", 0) is None
+    assert ("v1", 0) not in cache
+
+
+def test_disk_evicts_least_recently_used(tmp_path):
+    cache = FrameCache(tmp_path, memory_bytes=0, disk_bytes=250)
+    first, second = write(cache, "v1", 0), write(cache, "v1", 1)
+    assert cache.get("v1", 0) == bytes([0]) * 100  # now the most recent
+    write(cache, "v1", 2)
+    assert first.exists() and not second.exists()
+    assert ("v1", 1) not in cache and cache.get("v1", 1) is None
+    assert cache.disk_used == 200
+
+
+def test_memory_keeps_recent_frames_and_disk_keeps_the_rest(tmp_path):
+    cache = FrameCache(tmp_path, memory_bytes=150, disk_bytes=1000)
+    write(cache, "v1", 0), write(cache, "v1", 1)
+    cache.get("v1", 0), cache.get("v1", 1)
+    assert list(cache.memory) == [("v1", 1)] and cache.memory_used == 100
+    assert cache.get("v1", 0) == bytes([0]) * 100  # reloaded from disk
+
+
+def test_rewritten_frame_is_counted_once(tmp_path):
+    cache = FrameCache(tmp_path, memory_bytes=0, disk_bytes=1000)
+    write(cache, "v1", 0, size=100)
+    write(cache, "v1", 0, size=40)
+    assert cache.disk_used == 40 and len(cache.disk) == 1
+
+
+def test_file_removed_behind_the_cache(tmp_path):
+    cache = FrameCache(tmp_path, memory_bytes=0, disk_bytes=1000)
+    write(cache, "v1", 0).unlink()
+    assert cache.get("v1", 0) is None
+    assert cache.disk_used == 0 and ("v1", 0) not in cache
+
+
+def test_restart_registers_earlier_frames_oldest_first(tmp_path):
+    cache = FrameCache(tmp_path, memory_bytes=0, disk_bytes=1000)
+    paths = [write(cache, "v1", i) for i in range(3)]
+    for age, path in zip((30, 10, 20), paths):
+        os.utime(path, (1_000_000 - age, 1_000_000 - age))
+    reopened = FrameCache(tmp_path, memory_bytes=0, disk_bytes=250)
+    assert list(reopened.disk) == [paths[2], paths[1]]
+    assert not paths[0].exists()
+
+
+class FakeRenders(PreviewServer):
+    """Writes 10-byte frames instead of rendering the scene."""
+
+    def render_duration(self, version: str) -> float:
+        return 10.0
+
+    def render_window(self, version: str, window: int) -> None:
+        self.rendered.append(window)
+        for index in range(window * self.window, (window + 1) * self.window):
+            if (version, index) not in self.cache:
+                write(self.cache, version, index, size=10)
+
+
+def settle(server, timeout: float = 10.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not server.queue.empty() or server.running:
+        assert time.monotonic() < deadline, "preview jobs did not finish"
+        time.sleep(0.01)
+
+
+def test_evicted_frame_renders_again(tmp_path):
+    scene = tmp_path / "scene.py"
+    scene.write_text("")
+    server = FakeRenders(scene, "Scene", port=0, fps=2, window=1.0, prefetch=0, workers=1,
+                         memory_mb=0, disk_mb=0, media_dir=str(tmp_path / "media"))
+    try:
+        server.rendered = []
+        server.cache.disk_bytes = 20  # two frames: one window
+        assert server.frame(0.0) == bytes([0]) * 10
+        server.frame(2.0)  # window 2, then window 1 behind it; window 0 leaves the disk
+        settle(server)
+        assert (server.version(), 1) not in server.cache and 0 in server.rendered
+        assert server.frame(0.5) == bytes([1]) * 10
+        assert server.rendered.count(0) == 2
+    finally:
+        server.server_close()
@@ -0,0 +1,43 @@
+"""Requests the render daemon refuses (src/3blue1brown/render_daemon.py)."""
+import os
+import stat
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src" / "3blue1brown"))
+
+import render_daemon  # noqa: E402
+from render_daemon import REPO, refusal, write_token  # noqa: E402
+
+
+@pytest.fixture
+def token(tmp_path, monkeypatch):
+    monkeypatch.setattr(render_daemon, "token_path", lambda port: tmp_path / f"{port}.token")
+    return write_token(1234)
+
+
+def test_token_file_is_private_and_fresh(tmp_path, token):
+    path = tmp_path / "1234.token"
+    assert path.read_text() == token
+    if os.name == "posix":
+        assert stat.S_IMODE(path.stat().st_mode) == 0o600
+    assert write_token(1234) != token
+
+
+def test_request_with_token_inside_the_repo_runs(token):
+    assert refusal({"argv": [], "cwd": str(REPO / "src"), "token": token}, token) is None
+
+
+@pytest.mark.parametrize("sent", [None, "", "0" * 32, "é"])
+def test_missing_or_wrong_token_is_refused(token, sent):
+    request = {"argv": [], "cwd": str(REPO)}
+    if sent is not None:
+        request["token"] = sent
+    assert refusal(request, token) == "bad token"
+
+
+def test_cwd_outside_the_repo_is_refused(tmp_path, token):
+    for cwd in (tmp_path, REPO / ".."):
+        assert "outside" in refusal({"argv": [], "cwd": str(cwd), "token": token}, token)
@@ -0,0 +1,127 @@
+"""PlayHasher digests are stable for equal content and change with any edit (src/3blue1brown/scene_hash.py)."""
+import subprocess
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+pytest.importorskip("manim")
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src" / "3blue1brown"))
+
+from manim import BLUE, Circle, Square, ValueTracker, VGroup, always_redraw  # noqa: E402
+
+from scene_hash import PlayHasher  # noqa: E402
+
+
+def digest(obj) -> str:
+    return PlayHasher().hexdigest(obj)
+
+
+def group(shift=0.0, color=BLUE):
+    return VGroup(Circle(color=color), Square().shift([shift, 0, 0]))
+
+
+def test_equal_content_equal_digest():
+    assert digest([group()]) == digest([group()])
+
+
+def test_repeated_hashing_is_stable():
+    mobjects = [group()]
+    hasher = PlayHasher()
+    assert hasher.hexdigest(mobjects) == hasher.hexdigest(mobjects) == digest(mobjects)
+
+
+def test_tiny_point_edits_change_the_digest():
+    # manim's JSON hash keeps 8 digits and truncates arrays past 1000 entries
+    assert digest([group()]) != digest([group(shift=1e-12)])
+    big = np.zeros(5000)
+    edited = big.copy()
+    edited[4321] = 1e-9
+    assert digest(big) != digest(edited)
+
+
+def test_style_edit_changes_the_digest():
+    assert digest([group()]) != digest([group(color="#123456")])
+
+
+def make_redraw(tracker, factor):
+    return always_redraw(lambda: Circle(radius=tracker.get_value() * factor))
+
+
+def test_recreated_closure_hits_and_captured_values_miss():
+    tracker = ValueTracker(1.0)
+    first = digest([make_redraw(tracker, 2.0)])
+    assert digest([make_redraw(tracker, 2.0)]) == first
+    assert digest([make_redraw(tracker, 3.0)]) != first
+    tracker.set_value(1.5)
+    assert digest([make_redraw(tracker, 2.0)]) != first
+
+
+def test_edited_lambda_source_misses():
+    tracker = ValueTracker(1.0)
+    a = always_redraw(lambda: Circle(radius=tracker.get_value()))
+    b = always_redraw(lambda: Circle(radius=tracker.get_value() + 0))
+    assert digest([a]) != digest([b])
+
+
+def test_self_referencing_updater_terminates():
+    circle = Circle()
+    circle.add_updater(lambda m: m.move_to(circle.get_center()))
+    assert digest([circle]) == digest([circle])
+
+
+def test_layout_cache_state_is_ignored():
+    a, b = group(), group()
+    b._layout = object()
+    assert digest([a]) == digest([b])
+
+
+def test_sets_are_order_independent():
+    assert digest({"a", "b", "c", 1, 2.5}) == digest({2.5, "c", 1, "b", "a"})
+
+
+# use_stable_hashing() patches manim for the whole process: check it in a child
+KEPT_DIGESTS = f"""
+import subprocess
+import sys
+sys.path.insert(0, {str(Path(__file__).resolve().parents[1] / "src" / "3blue1brown")!r})
+from manim import BLUE, RIGHT, Circle, Square, ValueTracker, VGroup, Wiggle
+from scene_hash import PlayHasher, forget_digest, use_stable_hashing
+
+use_stable_hashing()
+circle, tracker = Circle(), ValueTracker(1)
+squares = VGroup(Square(), Square().shift(2 * RIGHT))
+mobjects = [circle, tracker, squares]
+
+def fresh():
+    forget_digest(*[m for mob in mobjects for m in mob.get_family()])
+    return PlayHasher().hexdigest(mobjects)
+
+kept = PlayHasher().hexdigest(mobjects)
+assert "_digest" in circle.__dict__
+assert PlayHasher().hexdigest(mobjects) == kept == fresh()
+
+wiggle = Wiggle(squares)
+wiggle.begin()
+edits = [
+    lambda: circle.shift(RIGHT),
+    lambda: circle.set_fill(BLUE, 0.5),
+    lambda: circle.set_stroke(width=8),
+    lambda: circle.pointwise_become_partial(Circle(), 0, 0.5),
+    lambda: tracker.set_value(3),
+    lambda: wiggle.interpolate(0.3),
+]
+for i, edit in enumerate(edits):
+    PlayHasher().hexdigest(mobjects)
+    edit()
+    assert PlayHasher().hexdigest(mobjects) == fresh(), i
+print("ok")
+"""
+
+
+def test_kept_array_digests_follow_manim_writers():
+    result = subprocess.run([sys.executable, "-c", KEPT_DIGESTS], capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip().endswith("ok")
@@ -0,0 +1,51 @@
+"""Cache-hit Text lays out like a fresh one with the layout cache on (src/3blue1brown/text_cache.py).
+
+Both caches patch manim for the whole process, so the checks run in a child
+interpreter.
+"""
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("manim")
+
+SCENE_DIR = Path(__file__).resolve().parents[1] / "src" / "3blue1brown"
+
+SCRIPT = f"""
+import sys
+sys.path.insert(0, {str(SCENE_DIR)!r})
+import numpy as np
+from manim import DOWN, LEFT, ORIGIN, UP, Text
+from layout_cache import use_layout_cache
+from text_cache import STATS, use_text_cache
+
+use_layout_cache()
+use_text_cache()
+
+def extent(mob, dim, pick):
+    return pick(pick(m.points[:, dim]) for m in mob.family_members_with_points())
+
+fresh = Text("a = 1.00")
+label = Text("a = 1.00")
+assert STATS["hits"] == 1, dict(STATS)
+assert label.submobjects and all(g is not f for g, f in zip(label, fresh))
+
+label.scale(2).next_to(ORIGIN, DOWN, buff=0)
+assert abs(extent(label, 1, max)) < 1e-9, extent(label, 1, max)
+assert abs(label.get_top()[1]) < 1e-9, label.get_top()
+
+label.shift(UP)
+label[0].shift(3 * LEFT)  # a glyph moved on its own reaches the parent's box
+assert abs(label.get_left()[0] - extent(label, 0, min)) < 1e-9
+assert abs(label.get_top()[1] - extent(label, 1, max)) < 1e-9
+assert np.allclose(fresh.get_center(), Text("a = 1.00").get_center())
+print("ok")
+"""
+
+
+def test_cache_hit_text_keeps_layout_in_sync():
+    result = subprocess.run([sys.executable, "-c", SCRIPT], capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip().endswith("ok")
@@ -0,0 +1,78 @@
+"""Frame ranges in the timing manifest (src/3blue1brown/timing_manifest.py)."""
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("manim")
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src" / "3blue1brown"))
+
+from render import render_scene  # noqa: E402
+from timing_manifest import ManifestRenderer, expected_frames  # noqa: E402
+
+SCENE = """
+from manim import RIGHT, UP, Create, Scene, Square
+
+
+class Timed(Scene):
+    def construct(self):
+        square = Square()
+        self.play(Create(square), run_time=0.5)
+        self.wait(0.25)  # frozen frame
+        self.play(square.animate.shift(RIGHT), run_time=1 / 3)
+        square.add_updater(lambda m, dt: m.shift(dt * UP))
+        self.wait(0.4)  # updaters keep it moving
+"""
+
+
+class CheckedRenderer(ManifestRenderer):
+    """Keeps ``expected_frames`` next to the frames each play really added."""
+
+    def init_scene(self, scene) -> None:
+        super().init_scene(scene)
+        self.checked = []
+
+    def play(self, scene, *args, **kwargs):
+        before = self.manifest_frames
+        super().play(scene, *args, **kwargs)
+        self.checked.append((expected_frames(scene), self.manifest_frames - before))
+
+    def scene_finished(self, scene) -> None:
+        super().scene_finished(scene)
+        self.written = self.manifest(scene)  # while the render's config is in force
+
+
+def render(tmp_path, **overrides):
+    file = tmp_path / "timed.py"
+    file.write_text(textwrap.dedent(SCENE))
+    scene = render_scene(file, "Timed", "l", str(tmp_path / "media"), renderer_class=CheckedRenderer,
+                         write_to_movie=False, disable_caching=True, **overrides)
+    return scene.renderer, scene.renderer.written
+
+
+def test_expected_frames_match_the_frames_written(tmp_path):
+    renderer, _ = render(tmp_path)
+    assert len(renderer.checked) == 4
+    for expected, written in renderer.checked:
+        assert expected == written
+
+
+def test_play_ranges_tile_the_clip(tmp_path):
+    _, manifest = render(tmp_path)
+    plays = manifest["plays"]
+    assert [p["kind"] for p in plays] == ["play", "wait", "play", "wait"]
+    assert plays[0]["start_frame"] == 0
+    for before, after in zip(plays, plays[1:]):
+        assert before["end_frame"] == after["start_frame"]
+    assert plays[-1]["end_frame"] == manifest["frames"]
+    fps = manifest["fps"]
+    assert all(p["end"] == pytest.approx(p["end_frame"] / fps) for p in plays)
+
+
+def test_skipped_plays_have_empty_ranges(tmp_path):
+    _, manifest = render(tmp_path, from_animation_number=2)
+    plays = manifest["plays"]
+    assert [p["end_frame"] - p["start_frame"] == 0 for p in plays] == [True, True, False, False]
+    assert plays[2]["start_frame"] == 0
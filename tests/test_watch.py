@@ -0,0 +1,117 @@
+"""Which scenes a save re-renders (src/3blue1brown/watch.py)."""
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("manim")
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src" / "3blue1brown"))
+
+from watch import affected_scenes, changed_symbols, parse_folder  # noqa: E402
+
+HELPERS = """
+RADIUS = 1.0
+
+def caption(text):
+    return text.upper()
+
+def spiral(n):
+    return spiral(n - 1) if n else RADIUS
+"""
+
+SCENES = """
+from manim import Scene
+from helpers import caption
+
+SCALE = 2
+
+def grid():
+    return SCALE
+
+class Captioned(Scene):
+    def construct(self):
+        caption("a")
+
+class Gridded(Scene):
+    def construct(self):
+        grid()
+"""
+
+STARRED = """
+from manim import Scene
+from helpers import *
+
+class Spiral(Scene):
+    def construct(self):
+        spiral(3)
+"""
+
+SUBCLASSED = """
+from scenes import Captioned
+
+class Recaptioned(Captioned):
+    pass
+
+class Again(Recaptioned):
+    pass
+"""
+
+
+def snapshot(folder: Path, **sources):
+    for name, source in sources.items():
+        (folder / f"{name}.py").write_text(textwrap.dedent(source))
+    return parse_folder(folder)
+
+
+@pytest.fixture
+def before(tmp_path):
+    return snapshot(tmp_path, helpers=HELPERS, scenes=SCENES, starred=STARRED, subclassed=SUBCLASSED)
+
+
+def after(tmp_path, before, **sources):
+    return affected_scenes(before, snapshot(tmp_path, **sources))
+
+
+def test_formatting_and_comments_change_nothing(tmp_path, before):
+    edited = SCENES.replace("SCALE = 2", "SCALE = 2  # grid spacing\n\n")
+    assert after(tmp_path, before, scenes=edited) == []
+
+
+def test_editing_a_scene_renders_it_and_its_subclasses(tmp_path, before):
+    edited = SCENES.replace('caption("a")', 'caption("b")')
+    assert sorted(after(tmp_path, before, scenes=edited)) == [
+        ("scenes", "Captioned"), ("subclassed", "Again"), ("subclassed", "Recaptioned")]
+
+
+def test_subclasses_of_imported_scenes_are_scenes(before):
+    assert sorted(before["subclassed"].scenes) == ["Again", "Recaptioned"]
+
+
+def test_module_constant_reaches_scenes_through_functions(tmp_path, before):
+    edited = SCENES.replace("SCALE = 2", "SCALE = 3")
+    assert after(tmp_path, before, scenes=edited) == [("scenes", "Gridded")]
+
+
+def test_imported_helper_reaches_importing_scenes(tmp_path, before):
+    edited = HELPERS.replace("upper", "lower")
+    assert sorted(after(tmp_path, before, helpers=edited)) == [
+        ("scenes", "Captioned"), ("subclassed", "Again"), ("subclassed", "Recaptioned")]
+
+
+def test_star_import_and_recursive_helper(tmp_path, before):
+    edited = HELPERS.replace("RADIUS = 1.0", "RADIUS = 0.5")
+    assert after(tmp_path, before, helpers=edited) == [("starred", "Spiral")]
+
+
+def test_changed_symbols_marks_the_module(tmp_path, before):
+    new = snapshot(tmp_path, scenes=SCENES.replace("SCALE = 2", "SCALE = 3"))
+    assert changed_symbols(before, new) == {("scenes", "SCALE"), ("scenes", "<any>")}
+
+
+def test_syntax_error_keeps_the_last_good_version(tmp_path, before):
+    (tmp_path / "scenes.py").write_text("class Broken(:\n")
+    modules = parse_folder(tmp_path, previous=before)
+    assert modules["scenes"] is before["scenes"]
+    assert affected_scenes(before, modules) == []